@@ -0,0 +1,187 @@
+import heapq
+import itertools
+
+import gi
+gi.require_version('Graphene', '1.0')
+from gi.repository import GLib, Graphene
+
+from faugus.texture_cache import load_texture, peek_texture
+from faugus.utils import run_in_background, widget_scale
+
+MAX_ACTIVE = 4
+MAX_OFFSCREEN_ACTIVE = 1
+OFFSCREEN = float("inf")
+
+
+class ArtworkTicket:
+    __slots__ = ("target", "job", "on_ready", "order", "cancelled", "future")
+
+    def __init__(self, target, job, on_ready, order):
+        self.target = target
+        self.job = job
+        self.on_ready = on_ready
+        self.order = order
+        self.cancelled = False
+        self.future = None
+
+
+class ArtworkLoader:
+    def __init__(self, max_active=MAX_ACTIVE):
+        self.max_active = max_active
+        self._pending = set()
+        self._queue = []
+        self._unranked = []
+        self._order = itertools.count()
+        self._active = 0
+        self._viewport = None
+        self._dirty = False
+        self._dispatch_source = None
+        self._dispatch_priority = None
+
+    def __len__(self):
+        return len(self._pending)
+
+    def set_viewport(self, scrolled_window):
+        self._viewport = scrolled_window
+        adjustment = scrolled_window.get_vadjustment()
+        adjustment.connect("value-changed", lambda *args: self.reprioritize())
+        adjustment.connect("changed", lambda *args: self.reprioritize())
+
+    def _viewport_height(self):
+        return self._viewport.get_height() if self._viewport is not None else 0
+
+    def _priority(self, target):
+        if self._viewport is None:
+            return 0
+        if not target.get_mapped():
+            return OFFSCREEN
+        ok, point = target.compute_point(self._viewport, Graphene.Point().init(0, 0))
+        if not ok:
+            return OFFSCREEN
+        top = point.y
+        bottom = top + target.get_height()
+        if bottom < 0:
+            return -bottom
+        height = self._viewport_height()
+        if top > height:
+            return top - height
+        return 0
+
+    def _schedule(self, priority=GLib.PRIORITY_DEFAULT_IDLE):
+        if self._dispatch_source is not None:
+            if self._dispatch_priority <= priority:
+                return
+            GLib.source_remove(self._dispatch_source)
+        self._dispatch_priority = priority
+        self._dispatch_source = GLib.idle_add(self._dispatch, priority=priority)
+
+    def reprioritize(self):
+        if self._queue:
+            self._dirty = True
+            self._schedule()
+
+    def _rank(self):
+        if self._dirty:
+            self._dirty = False
+            tickets = [entry[2] for entry in self._queue] + self._unranked
+            self._queue = []
+        else:
+            tickets = self._unranked
+        self._unranked = []
+        for ticket in tickets:
+            if not ticket.cancelled:
+                self._queue.append((self._priority(ticket.target), ticket.order, ticket))
+        heapq.heapify(self._queue)
+
+    def _dispatch(self):
+        offscreen = self._dispatch_priority == GLib.PRIORITY_LOW
+        self._dispatch_source = None
+        self._rank()
+
+        near = self._viewport_height()
+        while self._queue and self._active < self.max_active:
+            priority, _, ticket = self._queue[0]
+            if ticket.cancelled:
+                heapq.heappop(self._queue)
+                continue
+            if priority > near and not (offscreen and self._active < MAX_OFFSCREEN_ACTIVE):
+                break
+            heapq.heappop(self._queue)
+            self._start(ticket)
+
+        if self._queue and self._active < MAX_OFFSCREEN_ACTIVE:
+            self._schedule(GLib.PRIORITY_LOW)
+        return False
+
+    def _start(self, ticket):
+        self._active += 1
+
+        def work():
+            texture = None
+            try:
+                if not ticket.cancelled:
+                    texture = ticket.job()
+            except (GLib.Error, OSError) as e:
+                print(f"Faugus Launcher: failed to load artwork ({e})")
+            except Exception as e:
+                print(f"Faugus Launcher: unexpected error loading artwork ({e!r})")
+            finally:
+                GLib.idle_add(self._deliver, ticket, texture)
+
+        ticket.future = run_in_background(work)
+
+    def _deliver(self, ticket, texture):
+        self._active -= 1
+        target = ticket.target
+        if not ticket.cancelled and getattr(target, "artwork_ticket", None) is ticket:
+            self._finish(ticket)
+            if texture is not None:
+                ticket.on_ready(texture)
+        if self._queue or self._unranked:
+            self._schedule()
+        return False
+
+    def _finish(self, ticket):
+        self._pending.discard(ticket)
+        if getattr(ticket.target, "artwork_ticket", None) is ticket:
+            ticket.target.artwork_ticket = None
+
+    def _cancel(self, ticket):
+        ticket.cancelled = True
+        if ticket.future is not None and ticket.future.cancel():
+            self._active -= 1
+
+    def cancel(self, target):
+        ticket = getattr(target, "artwork_ticket", None)
+        if ticket is None:
+            return
+        self._cancel(ticket)
+        self._finish(ticket)
+
+    def cancel_all(self):
+        for ticket in list(self._pending):
+            self._cancel(ticket)
+            self._finish(ticket)
+        self._queue = []
+        self._unranked = []
+
+    def request(self, target, path, width, height, on_ready, placeholder=None):
+        self.cancel(target)
+
+        scale = widget_scale(target)
+        texture = peek_texture(path, width, height, scale)
+        if texture is not None:
+            on_ready(texture)
+            return
+
+        if placeholder is not None:
+            target.set_paintable(placeholder())
+
+        def job():
+            return load_texture(path, width, height, scale)
+
+        ticket = ArtworkTicket(target, job, on_ready, next(self._order))
+        target.artwork_ticket = ticket
+        self._pending.add(ticket)
+        self._unranked.append(ticket)
+        self._schedule()
@@ -12,6 +12,7 @@ warnings.filterwarnings('ignore', category=DeprecationWarning)
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk
 from faugus.language_config import *
+from faugus.game_repository import get_game_repository
 from faugus.utils import on_entry_changed, on_entry_query_tooltip, load_red_entry_css, load_frame_css, hide_dialog_action_area, IdComboBox, new_file_chooser, destroy_and_release, set_file_chooser_start_folder, load_json_file, save_json_file, build_bottom_button_box, expand_path
 
 
@@ -28,6 +29,11 @@ def perform_backup(dest_path):
     temp_dir = os.path.join(FAUGUS_TEMP, "temp-backup")
     os.makedirs(temp_dir, exist_ok=True)
 
+    repository = get_game_repository()
+    if repository.backend == "sqlite":
+        from faugus.library_db import export_json
+        export_json(repository)
+
     for item, src in BACKUP_ITEMS.items():
         dst = os.path.join(temp_dir, item)
         if os.path.isdir(src):
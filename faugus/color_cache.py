@@ -0,0 +1,134 @@
+import os
+import threading
+
+from faugus.path_manager import COLOR_CACHE
+from faugus.json_io import load_json_file, save_json_file
+
+HUE_BINS = 24
+
+
+def _load_small(path, size):
+    from PIL import Image
+
+    with Image.open(path) as img:
+        img.draft("RGB", (size, size))
+        return img.convert("RGB").resize((size, size), Image.BILINEAR)
+
+
+def average_color(image):
+    from PIL import ImageStat
+
+    return tuple(int(c) for c in ImageStat.Stat(image.resize((32, 32))).mean[:3])
+
+
+def dominant_color(image):
+    import colorsys
+
+    hue_bins = {}
+    for count, (r, g, b) in image.getcolors(image.width * image.height):
+        h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
+        if v < 0.15 or v > 0.95 or s < 0.25:
+            continue
+
+        weight = s * count
+        bucket = hue_bins.setdefault(int(h * HUE_BINS) % HUE_BINS, [0.0, 0.0, 0.0, 0.0])
+        bucket[0] += r * weight
+        bucket[1] += g * weight
+        bucket[2] += b * weight
+        bucket[3] += weight
+
+    if not hue_bins:
+        return average_color(image)
+
+    r_total, g_total, b_total, weight = max(hue_bins.values(), key=lambda bucket: bucket[3])
+    return int(r_total / weight), int(g_total / weight), int(b_total / weight)
+
+
+def image_colors(path):
+    image = _load_small(path, 64)
+    return {"average": list(average_color(image)), "dominant": list(dominant_color(image))}
+
+
+class ColorCache:
+    def __init__(self, path=COLOR_CACHE):
+        self.path = path
+        self._lock = threading.RLock()
+        self._entries = None
+
+    def _load(self):
+        if self._entries is None:
+            data = load_json_file(self.path, {})
+            self._entries = data if isinstance(data, dict) else {}
+        return self._entries
+
+    def _save(self):
+        try:
+            save_json_file(self._entries, self.path)
+        except OSError as e:
+            print(f"Faugus Launcher: failed to write {self.path} ({e})")
+
+    def _stamp(self, path):
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+
+    def _lookup(self, path, stamp):
+        entry = self._load().get(os.path.abspath(path))
+        if isinstance(entry, dict) and entry.get("stamp") == stamp:
+            return entry
+        return None
+
+    def _store(self, path, stamp, colors):
+        entry = {"stamp": stamp, **colors}
+        self._load()[os.path.abspath(path)] = entry
+        return entry
+
+    def colors(self, path):
+        with self._lock:
+            stamp = self._stamp(path)
+            entry = self._lookup(path, stamp)
+            if entry is None:
+                entry = self._store(path, stamp, image_colors(path))
+                self._save()
+            return entry
+
+    def dominant(self, path):
+        return tuple(self.colors(path)["dominant"])
+
+    def average(self, path):
+        return tuple(self.colors(path)["average"])
+
+    def prime(self, paths):
+        if isinstance(paths, str):
+            paths = [paths]
+        changed = False
+        for path in paths:
+            try:
+                stamp = self._stamp(path)
+                with self._lock:
+                    if self._lookup(path, stamp) is not None:
+                        continue
+                colors = image_colors(path)
+            except Exception as e:
+                print(f"Faugus Launcher: failed to read colours of {path} ({e})")
+                continue
+            with self._lock:
+                self._store(path, stamp, colors)
+            changed = True
+        if changed:
+            with self._lock:
+                self._save()
+
+    def forget(self, path):
+        with self._lock:
+            if self._load().pop(os.path.abspath(path), None) is not None:
+                self._save()
+
+
+_color_cache = None
+
+
+def get_color_cache():
+    global _color_cache
+    if _color_cache is None:
+        _color_cache = ColorCache()
+    return _color_cache
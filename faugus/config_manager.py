@@ -1,5 +1,5 @@
 from faugus.language_config import *
-from faugus.utils import atomic_write, load_json_file, save_json_file
+from faugus.json_io import load_json_file, save_json_file
 
 
 class ConfigManager:
@@ -53,6 +53,9 @@ class ConfigManager:
             'sort': 'alpha',
             'category': 'all',
             'steam-user': 'all',
+            'library-backend': 'json',
+            'library-view': 'virtual',
+            'texture-cache-mb': '256',
         }
 
         self.config = {}
@@ -5,7 +5,8 @@ import vdf
 
 from faugus.path_manager import *
 from faugus.steam_setup import get_all_shortcut_paths
-from faugus.utils import load_json_file, save_json_file, expand_path
+from faugus.game_repository import get_game_repository
+from faugus.utils import expand_path
 
 
 def update_desktop_path(shortcut_path, new_dir_path):
@@ -96,7 +97,8 @@ def update_ea_path(prefix):
 
     new_executable_dir = os.path.dirname(new_path)
 
-    games = load_json_file(GAMES_JSON, [])
+    repository = get_game_repository()
+    games = repository.games()
 
     changed = False
 
@@ -122,6 +124,6 @@ def update_ea_path(prefix):
                 update_steam_shortcut(game_title, new_executable_dir, new_path)
 
     if changed:
-        save_json_file(games, GAMES_JSON)
+        repository.save(games)
 
     return new_path
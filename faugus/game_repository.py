@@ -0,0 +1,338 @@
+import copy
+import fcntl
+import os
+import threading
+from contextlib import contextmanager
+
+from faugus.json_io import load_json_file, load_json_file_or_none, save_json_file
+from faugus.path_manager import GAMES_JSON, LATEST_GAMES, CUSTOM_ORDER, CONFIG_FILE_DIR
+from faugus.search_index import TitleSearchIndex
+
+
+def normalize_categories(raw):
+    if isinstance(raw, str):
+        return [raw] if raw else []
+    if isinstance(raw, (list, tuple, set, frozenset)):
+        return [c for c in raw if c]
+    return []
+
+
+def game_categories(entry):
+    return normalize_categories(entry.get("category"))
+
+
+class CategoryIndex:
+    def __init__(self, none_label=None):
+        self.none_label = none_label
+        self._members = {}
+        self._categories = {}
+        self._uncategorized = set()
+
+    def __len__(self):
+        return len(self._categories)
+
+    def __contains__(self, member):
+        return member in self._categories
+
+    def _normalize(self, categories):
+        cats = frozenset(normalize_categories(categories))
+        if self.none_label is not None and cats == {self.none_label}:
+            return frozenset()
+        return cats
+
+    def set(self, member, categories):
+        cats = self._normalize(categories)
+        old = self._categories.get(member)
+        if old == cats:
+            return
+        if old is not None:
+            self.discard(member)
+        self._categories[member] = cats
+        if not cats:
+            self._uncategorized.add(member)
+        for cat in cats:
+            self._members.setdefault(cat, set()).add(member)
+
+    def discard(self, member):
+        cats = self._categories.pop(member, None)
+        if cats is None:
+            return
+        self._uncategorized.discard(member)
+        for cat in cats:
+            members = self._members[cat]
+            members.discard(member)
+            if not members:
+                del self._members[cat]
+
+    def clear(self):
+        self._members.clear()
+        self._categories.clear()
+        self._uncategorized.clear()
+
+    def members(self, category):
+        if category is None or category == self.none_label:
+            uncategorized = self._uncategorized
+            if category is None:
+                return uncategorized
+            return uncategorized | self._members.get(category, set())
+        return self._members.get(category, set())
+
+
+class GameRepository:
+    backend = "json"
+
+    def __init__(self, path=GAMES_JSON, latest_path=LATEST_GAMES, custom_order_path=CUSTOM_ORDER):
+        self.path = path
+        self.latest_path = latest_path
+        self.custom_order_path = custom_order_path
+        self.lock_path = path + ".lock"
+        self._lock = threading.RLock()
+        self._stamp = None
+        self._readable = True
+        self._games = []
+        self._by_id = {}
+        self._by_prefix = {}
+        self._by_runner = {}
+        self._by_category = CategoryIndex()
+        self._search_index = None
+
+    def _stat_stamp(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _read(self):
+        data = load_json_file_or_none(self.path)
+        if not isinstance(data, list):
+            return None
+        return [entry for entry in data if isinstance(entry, dict)]
+
+    def _rebuild_indexes(self):
+        self._by_id = {}
+        self._by_prefix = {}
+        self._by_runner = {}
+        self._by_category.clear()
+
+        for entry in self._games:
+            gameid = entry.get("gameid")
+            if not gameid:
+                continue
+            self._by_id[gameid] = entry
+            self._by_prefix.setdefault(entry.get("prefix", ""), set()).add(gameid)
+            self._by_runner.setdefault(entry.get("runner", ""), set()).add(gameid)
+            self._by_category.set(gameid, entry.get("category"))
+
+        if self._search_index is not None:
+            self._search_index.sync(self._games)
+
+    def _load(self, stamp):
+        data = self._read()
+        self._readable = data is not None
+        self._games = data or []
+        self._stamp = stamp
+        self._rebuild_indexes()
+
+    def refresh(self, force=False):
+        with self._lock:
+            stamp = self._stat_stamp()
+            if force or stamp is None or stamp != self._stamp:
+                self._load(stamp)
+            return self._readable
+
+    @contextmanager
+    def _file_lock(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write(self, games):
+        save_json_file(games, self.path)
+        self._games = list(games)
+        self._readable = True
+        self._stamp = self._stat_stamp()
+        self._rebuild_indexes()
+
+    @contextmanager
+    def transaction(self):
+        with self._lock, self._file_lock():
+            self.refresh()
+            yield self._games if self._readable else None
+
+    def is_readable(self):
+        return self.refresh()
+
+    def games(self):
+        with self._lock:
+            self.refresh()
+            return copy.deepcopy(self._games)
+
+    def get(self, gameid):
+        with self._lock:
+            self.refresh()
+            return copy.deepcopy(self._by_id.get(gameid))
+
+    def with_prefix(self, prefix):
+        with self._lock:
+            self.refresh()
+            return [copy.deepcopy(self._by_id[g]) for g in self._by_prefix.get(prefix, ())]
+
+    def with_runner(self, runner):
+        with self._lock:
+            self.refresh()
+            return [copy.deepcopy(self._by_id[g]) for g in self._by_runner.get(runner, ())]
+
+    def hidden(self):
+        return [entry for entry in self.games() if entry.get("hidden", False)]
+
+    def titles(self):
+        with self._lock:
+            self.refresh()
+            return {gameid: entry.get("title", gameid) for gameid, entry in self._by_id.items()}
+
+    def stored_playtimes(self):
+        with self._lock:
+            self.refresh()
+            return {gameid: entry.get("playtime", 0) for gameid, entry in self._by_id.items()}
+
+    def playtimes(self):
+        from faugus.session_journal import get_session_journal
+        return get_session_journal().merge_playtimes(self.stored_playtimes())
+
+    def playtime(self, gameid):
+        return self.playtimes().get(gameid, 0)
+
+    def search_index(self):
+        with self._lock:
+            self.refresh()
+            if self._search_index is None:
+                self._search_index = TitleSearchIndex()
+                self._search_index.sync(self._games)
+            return self._search_index
+
+    def search(self, query, limit=None):
+        recent = {gameid: idx for idx, gameid in enumerate(self.recent_games())}
+        return self.search_index().search(query, limit=limit, recent=recent)
+
+    def find_title(self, title):
+        folded = title.casefold()
+        for entry in self.games():
+            if entry.get("title", "").casefold() == folded:
+                return entry
+        return None
+
+    def save(self, games, keep_playtime=True):
+        with self.transaction() as current:
+            if current is None:
+                return
+            if keep_playtime:
+                stored = self.stored_playtimes()
+                games = [
+                    {**entry, "playtime": stored[entry.get("gameid")]}
+                    if entry.get("gameid") in stored else entry
+                    for entry in games
+                ]
+            self._write(copy.deepcopy(games))
+
+    def update(self, gameid, change):
+        with self.transaction() as games:
+            if games is None:
+                return None
+            if gameid not in self._by_id:
+                return None
+            entry = copy.deepcopy(self._by_id[gameid])
+            change(entry)
+            self._write([entry if g.get("gameid") == gameid else g for g in games])
+            return copy.deepcopy(entry)
+
+    def rename_category(self, old_cat, new_cat):
+        with self.transaction() as games:
+            if games is None:
+                return []
+            affected = sorted(self._by_category.members(old_cat))
+
+            def rename(entry):
+                cats = [new_cat if c == old_cat else c for c in game_categories(entry)]
+                return {**entry, "category": list(dict.fromkeys(cats))}
+
+            if affected:
+                members = set(affected)
+                self._write([rename(g) if g.get("gameid") in members else g for g in games])
+            return affected
+
+    def remove_category(self, category):
+        with self.transaction() as games:
+            if games is None:
+                return []
+            affected = sorted(self._by_category.members(category))
+
+            def strip(entry):
+                cats = [c for c in game_categories(entry) if c != category]
+                entry = {k: v for k, v in entry.items() if k != "category"}
+                if cats:
+                    entry["category"] = cats
+                return entry
+
+            if affected:
+                members = set(affected)
+                self._write([strip(g) if g.get("gameid") in members else g for g in games])
+            return affected
+
+    def stored_recent_games(self):
+        return [gid.strip() for gid in load_json_file(self.latest_path, []) if isinstance(gid, str)]
+
+    def recent_games(self):
+        from faugus.session_journal import get_session_journal
+        return get_session_journal().merge_recent(self.stored_recent_games())
+
+    def remove_recent(self, gameid):
+        with self._lock, self._file_lock():
+            recent = self.stored_recent_games()
+            if gameid not in recent:
+                return False
+            recent.remove(gameid)
+            save_json_file(recent, self.latest_path)
+            return True
+
+    def custom_order(self):
+        data = load_json_file(self.custom_order_path, {})
+        return data if isinstance(data, dict) else {}
+
+    def save_custom_order(self, order):
+        with self._lock, self._file_lock():
+            save_json_file(dict(order), self.custom_order_path)
+
+    def remove_custom_order(self, gameid):
+        with self._lock, self._file_lock():
+            order = self.custom_order()
+            if gameid not in order:
+                return False
+            del order[gameid]
+            save_json_file(order, self.custom_order_path)
+            return True
+
+
+def configured_backend():
+    config = load_json_file(CONFIG_FILE_DIR, {})
+    if not isinstance(config, dict):
+        return "json"
+    return str(config.get("library-backend", "json")).strip('"')
+
+
+_repository = None
+
+
+def get_game_repository():
+    global _repository
+    if _repository is None:
+        if configured_backend() == "sqlite":
+            from faugus.library_db import open_sqlite_repository
+            _repository = open_sqlite_repository()
+        else:
+            _repository = GameRepository()
+    return _repository
@@ -895,14 +895,18 @@ def _focus_bottom_bar_by_column(active_window, focused_flowbox_child):
 
 def _find_list_base_view(widget):
     while widget:
-        if type(widget).__name__ in ("GtkColumnListView", "GridView"):
+        if type(widget).__name__ in ("GtkColumnListView", "GridView", "ListView"):
             return widget
         widget = widget.get_parent()
     return None
 
 
 def _find_list_base_descendant(widget):
-    return _find_descendant_by_typename(widget, "GtkColumnListView") or _find_descendant_by_typename(widget, "GridView")
+    return (
+        _find_descendant_by_typename(widget, "GtkColumnListView")
+        or _find_descendant_by_typename(widget, "GridView")
+        or _find_descendant_by_typename(widget, "ListView")
+    )
 
 
 def _grid_view_columns(grid_view):
@@ -1040,6 +1044,10 @@ def navigate_gamepad(direction):
     if list_base_view and (is_vertical or (is_horizontal and type(list_base_view).__name__ == "GridView")):
         if _navigate_list_base_view(list_base_view, direction):
             return
+        if direction == Gtk.DirectionType.DOWN and getattr(list_base_view, "library_view", None) is not None:
+            selected_child = _find_list_base_selected_child(list_base_view)
+            if selected_child is not None and _focus_bottom_bar_by_column(active_window, selected_child):
+                return
 
     if isinstance(focused, Gtk.TreeView):
         model = focused.get_model()
@@ -1138,6 +1146,9 @@ def activate_focused_widget(self):
             popover = getattr(parent, "popover_suggestion", None)
             if popover is not None:
                 popover.popdown()
+        elif focused is getattr(parent, "entry_search", None) and hasattr(parent, "fetch_library_suggestions"):
+            fetch_suggestions = parent.fetch_library_suggestions
+            on_suggestion_selected = parent.on_library_suggestion_selected
 
         def on_keyboard_closed():
             if is_title_suggestion_field:
@@ -1184,7 +1195,7 @@ def activate_focused_widget(self):
     elif isinstance(focused, Gtk.FlowBoxChild) and hasattr(focused, "gamepad_activate"):
         focused.gamepad_activate()
 
-    elif isinstance(focused, Gtk.FlowBoxChild):
+    elif isinstance(focused, Gtk.FlowBoxChild) or getattr(_find_list_base_view(focused), "library_view", None) is not None:
         game = self.selected()
         if game:
             if game.gameid in self.running:
@@ -0,0 +1,46 @@
+import json
+import os
+import tempfile
+
+
+def ensure_parent_dir(path):
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+
+
+def atomic_write(filepath, write_func):
+    ensure_parent_dir(filepath)
+    dir_name = os.path.dirname(filepath) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            write_func(f)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_json_file(filepath, default=None):
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return default if default is not None else []
+
+
+def load_json_file_or_none(filepath):
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"Faugus Launcher: refusing to touch {filepath}, failed to read it ({e})")
+        return None
+
+
+def save_json_file(data, filepath, indent=4):
+    atomic_write(filepath, lambda f: json.dump(data, f, indent=indent, ensure_ascii=False))
@@ -20,6 +20,13 @@ from faugus.utils import *
 from faugus.steam_setup import *
 from faugus.ea_fix import *
 from faugus.migration import fix_legacy_shortcut_icons
+from faugus.game_repository import get_game_repository, normalize_categories, CategoryIndex
+from faugus.session_journal import get_session_journal
+from faugus.library_view import LibraryView, LibraryTile
+from faugus.texture_cache import load_texture, peek_texture, peek_nearest, forget_artwork
+from faugus.artwork_loader import ArtworkLoader
+from faugus.color_cache import get_color_cache
+from faugus.steamgriddb import SteamGridDBClient, ArtworkJob, TitleAutocomplete, get_autocomplete_cache
 
 VERSION = "2.1.0"
 
@@ -109,7 +116,8 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         self.mono_icon = False
 
         self.current_prefix = None
-        self.games = []
+        self.games = GameList(none_label=_("None"))
+        self.artwork_loader = ArtworkLoader()
 
         self.processes = {}
 
@@ -133,6 +141,12 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
                 background-color: @theme_selected_bg_color;
                 color: @theme_selected_fg_color;
             }
+            .library-view > child,
+            .library-view > row {
+                padding: 0;
+                background: none;
+                box-shadow: none;
+            }
             entry.flowbox-entry {
                 border: none;
                 background: none;
@@ -342,14 +356,19 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             self.on_item_right_click(item, x, y)
 
         right_click.connect("pressed", on_right_click)
-        self.flowbox.add_controller(right_click)
+        self.library_widget().add_controller(right_click)
         def on_selected_children_changed(*_):
             GLib.idle_add(self.update_icon)
             GLib.idle_add(self.schedule_background_update)
 
-        self.flowbox.connect("selected-children-changed", on_selected_children_changed)
+        if isinstance(self.flowbox, LibraryView):
+            self.flowbox.selection.connect("selection-changed", on_selected_children_changed)
+        else:
+            self.flowbox.connect("selected-children-changed", on_selected_children_changed)
+        self.connect("realize", self.on_window_realize)
 
         GLib.idle_add(self.ensure_tray_daemon)
+        GLib.idle_add(self.import_steam_artwork)
 
         if self.gamepad_navigation:
             import faugus.gamepad as gamepad
@@ -357,6 +376,36 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
         GLib.timeout_add(1000, self.check_running)
 
+        self.steam_library_monitor = SteamLibraryMonitor(get_steam_library_index(), self.on_steam_library_changed)
+        self.steam_library_monitor.start()
+
+    def on_window_realize(self, window):
+        surface = self.get_surface()
+        prop = "notify::scale" if hasattr(surface, "get_scale") else "notify::scale-factor"
+        surface.connect(prop, lambda *args: self.on_display_scale_changed())
+        self.on_display_scale_changed()
+
+    def on_display_scale_changed(self):
+        if not set_display_scale(widget_scale(self)):
+            return
+
+        self.schedule_background_update()
+        if not hasattr(self, 'flowbox'):
+            return
+
+        children_iter = iter(self.library_tiles())
+
+        def step():
+            for _ in range(15):
+                child = next(children_iter, None)
+                if child is None:
+                    return False
+                if getattr(child, 'game', None) and (hasattr(child, 'image') or hasattr(child, 'cover')):
+                    self.update_game_visual(child)
+            return True
+
+        GLib.idle_add(step)
+
     def update_icon(self):
         game = self.selected()
         gameid = game.gameid if game else None
@@ -489,54 +538,10 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         self.stack_banner.set_vexpand(True)
 
         self._banner_pages = []
-        self._banner_color_providers = []
-        self._banner_image_providers = []
 
         for i in range(2):
-            page = Gtk.Overlay()
-
-            color_box = Gtk.Box()
-            color_box.set_hexpand(True)
-            color_box.set_vexpand(True)
-            color_box.add_css_class(f"banner-bg-color-{i}")
-            page.set_child(color_box)
-
-            banner_image_box = None
-            if show_banner:
-                banner_image_box = Gtk.Box()
-                banner_image_box.set_hexpand(True)
-                banner_image_box.set_vexpand(False)
-                banner_image_box.set_halign(Gtk.Align.FILL)
-                banner_image_box.set_valign(Gtk.Align.START)
-                banner_image_box.add_css_class(f"banner-bg-image-{i}")
-                page.add_overlay(banner_image_box)
-                page.set_measure_overlay(banner_image_box, False)
-
-                banner_ratio = 1920 / 620
-                banner_size_state = {"width": -1}
-
-                def on_banner_page_tick(widget, frame_clock, box=banner_image_box, state=banner_size_state):
-                    width = widget.get_width()
-                    if width > 0 and width != state["width"]:
-                        state["width"] = width
-                        box.set_size_request(-1, int(width / banner_ratio))
-                    return True
-
-                page.add_tick_callback(on_banner_page_tick)
-
-            color_provider = Gtk.CssProvider()
-            color_box.get_style_context().add_provider(color_provider, Gtk.STYLE_PROVIDER_PRIORITY_USER + 1)
-            image_provider = Gtk.CssProvider()
-            if banner_image_box is not None:
-                banner_image_box.get_style_context().add_provider(image_provider, Gtk.STYLE_PROVIDER_PRIORITY_USER + 1)
-
-            page.color_box = color_box
-            page.banner_image_box = banner_image_box
-
+            page = BannerView()
             self._banner_pages.append(page)
-            self._banner_color_providers.append(color_provider)
-            self._banner_image_providers.append(image_provider)
-
             self.stack_banner.add_named(page, f"banner-{i}")
 
         self._banner_page_index = 0
@@ -557,35 +562,14 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         base_box = self.setup_launcher_base_box()
         overlay.set_child(base_box)
 
-        banner_image_box = Gtk.Box()
-        banner_image_box.set_hexpand(True)
-        banner_image_box.set_vexpand(False)
-        banner_image_box.set_halign(Gtk.Align.FILL)
-        banner_image_box.set_valign(Gtk.Align.START)
-        banner_image_box.add_css_class("launcher-screen-banner-image")
-        overlay.add_overlay(banner_image_box)
-        overlay.set_measure_overlay(banner_image_box, False)
-
-        banner_ratio = 1920 / 620
-        banner_size_state = {"width": -1}
-
-        def on_banner_tick(widget, frame_clock, box=banner_image_box, state=banner_size_state):
-            width = widget.get_width()
-            if width > 0 and width != state["width"]:
-                state["width"] = width
-                box.set_size_request(-1, int(width / banner_ratio))
-            return True
-
-        overlay.add_tick_callback(on_banner_tick)
+        banner_view = BannerView()
+        overlay.add_overlay(banner_view)
+        overlay.set_measure_overlay(banner_view, False)
 
         overlay.add_overlay(content_widget)
         overlay.set_measure_overlay(content_widget, True)
 
-        provider = Gtk.CssProvider()
-        banner_image_box.get_style_context().add_provider(provider, Gtk.STYLE_PROVIDER_PRIORITY_USER + 1)
-
-        self.launcher_banner_image_box = banner_image_box
-        self.launcher_banner_provider = provider
+        self.launcher_banner_view = banner_view
         self.launcher_banner_path = banner_path
         self.update_launcher_banner_css()
 
@@ -594,8 +578,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
     def wrap_launcher_no_banner(self, content_widget):
         base_box = self.setup_launcher_base_box(content_widget)
 
-        self.launcher_banner_image_box = None
-        self.launcher_banner_provider = None
+        self.launcher_banner_view = None
         self.launcher_banner_path = None
         self.update_launcher_banner_css()
 
@@ -620,8 +603,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         if base_box is None or base_provider is None:
             return
 
-        banner_image_box = getattr(self, 'launcher_banner_image_box', None)
-        provider = getattr(self, 'launcher_banner_provider', None)
+        banner_view = getattr(self, 'launcher_banner_view', None)
         banner_path = getattr(self, 'launcher_banner_path', None)
 
         base_mode = self.background_mode
@@ -657,36 +639,13 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         """
         base_provider.load_from_data(base_css.encode("utf-8"))
 
-        if banner_image_box is not None and provider is not None and banner_path is not None and os.path.isfile(banner_path):
-            cache_path = banner_path
-            if os.path.getsize(banner_path) > 0:
-                self._banner_css_cache_counter = getattr(self, '_banner_css_cache_counter', 0) + 1
-                candidate_path = f"{banner_path}.cache{self._banner_css_cache_counter}"
-                try:
-                    shutil.copyfile(banner_path, candidate_path)
-                    cache_path = candidate_path
-                except OSError:
-                    cache_path = banner_path
-
-            old_cache_path = getattr(self, '_banner_css_cache_path', None)
-            self._banner_css_cache_path = cache_path if cache_path != banner_path else None
-
-            banner_uri = Gio.File.new_for_path(cache_path).get_uri()
-            banner_css = f"""
-            .launcher-screen-banner-image {{
-                background-image: linear-gradient(to bottom, rgba({fade_r}, {fade_g}, {fade_b}, 0) 0%, rgba({fade_r}, {fade_g}, {fade_b}, 1) 100%), url("{banner_uri}");
-                background-repeat: no-repeat, no-repeat;
-                background-position: center, center;
-                background-size: 100% 100%, 100% 100%;
-            }}
-            """
-            provider.load_from_data(banner_css.encode("utf-8"))
-
-            if old_cache_path and old_cache_path != cache_path and os.path.isfile(old_cache_path):
-                try:
-                    os.remove(old_cache_path)
-                except OSError:
-                    pass
+        if banner_view is not None and banner_path is not None and os.path.isfile(banner_path):
+            try:
+                texture = load_texture(banner_path)
+            except (GLib.Error, OSError) as e:
+                print(f"Faugus Launcher: failed to load banner {banner_path} ({e})")
+                texture = None
+            banner_view.set_banner(texture, (fade_r, fade_g, fade_b))
 
     def apply_background_mode_live(self, new_mode):
         show_banner = self.banner_overlay_enabled()
@@ -763,17 +722,15 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         if stack_banner is None or (not show_banner and base_mode != "dominant_color"):
             return
 
-        def apply():
-            game = self.selected()
-            color_css = ""
-            banner_css = ""
+        game = self.selected()
 
-            next_index = 1 - self._banner_page_index
-            page = self._banner_pages[next_index]
-            color_box = page.color_box
-            banner_image_box = page.banner_image_box
-            color_class = f"banner-bg-color-{next_index}"
-            image_class = f"banner-bg-image-{next_index}"
+        def apply(banner=None):
+            if self.selected() is not game:
+                return False
+
+            color = None
+            texture = None
+            fade = None
 
             if game:
                 if base_mode == "dominant_color":
@@ -783,37 +740,41 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
                         color_source = f"{ICONS_DIR}/{game.gameid}.png"
                     if os.path.isfile(color_source):
                         r, g, b = get_dominant_color(color_source)
-                        color_css = f".{color_class} {{ background-color: rgba({r}, {g}, {b}, 0.2); }}"
+                        color = Gdk.RGBA(red=r / 255, green=g / 255, blue=b / 255, alpha=0.2)
 
-                if show_banner and banner_image_box is not None:
+                if show_banner:
                     candidate = f"{BANNERS_DIR}/{game.gameid}.png"
-                    if os.path.isfile(candidate):
-                        banner_uri = Gio.File.new_for_path(candidate).get_uri()
-
+                    if banner is None and os.path.isfile(candidate):
+                        banner = peek_texture(candidate, BANNER_WIDTH, BANNER_HEIGHT, get_display_scale())
+                        if banner is None:
+                            self.load_background_banner(candidate, apply)
+                            return False
+
+                    if banner:
+                        texture = banner
                         window_r, window_g, window_b = self.get_named_rgb("theme_bg_color")
-                        if base_mode == "dominant_color" and color_css:
-                            fade_r = int(window_r * 0.8 + r * 0.2)
-                            fade_g = int(window_g * 0.8 + g * 0.2)
-                            fade_b = int(window_b * 0.8 + b * 0.2)
+                        if base_mode == "dominant_color" and color is not None:
+                            fade = (
+                                int(window_r * 0.8 + r * 0.2),
+                                int(window_g * 0.8 + g * 0.2),
+                                int(window_b * 0.8 + b * 0.2),
+                            )
                         elif base_mode == "accent":
                             ar, ag, ab = self.get_accent_rgb()
-                            fade_r = int(window_r * 0.8 + ar * 0.2)
-                            fade_g = int(window_g * 0.8 + ag * 0.2)
-                            fade_b = int(window_b * 0.8 + ab * 0.2)
+                            fade = (
+                                int(window_r * 0.8 + ar * 0.2),
+                                int(window_g * 0.8 + ag * 0.2),
+                                int(window_b * 0.8 + ab * 0.2),
+                            )
                         else:
-                            fade_r, fade_g, fade_b = window_r, window_g, window_b
+                            fade = (window_r, window_g, window_b)
 
-                        banner_css = f"""
-                        .{image_class} {{
-                            background-image: linear-gradient(to bottom, rgba({fade_r}, {fade_g}, {fade_b}, 0) 0%, rgba({fade_r}, {fade_g}, {fade_b}, 1) 100%), url("{banner_uri}");
-                            background-repeat: no-repeat, no-repeat;
-                            background-position: center, center;
-                            background-size: 100% 100%, 100% 100%;
-                        }}
-                        """
+                    self.prefetch_banners(game)
 
-            self._banner_color_providers[next_index].load_from_data(color_css.encode("utf-8"))
-            self._banner_image_providers[next_index].load_from_data(banner_css.encode("utf-8"))
+            next_index = 1 - self._banner_page_index
+            page = self._banner_pages[next_index]
+            page.set_background(color)
+            page.set_banner(texture, fade)
 
             stack_banner.set_visible_child(page)
             self._banner_page_index = next_index
@@ -821,6 +782,73 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
         GLib.idle_add(apply)
 
+    def load_background_banner(self, path, on_ready):
+        if getattr(self, '_banner_loading', None) == path:
+            return
+        self._banner_loading = path
+        scale = get_display_scale()
+
+        def worker():
+            try:
+                texture = load_texture(path, BANNER_WIDTH, BANNER_HEIGHT, scale)
+            except (GLib.Error, OSError) as e:
+                print(f"Faugus Launcher: failed to load banner {path} ({e})")
+                texture = False
+
+            def done():
+                if self._banner_loading == path:
+                    self._banner_loading = None
+                on_ready(texture)
+                return False
+
+            GLib.idle_add(done)
+
+        run_in_background(worker)
+
+    def banner_neighbours(self, game):
+        children = self.visible_library_children()
+        if isinstance(self.flowbox, LibraryView):
+            index = self.flowbox.position(self.flowbox.item_for_game(game))
+        else:
+            index = next((i for i, c in enumerate(children) if getattr(c, 'game', None) is game), None)
+        if index is None:
+            return []
+
+        tile = getattr(children[index], 'widget', children[index])
+        tile_width = tile.get_width() if tile is not None else 0
+        columns = max(1, self.library_widget().get_width() // tile_width) if tile_width > 0 else 1
+        offsets = dict.fromkeys((1, -1, columns, -columns, 2, -2))
+
+        return [children[index + o].game for o in offsets if 0 <= index + o < len(children)]
+
+    def prefetch_banners(self, game):
+        prefetching = getattr(self, '_banner_prefetching', None)
+        if prefetching is None:
+            prefetching = self._banner_prefetching = set()
+        scale = get_display_scale()
+        paths = []
+        for neighbour in self.banner_neighbours(game):
+            path = f"{BANNERS_DIR}/{neighbour.gameid}.png"
+            if path in prefetching or not os.path.isfile(path):
+                continue
+            if peek_texture(path, BANNER_WIDTH, BANNER_HEIGHT, scale) is None:
+                prefetching.add(path)
+                paths.append(path)
+
+        if not paths:
+            return
+
+        def worker():
+            for path in paths:
+                try:
+                    load_texture(path, BANNER_WIDTH, BANNER_HEIGHT, scale)
+                except (GLib.Error, OSError):
+                    pass
+                finally:
+                    prefetching.discard(path)
+
+        run_in_background(worker)
+
     def check_running(self):
         changed = False
 
@@ -959,14 +987,17 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         timer.start()
 
     def _focus_flowbox_child(self, child):
-        self.flowbox.grab_focus()
+        self.library_widget().grab_focus()
         self.flowbox.select_child(child)
-        child.grab_focus()
+        if isinstance(self.flowbox, LibraryView):
+            self.flowbox.focus_item(child)
+        else:
+            child.grab_focus()
 
     def select_first_child(self):
-        visible_children = [c for c in widget_children(self.flowbox) if c.get_child_visible()]
-        if visible_children:
-            self._focus_flowbox_child(visible_children[0])
+        first_child = self.first_visible_library_child()
+        if first_child is not None:
+            self._focus_flowbox_child(first_child)
 
     def select_first_child_when_ready(self):
         attempts = {"n": 0}
@@ -974,9 +1005,9 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         def try_select():
             attempts["n"] += 1
 
-            visible_children = [c for c in widget_children(self.flowbox) if c.get_child_visible()]
-            if visible_children:
-                self._focus_flowbox_child(visible_children[0])
+            first_child = self.first_visible_library_child()
+            if first_child is not None:
+                self._focus_flowbox_child(first_child)
                 return False
 
             return attempts["n"] < 100
@@ -989,8 +1020,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         def do_select():
             attempts["n"] += 1
 
-            visible_children = [c for c in widget_children(self.flowbox) if c.get_child_visible()]
-            for child in visible_children:
+            for child in self.visible_library_children():
                 if hasattr(child, 'game') and child.game and child.game.title == title:
                     self._focus_flowbox_child(child)
                     return False
@@ -999,7 +1029,51 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
         GLib.timeout_add(50, do_select)
 
+    def library_widget(self):
+        return getattr(self.flowbox, "widget", self.flowbox)
+
+    def select_first_visible(self):
+        if isinstance(self.flowbox, LibraryView):
+            self.flowbox.select_first()
+            return
+        for child in widget_children(self.flowbox):
+            if child.get_child_visible():
+                self.flowbox.select_child(child)
+                break
+
+    def library_tiles(self):
+        if isinstance(self.flowbox, LibraryView):
+            return self.flowbox.tiles()
+        return widget_children(self.flowbox)
+
+    def library_games(self):
+        if isinstance(self.flowbox, LibraryView):
+            return self.flowbox.games()
+        return [c.game for c in widget_children(self.flowbox) if getattr(c, 'game', None)]
+
+    def visible_library_children(self):
+        if isinstance(self.flowbox, LibraryView):
+            return self.flowbox.visible_items()
+        return [c for c in widget_children(self.flowbox) if c.get_child_visible()]
+
+    def first_visible_library_child(self):
+        if isinstance(self.flowbox, LibraryView):
+            return self.flowbox.item_at(0)
+        return next((c for c in widget_children(self.flowbox) if c.get_child_visible()), None)
+
+    def library_child_has_focus(self, child):
+        if isinstance(self.flowbox, LibraryView):
+            return self.flowbox.item_has_focus(child)
+        return child.is_focus()
+
+    def library_tile(self, child):
+        if isinstance(self.flowbox, LibraryView):
+            return child.widget if child is not None else None
+        return child
+
     def find_flowbox_child_for_game(self, game):
+        if isinstance(self.flowbox, LibraryView):
+            return self.flowbox.item_for_game(game)
         for child in widget_children(self.flowbox):
             if getattr(child, 'game', None) is game:
                 return child
@@ -1094,24 +1168,17 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         self.button_sort.set_size_request(110, -1)
 
         def update_sort_data():
+            repository = get_game_repository()
+
             self.playtime_data.clear()
-            try:
-                data = load_json_file(GAMES_JSON, [])
-                for item in data:
-                    if isinstance(item, dict) and "gameid" in item:
-                        self.playtime_data[item["gameid"]] = item.get("playtime", 0)
-            except:
-                pass
+            self.playtime_data.update(repository.playtimes())
 
             self.latest_games_order.clear()
-            try:
-                for idx, gid in enumerate(load_json_file(LATEST_GAMES, default=[])):
-                    self.latest_games_order[gid.strip()] = idx
-            except:
-                pass
+            for idx, gid in enumerate(repository.recent_games()):
+                self.latest_games_order[gid] = idx
 
             self.custom_order_data.clear()
-            self.custom_order_data.update(load_json_file(CUSTOM_ORDER, default={}))
+            self.custom_order_data.update(repository.custom_order())
 
         def on_sort_button_clicked(widget):
             popover = Gtk.Popover()
@@ -1152,7 +1219,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
         self.button_sort.connect("clicked", on_sort_button_clicked)
 
-        adjustment = Gtk.Adjustment(value=self.cover_size, lower=50, upper=100, step_increment=10, page_increment=10, page_size=0)
+        adjustment = Gtk.Adjustment(value=self.cover_size, lower=ZOOM_MIN, upper=ZOOM_MAX, step_increment=ZOOM_STEP, page_increment=ZOOM_STEP, page_size=0)
         self.scale_zoom = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, adjustment=adjustment)
         self.scale_zoom.set_size_request(150, -1)
         self.scale_zoom.set_draw_value(True)
@@ -1161,7 +1228,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
         def on_zoom_changed(widget):
             val = widget.get_value()
-            snapped = round(val / 10.0) * 10.0
+            snapped = round(val / ZOOM_STEP) * ZOOM_STEP
             if val != snapped:
                 widget.set_value(snapped)
                 return
@@ -1173,6 +1240,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             self._last_zoom = zoom_pct
             self.cover_size = zoom_pct
 
+            self.resize_cover_artwork(zoom_pct)
             self.schedule_zoom_apply(zoom_pct)
 
         self.scale_zoom.connect("value-changed", on_zoom_changed)
@@ -1184,14 +1252,20 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         scroll_box.set_margin_start(10)
         scroll_box.set_margin_end(10)
         scroll_box.set_hexpand(True)
+        self.artwork_loader.set_viewport(scroll_box)
 
-        self.flowbox = Gtk.FlowBox()
-        self.flowbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.flowbox.connect("keynav-failed", self.on_flowbox_keynav_failed)
+        if self.virtual_library:
+            self.flowbox = LibraryView(
+                self.interface_mode != "List", self.setup_game_tile, self.bind_game_tile, self.unbind_game_tile
+            )
+        else:
+            self.flowbox = Gtk.FlowBox()
+            self.flowbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
+        self.library_widget().connect("keynav-failed", self.on_flowbox_keynav_failed)
         click_release = Gtk.GestureClick()
         click_release.set_button(Gdk.BUTTON_PRIMARY)
         click_release.connect("released", self.on_item_release_event)
-        self.flowbox.add_controller(click_release)
+        self.library_widget().add_controller(click_release)
 
         def get_game(w):
             if hasattr(w, 'game') and w.game: return w.game
@@ -1208,7 +1282,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             return None
 
         def setup_dnd_for_widget(fb_child):
-            if not isinstance(fb_child, Gtk.FlowBoxChild):
+            if not isinstance(fb_child, (Gtk.FlowBoxChild, LibraryTile)):
                 return
             if getattr(fb_child, '_dnd_ready', False):
                 return
@@ -1241,7 +1315,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             def on_drag_end(source, drag, delete_data):
                 self._drag_source_id = None
                 if self.current_sort_id == "custom":
-                    save_json_file(self.custom_order_data, CUSTOM_ORDER)
+                    get_game_repository().save_custom_order(self.custom_order_data)
 
             drag_source = Gtk.DragSource()
             drag_source.set_actions(Gdk.DragAction.MOVE)
@@ -1264,11 +1338,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
                 if source_id == target_id:
                     return Gdk.DragAction.MOVE
 
-                ordered = []
-                for child in widget_children(self.flowbox):
-                    g = get_game(child)
-                    if g:
-                        ordered.append(g.gameid)
+                ordered = [g.gameid for g in self.library_games()]
 
                 ordered.sort(key=lambda gid: self.custom_order_data.get(gid, 999999))
 
@@ -1297,21 +1367,22 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         self.setup_dnd_for_widget = setup_dnd_for_widget
 
         if is_big:
-            self.flowbox.set_halign(Gtk.Align.CENTER)
-            self.flowbox.set_valign(Gtk.Align.CENTER)
+            self.library_widget().set_halign(Gtk.Align.CENTER)
+            self.library_widget().set_valign(Gtk.Align.CENTER)
             self.flowbox.set_min_children_per_line(2)
             self.flowbox.set_max_children_per_line(20)
         else:
-            self.flowbox.set_halign(Gtk.Align.FILL)
-            self.flowbox.set_valign(Gtk.Align.START)
+            self.library_widget().set_halign(Gtk.Align.FILL)
+            self.library_widget().set_valign(Gtk.Align.START)
             self.flowbox.set_min_children_per_line(1)
             self.flowbox.set_max_children_per_line(1)
 
-        if self.interface_mode == "List":
-            self.flowbox.set_row_spacing(5)
-        elif self.interface_mode == "Grid":
-            self.flowbox.set_row_spacing(5)
-            self.flowbox.set_column_spacing(5)
+        if not self.virtual_library:
+            if self.interface_mode == "List":
+                self.flowbox.set_row_spacing(5)
+            elif self.interface_mode == "Grid":
+                self.flowbox.set_row_spacing(5)
+                self.flowbox.set_column_spacing(5)
 
         def sort_games(child1, child2, user_data):
             g1 = getattr(child1, 'game', None) or getattr(child1.get_child(), 'game', None)
@@ -1339,7 +1410,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             if not (g1 and g2):
                 return 0
 
-            t1, t2 = g1.title.lower(), g2.title.lower()
+            t1, t2 = g1.title_key, g2.title_key
             return (t1 > t2) - (t1 < t2)
 
         def filter_games(child, user_data):
@@ -1347,32 +1418,53 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             if not game:
                 return False
 
-            search_text = self.entry_search.get_text().lower()
-            matches_search = search_text in game.title.lower() if search_text else True
-            matches_category = True
-
+            state = (self.entry_search.get_text(), self.current_category)
+            if self._flowbox_filter is None or self._flowbox_filter[0] != state:
+                if self._flowbox_filter is None:
+                    def forget_filter():
+                        self._flowbox_filter = None
+                        return False
+
+                    GLib.idle_add(forget_filter)
+                self._flowbox_filter = (state, filter_factory())
+
+            return self._flowbox_filter[1](game)
+
+        def sort_key_func():
+            if self.current_sort_id == "playtime":
+                playtime_data = self.playtime_data
+                return lambda game: (-playtime_data.get(game.gameid, 0), game.title_key)
+            if self.current_sort_id == "lastplayed":
+                latest_games_order = self.latest_games_order
+                return lambda game: (latest_games_order.get(game.gameid, float('inf')), game.title_key)
+            if self.current_sort_id == "custom":
+                custom_order_data = self.custom_order_data
+                return lambda game: (custom_order_data.get(game.gameid, 999999), game.title_key)
+            return lambda game: game.title_key
+
+        def filter_factory():
+            matches = self.search_matches(self.entry_search.get_text())
+            members = None
             if getattr(self, 'categories_and_sort_enabled', True) and self.current_category and self.current_category != _("All"):
-                raw_cat = game.category
+                members = self._games_in_category(self.current_category)
 
-                if isinstance(raw_cat, str):
-                    game_cats = [raw_cat]
-                elif isinstance(raw_cat, list):
-                    game_cats = raw_cat
-                else:
-                    game_cats = []
+            def match(game):
+                if matches is not None and game.gameid not in matches:
+                    return False
+                return members is None or game in members
 
-                if self.current_category == _("Uncategorized"):
-                    matches_category = not game_cats or game_cats == [_("None")]
-                else:
-                    if not game_cats:
-                        game_cats = [_("None")]
-                    matches_category = (self.current_category in game_cats)
+            return match
 
-            return matches_search and matches_category
+        self.library_sort_key = sort_key_func
 
-        self.flowbox.set_sort_func(sort_games, None)
-        self.flowbox.set_filter_func(filter_games, None)
-        scroll_box.set_child(self.flowbox)
+        if isinstance(self.flowbox, LibraryView):
+            self.flowbox.set_sort_key_func(sort_key_func)
+            self.flowbox.set_filter_factory(filter_factory)
+        else:
+            self._flowbox_filter = None
+            self.flowbox.set_sort_func(sort_games, None)
+            self.flowbox.set_filter_func(filter_games, None)
+        scroll_box.set_child(self.library_widget())
 
         if is_big:
             self.main_hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
@@ -1489,13 +1581,8 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
                 self.select_first_child()
 
-                target = None
-                for child in widget_children(self.flowbox):
-                    if child.get_child_visible():
-                        target = child
-                        break
-
-                matched = target is not None and self.get_focus() is target
+                target = self.first_visible_library_child()
+                matched = target is not None and self.library_child_has_focus(target)
 
                 if matched and attempts["n"] >= 3:
                     return False
@@ -1569,10 +1656,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             self.flowbox.invalidate_filter()
 
             self.flowbox.unselect_all()
-            for child in widget_children(self.flowbox):
-                if child.get_child_visible():
-                    self.flowbox.select_child(child)
-                    break
+            self.select_first_visible()
 
     def on_manage_categories_clicked(self, widget):
         dialog = Gtk.Dialog(title=_("Manage Categories"), transient_for=self)
@@ -1779,88 +1863,34 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
     def _count_games_in_category(self, category_name):
         if category_name == _("All"):
             return len(self.games)
+        return len(self._games_in_category(category_name))
 
-        count = 0
-        for game in self.games:
-            raw_cat = game.category
-
-            if isinstance(raw_cat, str):
-                game_cats = [raw_cat]
-            elif isinstance(raw_cat, list):
-                game_cats = raw_cat
-            else:
-                game_cats = []
-
-            if category_name == _("Uncategorized"):
-                matches = not game_cats or game_cats == [_("None")]
-            else:
-                if not game_cats:
-                    game_cats = [_("None")]
-                matches = category_name in game_cats
-
-            if matches:
-                count += 1
-
-        return count
+    def _games_in_category(self, category_name):
+        if category_name == _("Uncategorized"):
+            return self.games.categories.members(None)
+        return self.games.categories.members(category_name)
 
     def _update_games_category(self, old_cat, new_cat):
+        affected = list(self._games_in_category(old_cat))
         try:
-            data = load_json_file(GAMES_JSON, [])
-            changed = False
-
-            for item in data:
-                raw_cat = item.get("category", [])
-                if isinstance(raw_cat, str) and raw_cat == old_cat:
-                    item["category"] = [new_cat]
-                    changed = True
-                elif isinstance(raw_cat, list) and old_cat in raw_cat:
-                    raw_cat = [new_cat if c == old_cat else c for c in raw_cat]
-                    item["category"] = list(dict.fromkeys(raw_cat))
-                    changed = True
-
-            if changed:
-                save_json_file(data, GAMES_JSON)
-                for flowbox_child in widget_children(self.flowbox):
-                    if hasattr(flowbox_child, "game"):
-                        child_cat = getattr(flowbox_child.game, "category", [])
-                        if isinstance(child_cat, str) and child_cat == old_cat:
-                            flowbox_child.game.category = [new_cat]
-                        elif isinstance(child_cat, list) and old_cat in child_cat:
-                            child_cat = [new_cat if c == old_cat else c for c in child_cat]
-                            flowbox_child.game.category = list(dict.fromkeys(child_cat))
-        except Exception:
-            pass
+            get_game_repository().rename_category(old_cat, new_cat)
+        except OSError:
+            return
+
+        for game in affected:
+            game.category = [new_cat if c == old_cat else c for c in game.category_order]
+            self.games.reindex(game)
 
     def _remove_games_category(self, cat_to_remove):
+        affected = list(self._games_in_category(cat_to_remove))
         try:
-            data = load_json_file(GAMES_JSON, [])
-            changed = False
-
-            for item in data:
-                raw_cat = item.get("category", [])
-                if isinstance(raw_cat, str) and raw_cat == cat_to_remove:
-                    item.pop("category", None)
-                    changed = True
-                elif isinstance(raw_cat, list) and cat_to_remove in raw_cat:
-                    raw_cat.remove(cat_to_remove)
-                    if not raw_cat:
-                        item.pop("category", None)
-                    else:
-                        item["category"] = raw_cat
-                    changed = True
-
-            if changed:
-                save_json_file(data, GAMES_JSON)
-                for child in widget_children(self.flowbox):
-                    if hasattr(child, "game"):
-                        child_cat = getattr(child.game, "category", [])
-                        if isinstance(child_cat, str) and child_cat == cat_to_remove:
-                            child.game.category = []
-                        elif isinstance(child_cat, list) and cat_to_remove in child_cat:
-                            child_cat.remove(cat_to_remove)
-                            child.game.category = child_cat
-        except Exception:
-            pass
+            get_game_repository().remove_category(cat_to_remove)
+        except OSError:
+            return
+
+        for game in affected:
+            game.category = [c for c in game.category_order if c != cat_to_remove]
+            self.games.reindex(game)
 
     def show_power_menu(self, widget):
         dialog = Gtk.Dialog(title="Faugus", transient_for=self)
@@ -1913,14 +1943,11 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         label_menu_title.add_css_class("heading")
         label_menu_title.set_margin_bottom(4)
 
-        data = load_json_file(GAMES_JSON, [])
-
         formatted = None
-        for item_data in data:
-            if isinstance(item_data, dict) and item_data.get("gameid") == game.gameid:
-                game.playtime = item_data.get("playtime", 0)
-                formatted = self.format_playtime(game.playtime)
-                break
+        repository = get_game_repository()
+        if repository.get(game.gameid) is not None:
+            game.playtime = repository.playtime(game.gameid)
+            formatted = self.format_playtime(game.playtime)
 
         label_menu_playtime = Gtk.Label(label=formatted or "")
         label_menu_playtime.set_halign(Gtk.Align.START)
@@ -1953,16 +1980,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
         categories.insert(0, _("None"))
 
-        raw_cat = getattr(game, 'category', [])
-        if isinstance(raw_cat, str):
-            current_cats = [raw_cat]
-        elif isinstance(raw_cat, list):
-            current_cats = raw_cat
-        else:
-            current_cats = []
-
-        if not current_cats:
-            current_cats = [_("None")]
+        current_cats = game.category or {_("None")}
 
         category_menu = Gio.Menu()
         for cat in categories:
@@ -2119,7 +2137,8 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         if not item:
             return
 
-        self.flowbox.emit('child-activated', item)
+        if not isinstance(self.flowbox, LibraryView):
+            self.flowbox.emit('child-activated', item)
         self.flowbox.select_child(item)
 
         game = self.selected()
@@ -2128,10 +2147,11 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             self.context_menu.popdown()
             self.context_menu.unparent()
 
+        anchor = getattr(item, "widget", None) or item
         self.context_menu = self.build_context_menu(game)
-        self.context_menu.set_parent(item)
+        self.context_menu.set_parent(anchor)
         if x is not None and y is not None:
-            translated = self.flowbox.translate_coordinates(item, x, y)
+            translated = self.library_widget().translate_coordinates(anchor, x, y)
             if translated is not None:
                 ix, iy = translated
                 rect = Gdk.Rectangle()
@@ -2139,7 +2159,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
                 self.context_menu.set_pointing_to(rect)
         else:
             rect = Gdk.Rectangle()
-            rect.x, rect.y, rect.width, rect.height = 0, 0, item.get_width() or 1, 1
+            rect.x, rect.y, rect.width, rect.height = 0, 0, anchor.get_width() or 1, 1
             self.context_menu.set_pointing_to(rect)
         self.context_menu.popup()
 
@@ -2205,19 +2225,13 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         if not game:
             return
 
+        def toggle_hidden(item):
+            item["hidden"] = not item.get("hidden", False)
+            game.hidden = item["hidden"]
+
         try:
-            data = load_json_file_or_none(GAMES_JSON)
-            if data is None:
+            if get_game_repository().update(game.gameid, toggle_hidden) is None:
                 return
-
-            for item in data:
-                if item.get("gameid") == game.gameid:
-                    item["hidden"] = not item.get("hidden", False)
-                    game.hidden = item["hidden"]
-                    break
-
-            save_json_file(data, GAMES_JSON)
-
         except Exception:
             return
 
@@ -2237,42 +2251,28 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         self.context_menu.popdown()
         if not selected_gameid:
             return
-        try:
-            data = load_json_file_or_none(GAMES_JSON)
-            if data is None:
-                return
-
-            for item in data:
-                if item.get("gameid") == selected_gameid:
-                    raw_cat = item.get("category", [])
-                    if isinstance(raw_cat, str):
-                        current_cats = [raw_cat]
-                    elif isinstance(raw_cat, list):
-                        current_cats = raw_cat.copy()
-                    else:
-                        current_cats = []
-
-                    if category_name == _("None"):
-                        current_cats = []
-                    else:
-                        if category_name in current_cats:
-                            current_cats.remove(category_name)
-                        else:
-                            current_cats.append(category_name)
+        def toggle_category(item):
+            current_cats = normalize_categories(item.get("category"))
 
-                    if not current_cats:
-                        item.pop("category", None)
-                    else:
-                        item["category"] = current_cats
+            if category_name == _("None"):
+                current_cats = []
+            else:
+                if category_name in current_cats:
+                    current_cats.remove(category_name)
+                else:
+                    current_cats.append(category_name)
 
-                    for child in widget_children(self.flowbox):
-                        if hasattr(child, "game") and child.game.gameid == selected_gameid:
-                            child.game.category = current_cats if current_cats else None
-                            break
-                    break
+            if not current_cats:
+                item.pop("category", None)
+            else:
+                item["category"] = current_cats
 
-            save_json_file(data, GAMES_JSON)
+            game.category = current_cats if current_cats else None
+            self.games.reindex(game)
 
+        try:
+            if get_game_repository().update(selected_gameid, toggle_category) is None:
+                return
         except Exception:
             return
 
@@ -2282,9 +2282,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
         target_child = None
         first_visible = None
-        for child in widget_children(self.flowbox):
-            if not child.get_child_visible():
-                continue
+        for child in self.visible_library_children():
             if first_visible is None:
                 first_visible = child
             if hasattr(child, "game") and child.game.gameid == selected_gameid:
@@ -2535,8 +2533,6 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             shutil.copyfile(expand_path(game.addapp_bat), new_addapp_bat)
 
         game_dict = game_to_dict(game)
-        if isinstance(game_dict["category"], list):
-            game_dict["category"] = list(game_dict["category"])
         game_dict["gameid"] = title_formatted
         game_dict["title"] = new_title
         game_dict["icon"] = new_icon
@@ -2547,6 +2543,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
         self.games.append(new_game)
         self.save_games()
+        self.prime_artwork_colors(new_game)
 
         self.add_item_list(new_game)
         self.flowbox.invalidate_sort()
@@ -2611,15 +2608,10 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         title = game.title
 
         child = self.flowbox.get_selected_children()[0]
-        current_focus = self.get_focus()
 
-        if not child.is_focus():
+        if not self.library_child_has_focus(child):
             return False
 
-        if keyval in (Gdk.KEY_Up, Gdk.KEY_Down, Gdk.KEY_Left, Gdk.KEY_Right):
-            if current_focus not in widget_children(self.flowbox):
-                child.grab_focus()
-
         if keyval == Gdk.KEY_Return:
             if gameid in self.running:
                 self.running_dialog(title)
@@ -2660,9 +2652,10 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         self.sort = cfg.config.get('sort', '')
         self.category = cfg.config.get('category', '')
         self.steam_user = cfg.config.get('steam-user', 'all')
+        self.virtual_library = cfg.config.get('library-view', 'virtual').strip('"') != 'flowbox'
 
     def load_games(self):
-        games_data = load_json_file(GAMES_JSON, [])
+        games_data = get_game_repository().games()
 
         self.games.clear()
         for game_data in games_data:
@@ -2673,20 +2666,29 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
             self.games.append(game)
 
-        self.games = sorted(self.games, key=lambda x: x.title.lower())
+        self.games.sort(key=lambda x: x.title_key)
 
         w = self.get_focus()
         while w is not None:
-            if w is self.flowbox:
+            if w is self.library_widget():
                 self.set_focus(None)
                 break
             w = w.get_parent()
 
+        self.artwork_loader.cancel_all()
         self.flowbox.remove_all()
         self.populate_flowbox_incremental()
 
+        if self.background_mode == "dominant_color":
+            self.prime_artwork_colors(*self.games)
+
     def populate_flowbox_incremental(self, batch_size=8):
-        games_iter = iter(self.games)
+        if isinstance(self.flowbox, LibraryView):
+            self._flowbox_populate_generation = None
+            self.flowbox.splice(self.games)
+            return
+
+        games_iter = iter(sorted(self.games, key=self.library_sort_key()))
 
         generation = object()
         self._flowbox_populate_generation = generation
@@ -2716,17 +2718,31 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
         self._zoom_apply_source = GLib.timeout_add(150, fire)
 
+    def resize_cover_artwork(self, zoom_pct):
+        if not hasattr(self, 'flowbox') or self.interface_mode not in ("Covers", "SteamGridDB"):
+            return
+
+        zoom_width = int(COVER_WIDTH * (zoom_pct / 100.0))
+        zoom_height = int(zoom_width * 1.5)
+
+        for child in self.library_tiles():
+            paintable = child.cover.get_paintable() if hasattr(child, 'cover') else None
+            if isinstance(paintable, HiDpiPaintable):
+                paintable.set_size(zoom_width, zoom_height)
+
     def apply_zoom_incremental(self, zoom_pct, batch_size=15):
         if not hasattr(self, 'flowbox') or self.interface_mode not in ("Covers", "SteamGridDB"):
             return
 
-        children_iter = iter(widget_children(self.flowbox))
+        children_iter = iter(self.library_tiles())
 
         generation = object()
         self._zoom_apply_generation = generation
 
-        zoom_width = int(230 * (zoom_pct / 100.0))
+        zoom_width = int(COVER_WIDTH * (zoom_pct / 100.0))
         zoom_height = int(zoom_width * 1.5)
+        level = cover_level(zoom_width)
+        self.artwork_loader.reprioritize()
 
         def step():
             if getattr(self, '_zoom_apply_generation', None) is not generation:
@@ -2740,17 +2756,29 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
                 if not hasattr(child, 'game') or not child.game or not hasattr(child, 'cover'):
                     continue
 
-                game = child.game
-                surface = self.get_cover_paintable(game, zoom_width, zoom_height)
-                child.cover.set_paintable(surface)
+                if getattr(child.cover, 'artwork_level', None) == (level, widget_scale(child.cover)) and child.cover.get_paintable() is not None:
+                    continue
+
+                self.set_cover_artwork(child.cover, child.game, zoom_width, zoom_height)
 
             return True
 
         GLib.idle_add(step)
 
     def add_item_list(self, game):
-        zoom_pct = self.cover_size
+        if isinstance(self.flowbox, LibraryView):
+            self.flowbox.append(game)
+            return
+
+        flowbox_child = Gtk.FlowBoxChild()
+        flowbox_child.set_css_name("entry")
+        self.setup_game_tile(flowbox_child)
+        self.bind_game_tile(flowbox_child, game)
+
+        self.flowbox.append(flowbox_child)
+        self.setup_dnd_for_widget(flowbox_child)
 
+    def setup_game_tile(self, tile):
         if self.interface_mode == "List":
             hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
         if self.interface_mode == "Grid":
@@ -2759,11 +2787,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         if self.interface_mode in ("Covers", "SteamGridDB"):
             hbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
 
-        game_icon = game.icon
-        if not os.path.isfile(game_icon):
-            game_icon = FAUGUS_PNG
-
-        game_label = Gtk.Label.new(game.title)
+        game_label = Gtk.Label()
         game_label.add_css_class("game-label")
 
         if self.interface_mode in ("Grid", "Covers", "SteamGridDB"):
@@ -2773,24 +2797,20 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             game_label.set_max_width_chars(1)
             game_label.set_justify(Gtk.Justification.CENTER)
 
-        self.flowbox_child = Gtk.FlowBoxChild()
-        self.flowbox_child.game = game
-        self.flowbox_child.label = game_label
-        self.flowbox_child.hbox = hbox
-        self.flowbox_child.add_css_class("flowbox-entry")
-        self.flowbox_child.set_css_name("entry")
+        tile.label = game_label
+        tile.hbox = hbox
+        tile.add_css_class("flowbox-entry")
 
         anim_box = Gtk.Box()
         anim_box.add_css_class("launch-overlay")
         anim_box.set_hexpand(True)
         anim_box.set_vexpand(True)
-        self.flowbox_child.anim_box = anim_box
+        tile.anim_box = anim_box
 
         if self.interface_mode == "List":
-            surface = self.get_game_artwork(game_icon, game, 40, 40)
-            image = new_picture(surface)
+            image = new_picture()
 
-            self.flowbox_child.image = image
+            tile.image = image
 
             image.set_margin_start(10)
             image.set_margin_end(10)
@@ -2805,21 +2825,19 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             hbox.append(image)
             hbox.append(game_label)
 
-            self.flowbox_child.set_size_request(300, -1)
-            self.flowbox.set_homogeneous(True)
-            self.flowbox_child.set_valign(Gtk.Align.START)
-            self.flowbox_child.set_halign(Gtk.Align.FILL)
+            tile.set_size_request(300, -1)
+            if not self.virtual_library:
+                self.flowbox.set_homogeneous(True)
+            tile.set_valign(Gtk.Align.START)
+            tile.set_halign(Gtk.Align.FILL)
 
         if self.interface_mode == "Grid":
-            self.flowbox_child.set_hexpand(True)
-            self.flowbox_child.set_vexpand(True)
+            tile.set_hexpand(True)
+            tile.set_vexpand(True)
 
-            block_size = 100
+            image = new_picture()
 
-            surface = self.get_game_artwork(game_icon, game, block_size, block_size)
-            image = new_picture(surface)
-
-            self.flowbox_child.image = image
+            tile.image = image
 
             image.set_margin_top(10)
             game_label.set_margin_top(10)
@@ -2832,38 +2850,32 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             game_label.set_valign(Gtk.Align.CENTER)
             hbox.append(game_label)
 
-            self.flowbox_child.set_valign(Gtk.Align.FILL)
-            self.flowbox_child.set_halign(Gtk.Align.FILL)
+            tile.set_valign(Gtk.Align.FILL)
+            tile.set_halign(Gtk.Align.FILL)
 
         if self.interface_mode in ("Covers", "SteamGridDB"):
-            self.flowbox_child.add_css_class("cover-container")
-            self.flowbox_child.set_hexpand(True)
-            self.flowbox_child.set_vexpand(True)
+            tile.add_css_class("cover-container")
+            tile.set_hexpand(True)
+            tile.set_vexpand(True)
 
             image2 = new_picture()
-            self.flowbox_child.cover = image2
+            tile.cover = image2
 
             game_label.set_size_request(-1, 50)
             game_label.set_margin_start(10)
             game_label.set_margin_end(10)
 
-            self.flowbox_child.set_margin_start(10)
-            self.flowbox_child.set_margin_end(10)
-            self.flowbox_child.set_margin_top(10)
-            self.flowbox_child.set_margin_bottom(10)
+            tile.set_margin_start(10)
+            tile.set_margin_end(10)
+            tile.set_margin_top(10)
+            tile.set_margin_bottom(10)
 
-            self.flowbox_child.set_valign(Gtk.Align.FILL)
-            self.flowbox_child.set_halign(Gtk.Align.FILL)
-
-            zoom_width = int(230 * (zoom_pct / 100.0))
-            zoom_height = int(zoom_width * 1.5)
-
-            surface = self.get_cover_paintable(game, zoom_width, zoom_height)
-            image2.set_paintable(surface)
+            tile.set_valign(Gtk.Align.FILL)
+            tile.set_halign(Gtk.Align.FILL)
 
             hbox.append(image2)
 
-            self.flowbox_child.set_overflow(Gtk.Overflow.HIDDEN)
+            tile.set_overflow(Gtk.Overflow.HIDDEN)
 
             game_label.set_visible(self.labels_enabled)
             game_label.set_vexpand(True)
@@ -2885,100 +2897,277 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         overlay.set_measure_overlay(hbox, True)
         overlay.add_overlay(anim_box)
         anim_box.set_can_target(False)
-        self.flowbox_child.set_child(overlay)
 
-        self.flowbox.append(self.flowbox_child)
-        self.setup_dnd_for_widget(self.flowbox_child)
+        if isinstance(tile, Gtk.FlowBoxChild):
+            tile.set_child(overlay)
+        else:
+            overlay.set_hexpand(True)
+            tile.append(overlay)
+            self.setup_dnd_for_widget(tile)
+
+    def bind_game_tile(self, tile, game):
+        tile.game = game
+        tile.label.set_text(game.title)
+        self.update_game_visual(tile)
 
     def update_game_visual(self, flowbox_child):
         game = flowbox_child.game
 
+        installed = self.is_game_installed(game)
+
         if hasattr(flowbox_child, "image"):
             game_icon = game.icon
             if not os.path.isfile(game_icon):
                 game_icon = FAUGUS_PNG
 
-            if self.interface_mode == "List":
-                surface = self.get_game_artwork(game_icon, game, 40, 40)
-            else:
-                surface = self.get_game_artwork(game_icon, game, 100, 100)
-
-            flowbox_child.image.set_paintable(surface)
+            size = 40 if self.interface_mode == "List" else 100
+            self.set_tile_artwork(flowbox_child.image, game_icon, size, size, installed)
 
         if hasattr(flowbox_child, "cover"):
             zoom_pct = getattr(self, "cover_size", 100)
-            zoom_width = int(230 * (zoom_pct / 100.0))
+            zoom_width = int(COVER_WIDTH * (zoom_pct / 100.0))
             zoom_height = int(zoom_width * 1.5)
 
-            surface = self.get_cover_paintable(game, zoom_width, zoom_height)
-            flowbox_child.cover.set_paintable(surface)
+            self.set_cover_artwork(flowbox_child.cover, game, zoom_width, zoom_height, installed)
+
+    def unbind_game_tile(self, tile):
+        for part in ("image", "cover"):
+            if hasattr(tile, part):
+                self.artwork_loader.cancel(getattr(tile, part))
+
+    def prime_artwork_colors(self, *games):
+        paths = []
+        for game in games:
+            for path in (f"{COVERS_DIR}/{game.gameid}.png", f"{ICONS_DIR}/{game.gameid}.png"):
+                if os.path.isfile(path):
+                    paths.append(path)
+        if paths:
+            run_in_background(get_color_cache().prime, paths)
+
+    def missing_artwork(self, game):
+        categories = []
+        if not os.path.isfile(f"{COVERS_DIR}/{game.gameid}.png"):
+            categories.append("cover")
+        if not os.path.isfile(f"{BANNERS_DIR}/{game.gameid}.png"):
+            categories.append("banner")
+        if not os.path.isfile(game.icon):
+            categories.append("icon")
+        return categories
+
+    def steam_artwork_sources(self, games):
+        sources = []
+        for game in games:
+            if game.runner != "Steam" or not game.path:
+                continue
+            categories = [c for c in self.missing_artwork(game) if c in STEAM_ARTWORK_ASSETS]
+            found = get_steam_library_artwork(game.path, categories) if categories else {}
+            if found:
+                sources.append((game, found))
+        return sources
+
+    def copy_steam_artwork(self, sources):
+        sizes = {"cover": (460, 690), "banner": (1920, 620)}
+        for game, found in sources:
+            for category, source in found.items():
+                width, height = sizes[category]
+                directory = COVERS_DIR if category == "cover" else BANNERS_DIR
+                path = f"{directory}/{game.gameid}.png"
+                try:
+                    resize_image_file(source, path, width, height)
+                except Exception as e:
+                    print(f"Faugus Launcher: failed to import Steam {category} for '{game.title}' ({e})")
+                    continue
+                GLib.idle_add(self.on_artwork_fetched, game, category, path)
 
-    def get_game_artwork(self, path, game, width=None, height=None):
-        w = width * HIDPI_SCALE if width else None
-        h = height * HIDPI_SCALE if height else None
+    def import_steam_artwork(self, games=None):
+        games = list(self.games if games is None else games)
+        run_in_background(lambda: self.copy_steam_artwork(self.steam_artwork_sources(games)))
+        return False
 
-        pixbuf = safe_load_pixbuf(path, w, h, False)
+    def fetch_missing_artwork(self, api_key, on_progress=None):
+        job = getattr(self, 'artwork_job', None)
+        if job is not None or not api_key:
+            return job
 
-        if not self.is_game_installed(game):
-            pixbuf.saturate_and_pixelate(pixbuf, 0.0, False)
+        sources = self.steam_artwork_sources(self.games)
+        local = {game.gameid for game, found in sources}
 
-        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+        games = {}
+        targets = []
+        for game in self.games:
+            categories = self.missing_artwork(game)
+            if not categories:
+                continue
+            games[game.gameid] = game
+            targets.append({
+                "gameid": game.gameid,
+                "title": game.title,
+                "steamgriddb_id": getattr(game, "steamgriddb_id", "") or None,
+                "steam_appid": game.path if game.runner == "Steam" else None,
+                "categories": categories,
+            })
+
+        os.makedirs(FAUGUS_TEMP, exist_ok=True)
+
+        def store(target, category, content):
+            gameid = target["gameid"]
+            temp_path = os.path.join(FAUGUS_TEMP, f"artwork-{gameid}-{category}")
+            if category == "icon":
+                content = resize_icon_bytes(normalize_icon_bytes(content), 256)
+            if not is_valid_image_bytes(content):
+                print(f"SteamGridDB: {category} for '{target['title']}' is corrupted, ignoring.")
+                return
+            with open(temp_path, "wb") as f:
+                f.write(content)
+            try:
+                if category == "cover":
+                    path = f"{COVERS_DIR}/{gameid}.png"
+                    resize_image_file(temp_path, path, 460, 690)
+                elif category == "banner":
+                    path = f"{BANNERS_DIR}/{gameid}.png"
+                    resize_image_file(temp_path, path, 1920, 620)
+                else:
+                    path = f"{ICONS_DIR}/{gameid}.png"
+                    shutil.copyfile(temp_path, path)
+            finally:
+                os.remove(temp_path)
+            GLib.idle_add(self.on_artwork_fetched, games[gameid], category, path)
 
-        if width and height:
-            return HiDpiPaintable(texture, width, height)
-        return texture
+        def progress(job, done, total):
+            if on_progress is not None:
+                GLib.idle_add(on_progress, job, done, total)
 
-    def get_cover_texture(self, path, installed):
-        if not hasattr(self, '_cover_texture_cache'):
-            self._cover_texture_cache = {}
+        def worker():
+            if sources:
+                self.copy_steam_artwork(sources)
+                for target in job.targets:
+                    if target["gameid"] in local:
+                        missing = self.missing_artwork(games[target["gameid"]])
+                        target["categories"] = [c for c in target["categories"] if c in missing]
+                job.targets = [target for target in job.targets if target["categories"]]
+                job.total = len(job.targets)
+            job.run()
+            GLib.idle_add(finished)
+
+        def finished():
+            self.artwork_job = None
+            print(
+                f"SteamGridDB: fetched {job.fetched} artwork(s), "
+                f"{job.missing} not found, {job.failed} game(s) failed"
+            )
+            return False
 
-        try:
-            mtime = os.path.getmtime(path)
-        except OSError:
-            mtime = None
+        job = ArtworkJob(SteamGridDBClient(api_key), targets, store, progress)
+        self.artwork_job = job
+        run_in_background(worker)
+        return job
 
-        cache_key = (path, mtime, installed)
-        texture = self._cover_texture_cache.get(cache_key)
-        if texture is not None:
-            return texture
+    def on_artwork_fetched(self, game, category, path):
+        forget_artwork(path)
 
-        for key in [k for k in self._cover_texture_cache if k[0] == path]:
-            del self._cover_texture_cache[key]
+        if category in ("cover", "icon"):
+            def change(entry):
+                entry[category] = path
+            setattr(game, category, path)
+            get_game_repository().update(game.gameid, change)
+            self.prime_artwork_colors(game)
 
-        pixbuf = safe_load_pixbuf(path, None, None, False)
-        if not installed:
-            pixbuf.saturate_and_pixelate(pixbuf, 0.0, False)
+        child = self.library_tile(self.find_flowbox_child_for_game(game))
+        if child is not None and (hasattr(child, "image") or hasattr(child, "cover")):
+            self.update_game_visual(child)
+
+        if self.selected() is game:
+            self.schedule_background_update()
+        return False
 
-        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-        self._cover_texture_cache[cache_key] = texture
-        return texture
+    def set_tile_artwork(self, picture, path, width, height, installed, load_size=None, placeholder=None):
+        load_width, load_height = load_size or (width, height)
 
-    def get_cover_paintable(self, game, width, height):
+        def on_ready(texture):
+            picture.set_paintable(HiDpiPaintable(texture, width, height, greyscale=not installed))
+
+        self.artwork_loader.request(
+            picture, path, load_width, load_height, on_ready,
+            placeholder=placeholder or (lambda: create_accent_placeholder_paintable(width, height))
+        )
+
+    def set_cover_artwork(self, picture, game, width, height, installed=None):
+        picture.artwork_level = None
         if not os.path.isfile(game.cover):
-            return create_accent_placeholder_paintable(width, height)
+            self.artwork_loader.cancel(picture)
+            picture.set_paintable(create_accent_placeholder_paintable(width, height))
+            return
 
-        texture = self.get_cover_texture(game.cover, self.is_game_installed(game))
-        return HiDpiPaintable(texture, width, height)
+        if installed is None:
+            installed = self.is_game_installed(game)
+
+        level = cover_level(width)
+        scale = widget_scale(picture)
+        nearest = sorted((l for l in COVER_LEVELS if l != level), key=lambda l: abs(l - level))
+
+        def placeholder():
+            texture = peek_nearest(game.cover, [cover_level_size(l) for l in nearest], scale)
+            if texture is None:
+                return create_accent_placeholder_paintable(width, height)
+            return HiDpiPaintable(texture, width, height, greyscale=not installed)
+
+        picture.artwork_level = (level, scale)
+        self.set_tile_artwork(
+            picture, game.cover, width, height, installed, cover_level_size(level), placeholder
+        )
+
+    def on_steam_library_changed(self, changed):
+        appids = {appid for appid, _ in changed}
+        names = {name.lower() for _, name in changed if name}
+        for child in self.library_tiles():
+            game = getattr(child, 'game', None)
+            if game is None or game.runner != "Steam":
+                continue
+            if game.path in appids or game.title_key in names:
+                self.update_game_visual(child)
 
     def is_game_installed(self, game):
         if game.runner == "Steam":
-            for appid, name in read_installed_games(getattr(game, 'steam_user', '') or None):
-                if hasattr(game, "appid") and str(game.appid) == str(appid):
-                    return True
-                if game.title.lower() == name.lower():
-                    return True
-            return False
+            return get_steam_library_index().is_installed(
+                game.path or None, game.title_key, getattr(game, 'steam_user', '') or None
+            )
 
         return os.path.exists(expand_path(game.path))
 
+    def search_matches(self, search_text):
+        search_text = search_text.strip()
+        if not search_text:
+            return None
+        index = get_game_repository().search_index()
+        key = (search_text, index.version)
+        cached = getattr(self, "_search_matches", None)
+        if cached is None or cached[0] != key:
+            results = index.search(search_text, recent=self.latest_games_order)
+            cached = (key, {gameid for gameid, _ in results})
+            self._search_matches = cached
+        return cached[1]
+
+    def fetch_library_suggestions(self, term):
+        repository = get_game_repository()
+        titles = repository.titles()
+        return [
+            {"label": titles[gameid], "value": gameid}
+            for gameid, _ in repository.search(term, limit=10)
+            if gameid in titles
+        ]
+
+    def on_library_suggestion_selected(self, gameid):
+        title = get_game_repository().titles().get(gameid)
+        if title is None:
+            return
+        self.entry_search.set_text(title)
+        self.select_game_by_title(title)
+
     def on_search_changed(self, entry):
         self.flowbox.invalidate_filter()
 
         self.flowbox.unselect_all()
-        for child in widget_children(self.flowbox):
-            if child.get_child_visible():
-                self.flowbox.select_child(child)
-                break
+        self.select_first_visible()
 
     def on_search_activate(self, entry):
         game = self.selected()
@@ -3165,8 +3354,8 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             return
 
         selected = self.flowbox.get_selected_children()
-        if selected:
-            child = selected[0]
+        child = self.library_tile(selected[0]) if selected else None
+        if child is not None:
             self.update_game_visual(child)
 
             if hasattr(child, 'anim_box') and child.anim_box:
@@ -3182,14 +3371,11 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         cwd = game_directory if game_directory and os.path.isdir(game_directory) else None
 
         def update_latest_and_sort():
-            self.update_latest_games_file(game.gameid)
+            self.update_latest_games_file(game)
             if hasattr(self, 'current_sort') and self.current_sort == self.opt_lastplayed:
                 self.latest_games_order.clear()
-                try:
-                    for idx, gid in enumerate(load_json_file(LATEST_GAMES, default=[])):
-                        self.latest_games_order[gid.strip()] = idx
-                except:
-                    pass
+                for idx, gid in enumerate(get_game_repository().recent_games()):
+                    self.latest_games_order[gid] = idx
                 if hasattr(self, 'flowbox'):
                     self.flowbox.invalidate_sort()
 
@@ -3241,28 +3427,15 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         self.save_running()
 
         if hasattr(self, 'current_sort') and hasattr(self, 'opt_playtime') and self.current_sort == self.opt_playtime:
-            try:
-                data = load_json_file(GAMES_JSON, [])
-                for item in data:
-                    if isinstance(item, dict) and "gameid" in item:
-                        self.playtime_data[item["gameid"]] = item.get("playtime", 0)
-            except:
-                pass
+            self.playtime_data.update(get_game_repository().playtimes())
 
             if hasattr(self, 'flowbox'):
                 GLib.idle_add(self.flowbox.invalidate_sort)
 
         GLib.idle_add(self.update_icon)
 
-    def update_latest_games_file(self, gameid):
-        games = load_json_file(LATEST_GAMES, default=[])
-
-        valid_ids = {g.gameid for g in self.games}
-
-        games = [g for g in games if g in valid_ids and g != gameid]
-        games.insert(0, gameid)
-
-        save_json_file(games, LATEST_GAMES)
+    def update_latest_games_file(self, game):
+        get_session_journal().record_launch(game.gameid, game.runner)
         self.notify_tray_menu_changed()
 
     def on_button_kill_clicked(self, widget):
@@ -3497,12 +3670,10 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             self.select_first_child_when_ready()
 
     def reload_playtimes(self):
-        games_data = load_json_file(GAMES_JSON, [])
-        if not games_data:
+        playtime_map = get_game_repository().playtimes()
+        if not playtime_map:
             return
 
-        playtime_map = {g["gameid"]: g.get("playtime", 0) for g in games_data}
-
         for game in self.games:
             if game.gameid in playtime_map:
                 game.playtime = playtime_map[game.gameid]
@@ -3532,22 +3703,13 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
                     pass
 
     def remove_latest_and_order(self, gameid):
-        try:
-            recent_games = load_json_file(LATEST_GAMES, default=[])
-
-            if gameid in recent_games:
-                recent_games.remove(gameid)
+        repository = get_game_repository()
 
-                save_json_file(recent_games, LATEST_GAMES)
-                self.notify_tray_menu_changed()
-
-        except FileNotFoundError:
-            pass
+        if repository.remove_recent(gameid):
+            self.notify_tray_menu_changed()
 
-        custom_order_data = load_json_file(CUSTOM_ORDER, default={})
-        if gameid in custom_order_data:
-            del custom_order_data[gameid]
-            save_json_file(custom_order_data, CUSTOM_ORDER)
+        repository.remove_custom_order(gameid)
+        get_session_journal().forget(gameid)
 
     def show_warning_dialog_main(self, parent, text1, text2, callback=None):
         show_message_dialog(text1, text2, parent=parent, callback=callback)
@@ -3558,6 +3720,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
         def destroy_add_game_dialog():
             add_game_dialog.closed_event.set()
+            add_game_dialog.title_autocomplete.cancel()
             destroy_and_release(add_game_dialog)
 
         if response_id == Gtk.ResponseType.OK:
@@ -3571,9 +3734,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             else:
                 title = add_game_dialog.combobox_launcher.get_active_text()
 
-            games = load_json_file(GAMES_JSON, [])
-
-            if any(game.get("title", "").casefold() == title.casefold() for game in games):
+            if get_game_repository().find_title(title) is not None:
                     self.show_warning_dialog_main(
                         add_game_dialog,
                         _("%s already exists") % title,
@@ -3747,6 +3908,9 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
                 self.select_game_by_title(title)
 
+            self.prime_artwork_colors(game)
+            self.import_steam_artwork([game])
+
         else:
             if os.path.isfile(add_game_dialog.icon_temp):
                 os.remove(add_game_dialog.icon_temp)
@@ -3862,8 +4026,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
             self.box_main.remove(self.box_launcher_display)
             self.launcher_banner_base_box = None
             self.launcher_banner_base_provider = None
-            self.launcher_banner_image_box = None
-            self.launcher_banner_provider = None
+            self.launcher_banner_view = None
             self.launcher_banner_path = None
             self.launcher_banner_dominant_rgb = None
             if self.interface_mode != "List":
@@ -4081,9 +4244,10 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
                 write_addapp_bat(game.addapp_bat, game.path, game.addapp, game.addapp_delay, game.addapp_first, game.game_arguments)
 
             self.save_games()
+            self.prime_artwork_colors(game)
 
-            edited_child = self.find_flowbox_child_for_game(game)
-            if edited_child is not None:
+            edited_child = self.library_tile(self.find_flowbox_child_for_game(game))
+            if edited_child is not None and hasattr(edited_child, "label"):
                 edited_child.label.set_text(game.title)
                 self.update_game_visual(edited_child)
 
@@ -4099,6 +4263,7 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         if os.path.isfile(edit_game_dialog.cover_path_temp):
             os.remove(edit_game_dialog.cover_path_temp)
         edit_game_dialog.closed_event.set()
+        edit_game_dialog.title_autocomplete.cancel()
         destroy_and_release(edit_game_dialog)
 
     def add_shortcut(self, game, shortcut_state, shortcut, icon_temp, icon_final):
@@ -4293,6 +4458,9 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
         cover_file_path = f"{COVERS_DIR}/{game.gameid}.png"
         icon_file_path = f"{ICONS_DIR}/{game.gameid}.png"
         banner_file_path = f"{BANNERS_DIR}/{game.gameid}.png"
+        for path in (cover_file_path, icon_file_path, banner_file_path, game.cover, game.icon):
+            if path:
+                forget_artwork(path)
         if os.path.exists(cover_file_path):
             os.remove(cover_file_path)
         if os.path.exists(icon_file_path):
@@ -4319,10 +4487,9 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
     def apply_show_hidden_change(self):
         if self.show_hidden:
             existing_ids = {g.gameid for g in self.games}
-            games_data = load_json_file(GAMES_JSON, [])
 
-            for game_data in games_data:
-                if game_data.get("hidden") and game_data.get("gameid") not in existing_ids:
+            for game_data in get_game_repository().hidden():
+                if game_data.get("gameid") not in existing_ids:
                     game = Game(**prepare_game_kwargs(game_data))
                     self.games.append(game)
                     self.add_item_list(game)
@@ -4336,17 +4503,16 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
                 self.games.remove(game)
 
     def save_games(self):
-        all_games_data = load_json_file_or_none(GAMES_JSON)
-        if all_games_data is None:
+        repository = get_game_repository()
+        if not repository.is_readable():
             return
 
         deleted_id = getattr(self, "_deleted_gameid", None)
         visible_ids = {game.gameid for game in self.games}
 
         hidden_games_data = [
-            game_data for game_data in all_games_data
-            if game_data.get("hidden", False)
-            and game_data.get("gameid") not in visible_ids
+            game_data for game_data in repository.hidden()
+            if game_data.get("gameid") not in visible_ids
             and game_data.get("gameid") != deleted_id
         ]
 
@@ -4360,10 +4526,11 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
 
         self.backup_games()
 
-        save_json_file(new_games_data, GAMES_JSON)
+        repository.save(new_games_data)
 
     def backup_games(self):
-        if os.path.isfile(GAMES_JSON):
+        repository = get_game_repository()
+        if repository.backend == "sqlite" or os.path.isfile(GAMES_JSON):
             os.makedirs(BACKUP_DIR, exist_ok=True)
 
             now = GLib.DateTime.new_now_local()
@@ -4374,7 +4541,10 @@ class Main(Gtk.ApplicationWindow, HiDpiMixin):
                 f"games-data-{timestamp}.json"
             )
 
-            shutil.copy2(GAMES_JSON, backup_file)
+            if repository.backend == "sqlite":
+                save_json_file(repository.games(), backup_file)
+            else:
+                shutil.copy2(GAMES_JSON, backup_file)
 
             backups = sorted(
                 f for f in os.listdir(BACKUP_DIR)
@@ -4589,6 +4759,9 @@ class Settings(Gtk.Dialog):
 
         self.entry_steamgriddb_key = Gtk.Entry()
 
+        self.button_fetch_artwork = Gtk.Button(label=_("Fetch Missing Artwork"))
+        self.button_fetch_artwork.connect("clicked", self.on_button_fetch_artwork_clicked)
+
         self.label_default_prefix = Gtk.Label(label=_("Default Prefixes Location"))
         self.label_default_prefix.set_halign(Gtk.Align.START)
 
@@ -4883,6 +5056,7 @@ class Settings(Gtk.Dialog):
         self.grid_big_interface.attach(self.checkbox_labels, 0, 4, 1, 1)
         self.grid_big_interface.attach(self.checkbox_banner, 1, 4, 1, 1)
         self.grid_big_interface.attach(self.checkbox_zoom, 0, 5, 1, 1)
+        self.grid_big_interface.attach(self.button_fetch_artwork, 0, 6, 2, 1)
         self.combobox_startup_window_size.set_hexpand(True)
         self.entry_steamgriddb_key.set_hexpand(True)
 
@@ -5038,6 +5212,7 @@ class Settings(Gtk.Dialog):
             self.checkbox_zoom.set_visible(False)
             self.label_steamgriddb_key.set_visible(False)
             self.entry_steamgriddb_key.set_visible(False)
+            self.button_fetch_artwork.set_visible(False)
             self.checkbox_banner.set_visible(False)
         if active_id == "Covers":
             self.grid_big_interface.set_visible(True)
@@ -5045,6 +5220,7 @@ class Settings(Gtk.Dialog):
             self.checkbox_zoom.set_visible(True)
             self.label_steamgriddb_key.set_visible(False)
             self.entry_steamgriddb_key.set_visible(False)
+            self.button_fetch_artwork.set_visible(False)
             self.checkbox_banner.set_visible(False)
         if active_id == "SteamGridDB":
             self.grid_big_interface.set_visible(True)
@@ -5052,6 +5228,7 @@ class Settings(Gtk.Dialog):
             self.checkbox_zoom.set_visible(True)
             self.label_steamgriddb_key.set_visible(True)
             self.entry_steamgriddb_key.set_visible(True)
+            self.button_fetch_artwork.set_visible(True)
             self.checkbox_banner.set_visible(True)
 
     def on_theme_accent_changed(self, widget):
@@ -5317,6 +5494,26 @@ class Settings(Gtk.Dialog):
 
         self.check_modified(proceed)
 
+    def on_button_fetch_artwork_clicked(self, widget):
+        api_key = self.entry_steamgriddb_key.get_text().strip()
+        if not api_key:
+            self.entry_steamgriddb_key.add_css_class("entry")
+            return
+
+        button = self.button_fetch_artwork
+
+        def on_progress(job, done, total):
+            button.set_label(_("Fetching Artwork... %d/%d") % (done, total))
+            if done == total:
+                button.set_label(_("Fetch Missing Artwork"))
+                button.set_sensitive(True)
+            return False
+
+        job = self.parent.fetch_missing_artwork(api_key, on_progress)
+        if job is not None and job.total:
+            button.set_sensitive(False)
+            button.set_label(_("Fetching Artwork... %d/%d") % (job.done, job.total))
+
     def on_button_backup_clicked(self, widget):
         def proceed():
             from faugus.backup import BackupWindow
@@ -5394,6 +5591,12 @@ class Settings(Gtk.Dialog):
                         shutil.copy2(src, dst)
 
                 shutil.rmtree(temp_dir)
+
+                repository = get_game_repository()
+                if repository.backend == "sqlite":
+                    from faugus.library_db import import_json
+                    import_json(repository)
+
                 global faugus_backup
                 faugus_backup = True
                 self.response(Gtk.ResponseType.OK)
@@ -5550,6 +5753,20 @@ class Settings(Gtk.Dialog):
 
 
 class Game:
+    __slots__ = (
+        "gameid", "_title", "title_key", "path", "prefix",
+        "launch_arguments", "game_arguments",
+        "mangohud", "gamemode", "sdl_enabled",
+        "protonfix", "runner",
+        "addapp_enabled", "addapp", "addapp_bat", "addapp_delay", "addapp_first",
+        "cover",
+        "lossless_enabled", "lossless_multiplier", "lossless_flow",
+        "lossless_performance", "lossless_hdr", "lossless_present",
+        "playtime", "hidden", "no_sleep", "_category", "category_order", "icon",
+        "steamgriddb_id", "pre_launch", "post_launch",
+        "steam_user", "disable_umu",
+    )
+
     def __init__(
         self,
         gameid,
@@ -5620,6 +5837,52 @@ class Game:
         self.steam_user = steam_user
         self.disable_umu = disable_umu
 
+    @property
+    def title(self):
+        return self._title
+
+    @title.setter
+    def title(self, value):
+        self._title = value
+        self.title_key = value.lower()
+
+    @property
+    def category(self):
+        return self._category
+
+    @category.setter
+    def category(self, value):
+        self.category_order = tuple(dict.fromkeys(normalize_categories(value)))
+        self._category = frozenset(self.category_order)
+
+
+class GameList(list):
+    def __init__(self, games=(), none_label=None):
+        super().__init__()
+        self.categories = CategoryIndex(none_label)
+        self.extend(games)
+
+    def append(self, game):
+        super().append(game)
+        self.categories.set(game, game.category)
+
+    def extend(self, games):
+        for game in games:
+            self.append(game)
+
+    def remove(self, game):
+        super().remove(game)
+        if game not in self:
+            self.categories.discard(game)
+
+    def clear(self):
+        super().clear()
+        self.categories.clear()
+
+    def reindex(self, game):
+        if game in self.categories:
+            self.categories.set(game, game.category)
+
 
 class DuplicateDialog(Gtk.Dialog):
     def __init__(self, parent, title):
@@ -5926,7 +6189,7 @@ class AddGame(Gtk.Dialog, HiDpiMixin):
 
         self._steamgriddb_suggestion_id = None
         self._steamgriddb_steam_appid = None
-        self._suggestion_source = None
+        self.title_autocomplete = TitleAutocomplete()
         self._suggestion_programmatic = False
         self._virtual_keyboard_active_for_title = False
 
@@ -6735,9 +6998,13 @@ class AddGame(Gtk.Dialog, HiDpiMixin):
         if not is_valid_image_bytes(content):
             print(f"Downloaded {category} artwork is corrupted or incomplete, ignoring.")
             return False
+        target = {"cover": self.cover_path_temp, "banner": self.banner_path_temp, "icon": self.icon_temp}.get(category)
+        if target:
+            forget_artwork(target)
         if category == "cover":
             with open(self.cover_path_temp, "wb") as f:
                 f.write(content)
+            run_in_background(get_color_cache().prime, self.cover_path_temp)
             self.refresh_cover_preview()
         elif category == "banner":
             with open(self.banner_path_temp, "wb") as f:
@@ -6751,8 +7018,7 @@ class AddGame(Gtk.Dialog, HiDpiMixin):
 
     def update_banner_preview(self, banner_path):
         if banner_path and os.path.isfile(banner_path):
-            pixbuf = safe_load_pixbuf(banner_path, None, None, False)
-            texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+            texture = load_texture(banner_path)
             surface = HiDpiPaintable(texture, 480, 155)
             self.picture_banner1.set_paintable(surface)
             self.picture_banner2.set_paintable(surface)
@@ -6798,8 +7064,25 @@ class AddGame(Gtk.Dialog, HiDpiMixin):
                 fetch_sgdb_icon = bool(api_key) and interface_mode == "SteamGridDB"
                 fetch_sgdb_cover_banner = interface_mode == "SteamGridDB" and bool(api_key)
 
+                local = {}
+                if steam_appid and fetch_cover:
+                    categories = ["cover", "banner"] if interface_mode == "SteamGridDB" else ["cover"]
+                    for category, path in get_steam_library_artwork(steam_appid, categories).items():
+                        try:
+                            with open(path, "rb") as f:
+                                content = f.read()
+                        except OSError as e:
+                            print(f"Error reading Steam {category}: {e}")
+                            continue
+                        local[category] = path
+                        if not closed_event.is_set():
+                            GLib.idle_add(self.apply_downloaded_artwork, category, content)
+
+                fetch_sgdb_cover = fetch_sgdb_cover_banner and "cover" not in local
+                fetch_sgdb_banner = fetch_sgdb_cover_banner and "banner" not in local
+
                 icon_url = cover_url = banner_url = None
-                if fetch_sgdb_icon or fetch_sgdb_cover_banner:
+                if fetch_sgdb_icon or fetch_sgdb_cover or fetch_sgdb_banner:
                     session = get_steamgriddb_session()
                     candidates = fetch_steamgriddb_candidates(
                         api_key, game_name, limit=1, game_id=suggestion_id, steam_appid=steam_appid
@@ -6810,11 +7093,12 @@ class AddGame(Gtk.Dialog, HiDpiMixin):
                         if not icon_url:
                             print(f"SteamGridDB: no icon found for '{game_name}'")
 
-                    if fetch_sgdb_cover_banner:
+                    if fetch_sgdb_cover:
                         cover_url = candidates["grids"][0]["url"] if candidates["grids"] else None
-                        banner_url = candidates["heroes"][0]["url"] if candidates["heroes"] else None
                         if not cover_url:
                             print(f"SteamGridDB: no cover found for '{game_name}'")
+                    if fetch_sgdb_banner:
+                        banner_url = candidates["heroes"][0]["url"] if candidates["heroes"] else None
                         if not banner_url:
                             print(f"SteamGridDB: no banner found for '{game_name}'")
 
@@ -6839,17 +7123,17 @@ class AddGame(Gtk.Dialog, HiDpiMixin):
                             list(pool.map(download_one, downloads.keys()))
 
                 if fetch_sgdb_cover_banner:
-                    if not cover_url and os.path.isfile(cover_path_temp):
+                    if fetch_sgdb_cover and not cover_url and os.path.isfile(cover_path_temp):
                         os.remove(cover_path_temp)
                         if not closed_event.is_set():
                             GLib.idle_add(self.refresh_cover_preview)
-                    if not banner_url and os.path.isfile(banner_path_temp):
+                    if fetch_sgdb_banner and not banner_url and os.path.isfile(banner_path_temp):
                         os.remove(banner_path_temp)
                         if not closed_event.is_set():
                             GLib.idle_add(self.refresh_banner_preview)
                     return
 
-                if interface_mode not in ("Covers", "SteamGridDB"):
+                if interface_mode not in ("Covers", "SteamGridDB") or "cover" in local:
                     return
 
                 api_url = f"https://steamgrid.usebottles.com/api/search/{game_name}"
@@ -6877,8 +7161,7 @@ class AddGame(Gtk.Dialog, HiDpiMixin):
 
     def update_image_cover(self):
         if os.path.isfile(self.cover_path_temp):
-            pixbuf = safe_load_pixbuf(self.cover_path_temp, None, None, False)
-            texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+            texture = load_texture(self.cover_path_temp)
             surface = HiDpiPaintable(texture, 260, 390)
             self.image_cover.set_paintable(surface)
             self.image_cover2.set_paintable(surface)
@@ -6946,9 +7229,7 @@ class AddGame(Gtk.Dialog, HiDpiMixin):
         self._steamgriddb_suggestion_id = None
         self._steamgriddb_steam_appid = None
 
-        if self._suggestion_source:
-            GLib.source_remove(self._suggestion_source)
-            self._suggestion_source = None
+        self.title_autocomplete.cancel()
 
         text = entry.get_text().strip()
         if not text:
@@ -6965,27 +7246,12 @@ class AddGame(Gtk.Dialog, HiDpiMixin):
         listbox_suggestion = self.listbox_suggestion
         popover_suggestion = self.popover_suggestion
 
-        def fire():
-            self._suggestion_source = None
-            if closed_event.is_set():
-                return False
-            self.fetch_title_suggestions(
-                text, api_key, closed_event, entry_title, listbox_suggestion, popover_suggestion
+        def on_results(term, suggestions):
+            self.populate_suggestions(
+                term, suggestions, closed_event, entry_title, listbox_suggestion, popover_suggestion
             )
-            return False
 
-        self._suggestion_source = GLib.timeout_add(350, fire)
-
-    def fetch_title_suggestions(self, term, api_key, closed_event, entry_title, listbox_suggestion, popover_suggestion):
-        def worker():
-            suggestions = fetch_steamgriddb_autocomplete(api_key, term, limit=10)
-            if not closed_event.is_set():
-                GLib.idle_add(
-                    self.populate_suggestions, term, suggestions,
-                    closed_event, entry_title, listbox_suggestion, popover_suggestion
-                )
-
-        run_in_background(worker)
+        self.title_autocomplete.request(api_key, text, on_results)
 
     def populate_suggestions(self, term, suggestions, closed_event, entry_title, listbox_suggestion, popover_suggestion):
         if closed_event.is_set():
@@ -7030,11 +7296,17 @@ class AddGame(Gtk.Dialog, HiDpiMixin):
         self.get_artwork()
 
     def fetch_title_suggestions_for_keyboard(self, term):
+        import requests
+
         cfg = ConfigManager()
         api_key = cfg.config.get('steamgriddb-api-key', '').strip('"')
         if not api_key:
             return []
-        suggestions = fetch_steamgriddb_autocomplete(api_key, term, limit=10)
+        try:
+            suggestions = get_autocomplete_cache().lookup(api_key, term, limit=10)
+        except (requests.RequestException, ValueError) as e:
+            print(f"SteamGridDB: autocomplete failed for '{term}' ({e})")
+            suggestions = []
         return [{"label": s["name"], "value": s} for s in suggestions]
 
     def on_keyboard_suggestion_selected(self, item):
@@ -7603,10 +7875,10 @@ def main():
 
 
 def prefixes_count(prefix):
-    games = load_json_file(GAMES_JSON, None)
-    if games is None:
+    repository = get_game_repository()
+    if not repository.is_readable():
         return
-    return sum(1 for x in games if x.get("prefix") == prefix) - 1
+    return len(repository.with_prefix(prefix)) - 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,361 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from faugus.path_manager import LIBRARY_DB, GAMES_JSON, LATEST_GAMES, CUSTOM_ORDER
+from faugus.game_repository import GameRepository, game_categories
+from faugus.json_io import save_json_file
+from faugus.search_index import TitleSearchIndex
+from faugus.session_journal import get_session_journal
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    gameid TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    prefix TEXT NOT NULL DEFAULT '',
+    runner TEXT NOT NULL DEFAULT '',
+    hidden INTEGER NOT NULL DEFAULT 0,
+    playtime INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_prefix ON games(prefix);
+CREATE INDEX IF NOT EXISTS games_runner ON games(runner);
+CREATE TABLE IF NOT EXISTS game_categories (
+    gameid TEXT NOT NULL REFERENCES games(gameid) ON DELETE CASCADE,
+    category TEXT NOT NULL,
+    PRIMARY KEY (gameid, category)
+);
+CREATE INDEX IF NOT EXISTS game_categories_category ON game_categories(category);
+CREATE TABLE IF NOT EXISTS recent_games (
+    gameid TEXT PRIMARY KEY,
+    played_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS custom_order (
+    gameid TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+GAME_COLUMNS = "gameid, position, title, prefix, runner, hidden, playtime, data"
+
+
+def _row_values(entry, position):
+    return (
+        entry["gameid"],
+        position,
+        entry.get("title", "") or "",
+        entry.get("prefix", "") or "",
+        entry.get("runner", "") or "",
+        1 if entry.get("hidden", False) else 0,
+        int(entry.get("playtime", 0) or 0),
+        json.dumps(entry, ensure_ascii=False),
+    )
+
+
+def _row_to_entry(row):
+    entry = json.loads(row["data"])
+    entry["playtime"] = row["playtime"]
+    entry["hidden"] = bool(row["hidden"])
+    return entry
+
+
+class SqliteGameRepository:
+    backend = "sqlite"
+
+    def __init__(self, path=LIBRARY_DB):
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        self._search_index = None
+        self._search_version = None
+        self._search_lock = threading.Lock()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        self._writes += 1
+
+    def _query(self, sql, params=()):
+        return [_row_to_entry(row) for row in self._connection().execute(sql, params)]
+
+    def _put_categories(self, conn, entry):
+        conn.execute("DELETE FROM game_categories WHERE gameid = ?", (entry["gameid"],))
+        conn.executemany(
+            "INSERT OR IGNORE INTO game_categories (gameid, category) VALUES (?, ?)",
+            [(entry["gameid"], cat) for cat in game_categories(entry)],
+        )
+
+    def refresh(self, force=False):
+        return self.is_readable()
+
+    def is_readable(self):
+        try:
+            self._connection()
+        except sqlite3.Error as e:
+            print(f"Faugus Launcher: refusing to touch {self.path}, failed to open it ({e})")
+            return False
+        return True
+
+    def get_meta(self, key):
+        row = self._connection().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def set_meta(self, key, value):
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    def games(self):
+        return self._query(f"SELECT {GAME_COLUMNS} FROM games ORDER BY position")
+
+    def get(self, gameid):
+        rows = self._query(f"SELECT {GAME_COLUMNS} FROM games WHERE gameid = ?", (gameid,))
+        return rows[0] if rows else None
+
+    def with_prefix(self, prefix):
+        return self._query(f"SELECT {GAME_COLUMNS} FROM games WHERE prefix = ? ORDER BY position", (prefix,))
+
+    def with_runner(self, runner):
+        return self._query(f"SELECT {GAME_COLUMNS} FROM games WHERE runner = ? ORDER BY position", (runner,))
+
+    def hidden(self):
+        return self._query(f"SELECT {GAME_COLUMNS} FROM games WHERE hidden = 1 ORDER BY position")
+
+    def titles(self):
+        return {row[0]: row[1] or row[0] for row in self._connection().execute("SELECT gameid, title FROM games")}
+
+    def stored_playtimes(self):
+        return {row[0]: row[1] for row in self._connection().execute("SELECT gameid, playtime FROM games")}
+
+    def playtimes(self):
+        return get_session_journal().merge_playtimes(self.stored_playtimes())
+
+    def playtime(self, gameid):
+        return self.playtimes().get(gameid, 0)
+
+    def search_index(self):
+        with self._search_lock:
+            version = (self._connection().execute("PRAGMA data_version").fetchone()[0], self._writes)
+            if self._search_index is None:
+                self._search_index = TitleSearchIndex()
+            if version != self._search_version:
+                self._search_index.sync(self.games())
+                self._search_version = version
+            return self._search_index
+
+    def search(self, query, limit=None):
+        recent = {gameid: idx for idx, gameid in enumerate(self.recent_games())}
+        return self.search_index().search(query, limit=limit, recent=recent)
+
+    def find_title(self, title):
+        folded = title.casefold()
+        for gameid, stored_title in self.titles().items():
+            if stored_title.casefold() == folded:
+                return self.get(gameid)
+        return None
+
+    def save(self, games, keep_playtime=True):
+        games = [entry for entry in games if entry.get("gameid")]
+        playtime_update = "" if keep_playtime else ", playtime = excluded.playtime"
+        with self._transaction() as conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS saved_ids (gameid TEXT PRIMARY KEY)")
+            conn.execute("DELETE FROM saved_ids")
+            for position, entry in enumerate(games):
+                conn.execute(
+                    f"INSERT INTO games ({GAME_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(gameid) DO UPDATE SET position = excluded.position, "
+                    "title = excluded.title, prefix = excluded.prefix, runner = excluded.runner, "
+                    f"hidden = excluded.hidden, data = excluded.data{playtime_update}",
+                    _row_values(entry, position),
+                )
+                self._put_categories(conn, entry)
+                conn.execute("INSERT OR IGNORE INTO saved_ids (gameid) VALUES (?)", (entry["gameid"],))
+            conn.execute("DELETE FROM games WHERE gameid NOT IN (SELECT gameid FROM saved_ids)")
+            conn.execute("DROP TABLE saved_ids")
+
+    def update(self, gameid, change):
+        with self._transaction() as conn:
+            row = conn.execute(f"SELECT {GAME_COLUMNS} FROM games WHERE gameid = ?", (gameid,)).fetchone()
+            if row is None:
+                return None
+            entry = _row_to_entry(row)
+            change(entry)
+            entry["gameid"] = gameid
+            conn.execute(
+                "UPDATE games SET title = ?, prefix = ?, runner = ?, hidden = ?, playtime = ?, data = ? "
+                "WHERE gameid = ?",
+                _row_values(entry, row["position"])[2:] + (gameid,),
+            )
+            self._put_categories(conn, entry)
+            return entry
+
+    def _rewrite_category(self, category, transform):
+        with self._transaction() as conn:
+            affected = [
+                row[0] for row in conn.execute(
+                    "SELECT gameid FROM game_categories WHERE category = ? ORDER BY gameid", (category,)
+                )
+            ]
+            for gameid in affected:
+                row = conn.execute(f"SELECT {GAME_COLUMNS} FROM games WHERE gameid = ?", (gameid,)).fetchone()
+                entry = _row_to_entry(row)
+                cats = transform(game_categories(entry))
+                if cats:
+                    entry["category"] = cats
+                else:
+                    entry.pop("category", None)
+                conn.execute(
+                    "UPDATE games SET data = ? WHERE gameid = ?",
+                    (json.dumps(entry, ensure_ascii=False), gameid),
+                )
+                self._put_categories(conn, entry)
+            return affected
+
+    def rename_category(self, old_cat, new_cat):
+        return self._rewrite_category(
+            old_cat, lambda cats: list(dict.fromkeys(new_cat if c == old_cat else c for c in cats))
+        )
+
+    def remove_category(self, category):
+        return self._rewrite_category(category, lambda cats: [c for c in cats if c != category])
+
+    def stored_recent_games(self):
+        return [
+            row[0] for row in self._connection().execute(
+                "SELECT gameid FROM recent_games JOIN games USING (gameid) ORDER BY played_at DESC"
+            )
+        ]
+
+    def recent_games(self):
+        return get_session_journal().merge_recent(self.stored_recent_games())
+
+    def fold_journal(self):
+        journal = get_session_journal()
+        with self._transaction() as conn:
+            stored = {row[0] for row in conn.execute("SELECT gameid FROM games")}
+            pending = {gameid: seconds for gameid, seconds in journal.playtimes().items() if gameid in stored}
+            recent = journal.merge_recent(self.stored_recent_games())
+            now = time.time()
+
+            conn.executemany(
+                "UPDATE games SET playtime = playtime + ? WHERE gameid = ?",
+                [(seconds, gameid) for gameid, seconds in pending.items()],
+            )
+            conn.execute("DELETE FROM recent_games")
+            conn.executemany(
+                "INSERT OR IGNORE INTO recent_games (gameid, played_at) VALUES (?, ?)",
+                [(gameid, now - idx) for idx, gameid in enumerate(recent) if gameid in stored],
+            )
+            if pending:
+                journal.fold(pending)
+
+    def remove_recent(self, gameid):
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM recent_games WHERE gameid = ?", (gameid,)).rowcount > 0
+
+    def custom_order(self):
+        return {row[0]: row[1] for row in self._connection().execute("SELECT gameid, position FROM custom_order")}
+
+    def save_custom_order(self, order):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM custom_order")
+            conn.executemany(
+                "INSERT INTO custom_order (gameid, position) VALUES (?, ?)",
+                list(order.items()),
+            )
+
+    def remove_custom_order(self, gameid):
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM custom_order WHERE gameid = ?", (gameid,)).rowcount > 0
+
+
+def import_json(repository, games_path=GAMES_JSON, latest_path=LATEST_GAMES, custom_order_path=CUSTOM_ORDER):
+    source = GameRepository(games_path, latest_path, custom_order_path)
+    if not source.is_readable():
+        return False
+
+    recent = source.stored_recent_games()
+    order = source.custom_order()
+    now = time.time()
+
+    repository.save(source.games(), keep_playtime=False)
+    with repository._transaction() as conn:
+        conn.execute("DELETE FROM recent_games")
+        conn.executemany(
+            "INSERT OR IGNORE INTO recent_games (gameid, played_at) VALUES (?, ?)",
+            [(gameid, now - idx) for idx, gameid in enumerate(recent)],
+        )
+        conn.execute("DELETE FROM custom_order")
+        conn.executemany(
+            "INSERT INTO custom_order (gameid, position) VALUES (?, ?)",
+            list(order.items()),
+        )
+    repository.set_meta("imported", str(int(now)))
+    return True
+
+
+def export_json(repository, games_path=GAMES_JSON, latest_path=LATEST_GAMES, custom_order_path=CUSTOM_ORDER):
+    repository.fold_journal()
+    save_json_file(repository.games(), games_path)
+    save_json_file(repository.recent_games(), latest_path)
+    save_json_file(repository.custom_order(), custom_order_path)
+
+
+def open_sqlite_repository(path=LIBRARY_DB):
+    repository = SqliteGameRepository(path)
+    if repository.get_meta("imported") is None:
+        import_json(repository)
+    return repository
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move the Faugus Launcher library between games.json and SQLite.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--import-json", action="store_true")
+    group.add_argument("--export-json", action="store_true")
+    parser.add_argument("--database", default=LIBRARY_DB)
+
+    args = parser.parse_args()
+    repository = SqliteGameRepository(args.database)
+
+    if args.import_json:
+        if not import_json(repository):
+            raise SystemExit(1)
+    else:
+        export_json(repository)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+import bisect
+
+import gi
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk, Gio, GLib, GObject
+
+RANK_STEP = 1 << 10
+
+
+class LibraryTile(Gtk.Box):
+    __gtype_name__ = "FaugusLibraryTile"
+
+    def __init__(self):
+        super().__init__()
+        self.game = None
+        self.library_item = None
+
+
+LibraryTile.set_css_name("entry")
+
+
+class LibraryItem(GObject.Object):
+    __gtype_name__ = "FaugusLibraryItem"
+
+    rank = GObject.Property(type=int, default=0)
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+        self.widget = None
+        self.visible = True
+
+
+class LibraryView:
+    def __init__(self, grid, setup_tile, bind_tile, unbind_tile=None):
+        self._setup_tile = setup_tile
+        self._bind_tile = bind_tile
+        self._unbind_tile = unbind_tile
+        self._sort_key_func = None
+        self._filter_factory = None
+        self._predicate = None
+        self._pending_handler = None
+        self._by_game = {}
+        self._ranked = []
+        self._keys = []
+        self._tiles = set()
+        self._shown = []
+        self._positions = {}
+        self._positions_from = 0
+
+        self.store = Gio.ListStore.new(LibraryItem)
+        self.filter = Gtk.CustomFilter.new(self._match, None)
+        self.filter_model = Gtk.FilterListModel.new(self.store, self.filter)
+        self.filter_model.set_incremental(True)
+        self.sorter = Gtk.NumericSorter.new(Gtk.PropertyExpression.new(LibraryItem, None, "rank"))
+        self.sort_model = Gtk.SortListModel.new(self.filter_model, self.sorter)
+        self.sort_model.connect("items-changed", self._on_items_changed)
+        self.selection = Gtk.SingleSelection.new(self.sort_model)
+        self.selection.set_autoselect(False)
+        self.selection.set_can_unselect(True)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_setup)
+        factory.connect("bind", self._on_bind)
+        factory.connect("unbind", self._on_unbind)
+
+        if grid:
+            self.widget = Gtk.GridView.new(self.selection, factory)
+        else:
+            self.widget = Gtk.ListView.new(self.selection, factory)
+        self.widget.add_css_class("library-view")
+        self.widget.library_view = self
+
+    def _on_setup(self, factory, list_item):
+        tile = LibraryTile()
+        self._setup_tile(tile)
+        list_item.set_child(tile)
+
+    def _on_bind(self, factory, list_item):
+        tile = list_item.get_child()
+        item = list_item.get_item()
+        tile.library_item = item
+        item.widget = tile
+        self._tiles.add(tile)
+        self._bind_tile(tile, item.game)
+
+    def _on_unbind(self, factory, list_item):
+        tile = list_item.get_child()
+        item = list_item.get_item()
+        if self._unbind_tile is not None:
+            self._unbind_tile(tile)
+        self._tiles.discard(tile)
+        tile.library_item = None
+        tile.game = None
+        if item is not None and item.widget is tile:
+            item.widget = None
+
+    def _match(self, item, *user_data):
+        item.visible = self._predicate(item.game) if self._predicate else True
+        return item.visible
+
+    def _on_items_changed(self, model, position, removed, added):
+        stale = self._shown[position:position + removed]
+        self._shown[position:position + removed] = [model.get_item(i) for i in range(position, position + added)]
+        for item in stale:
+            self._positions.pop(item, None)
+        self._positions_from = min(self._positions_from, position)
+
+    def _rank(self, items):
+        if self._sort_key_func is None:
+            self._ranked = []
+            self._keys = []
+            return
+        key = self._sort_key_func()
+        ranked = sorted(((key(item.game), item) for item in items), key=lambda pair: pair[0])
+        self._keys = [pair[0] for pair in ranked]
+        self._ranked = [pair[1] for pair in ranked]
+        for position, item in enumerate(self._ranked):
+            rank = position * RANK_STEP
+            if item.rank != rank:
+                item.rank = rank
+
+    def _insert_rank(self, item):
+        key = self._sort_key_func()(item.game)
+        position = bisect.bisect_right(self._keys, key)
+        lower = self._ranked[position - 1].rank if position > 0 else None
+        upper = self._ranked[position].rank if position < len(self._ranked) else None
+        if lower is None and upper is None:
+            item.rank = 0
+        elif upper is None:
+            item.rank = lower + RANK_STEP
+        elif lower is None:
+            item.rank = upper - RANK_STEP
+        elif upper - lower > 1:
+            item.rank = (lower + upper) // 2
+        else:
+            return False
+        self._keys.insert(position, key)
+        self._ranked.insert(position, item)
+        return True
+
+    def _item_for(self, child):
+        if isinstance(child, LibraryItem):
+            return child
+        while child is not None:
+            item = getattr(child, "library_item", None)
+            if item is not None:
+                return item
+            child = child.get_parent()
+        return None
+
+    def position(self, item):
+        shown = self._shown
+        if self._positions_from < len(shown):
+            for position in range(self._positions_from, len(shown)):
+                self._positions[shown[position]] = position
+            self._positions_from = len(shown)
+        return self._positions.get(item)
+
+    def item_at(self, position):
+        return self._shown[position] if 0 <= position < len(self._shown) else None
+
+    def item_for_game(self, game):
+        return self._by_game.get(game)
+
+    def visible_items(self):
+        return list(self._shown)
+
+    def games(self):
+        return list(self._by_game)
+
+    def tiles(self):
+        return list(self._tiles)
+
+    def item_has_focus(self, item):
+        if item.widget is None:
+            return False
+        cell = item.widget.get_parent()
+        return item.widget.has_focus() or (cell is not None and cell.has_focus())
+
+    def set_sort_key_func(self, sort_key_func):
+        self._sort_key_func = sort_key_func
+        self.invalidate_sort()
+
+    def set_filter_factory(self, filter_factory):
+        self._filter_factory = filter_factory
+        self.invalidate_filter()
+
+    def invalidate_sort(self):
+        self._rank(self._by_game.values())
+        self.sorter.changed(Gtk.SorterChange.DIFFERENT)
+
+    def invalidate_filter(self):
+        self._predicate = self._filter_factory() if self._filter_factory else None
+        self.filter.changed(Gtk.FilterChange.DIFFERENT)
+
+    def set_min_children_per_line(self, count):
+        if isinstance(self.widget, Gtk.GridView):
+            self.widget.set_min_columns(count)
+
+    def set_max_children_per_line(self, count):
+        if isinstance(self.widget, Gtk.GridView):
+            self.widget.set_max_columns(count)
+
+    def append(self, game):
+        item = LibraryItem(game)
+        self._by_game[game] = item
+        if self._sort_key_func is None:
+            item.rank = self.store.get_n_items()
+            self.store.append(item)
+        elif self._insert_rank(item):
+            self.store.append(item)
+        else:
+            self._rank(self._by_game.values())
+            self.store.append(item)
+            self.sorter.changed(Gtk.SorterChange.DIFFERENT)
+        return item
+
+    def splice(self, games):
+        items = [LibraryItem(game) for game in games]
+        self._by_game = {item.game: item for item in items}
+        self._rank(items)
+        self.store.splice(0, self.store.get_n_items(), items)
+
+    def remove(self, child):
+        item = self._item_for(child)
+        if item is None:
+            return
+        found, position = self.store.find(item)
+        if found:
+            self._by_game.pop(item.game, None)
+            try:
+                ranked = self._ranked.index(item)
+            except ValueError:
+                pass
+            else:
+                del self._ranked[ranked]
+                del self._keys[ranked]
+            self.store.remove(position)
+
+    def remove_all(self):
+        self._by_game = {}
+        self._ranked = []
+        self._keys = []
+        self.store.remove_all()
+
+    def get_selected_children(self):
+        item = self.selection.get_selected_item()
+        return [item] if item is not None else []
+
+    def select_child(self, child):
+        item = self._item_for(child)
+        position = self.position(item) if item is not None else None
+        if position is not None and self.selection.get_selected() != position:
+            self.selection.set_selected(position)
+
+    def select_first(self):
+        if self._pending_handler is not None:
+            self.filter_model.disconnect(self._pending_handler)
+            self._pending_handler = None
+
+        if self.filter_model.get_pending():
+            def on_pending(model, pspec):
+                if model.get_pending():
+                    return
+                model.disconnect(self._pending_handler)
+                self._pending_handler = None
+                self.select_first()
+            self._pending_handler = self.filter_model.connect("notify::pending", on_pending)
+            return
+
+        if self.sort_model.get_n_items():
+            self.selection.set_selected(0)
+
+    def unselect_all(self):
+        self.selection.set_selected(Gtk.INVALID_LIST_POSITION)
+
+    def set_focus_child(self, child):
+        item = self._item_for(child)
+        if item is not None:
+            self.focus_item(item)
+
+    def focus_item(self, item):
+        position = self.position(item)
+        if position is None:
+            return False
+        if hasattr(self.widget, "scroll_to"):
+            self.widget.scroll_to(position, Gtk.ListScrollFlags.FOCUS | Gtk.ListScrollFlags.SELECT, None)
+        else:
+            self.selection.set_selected(position)
+            self.widget.activate_action("list.scroll-to-item", GLib.Variant("u", position))
+            if item.widget is not None:
+                item.widget.get_parent().grab_focus()
+        return True
+
+    def get_child_at_pos(self, x, y):
+        return self._item_for(self.widget.pick(x, y, Gtk.PickFlags.DEFAULT))
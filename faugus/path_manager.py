@@ -57,6 +57,11 @@ class PathManager:
         xdg_state_home = Path(os.getenv('XDG_STATE_HOME', Path.home() / '.local/state'))
         return str(xdg_state_home.joinpath(*relative_paths))
 
+    @staticmethod
+    def user_cache(*relative_paths):
+        xdg_cache_home = Path(os.getenv('XDG_CACHE_HOME', Path.home() / '.cache'))
+        return str(xdg_cache_home.joinpath(*relative_paths))
+
     @staticmethod
     def find_binary(binary_name):
         paths = os.getenv('PATH', '').split(':')
@@ -177,6 +182,7 @@ CONFIG_FILE_DIR = PathManager.user_config('faugus-launcher/config.json')
 LOGS_DIR = PathManager.user_data('faugus-launcher/logs')
 ENVAR_DIR = PathManager.user_config('faugus-launcher/envar.json')
 GAMES_JSON = PathManager.user_data('faugus-launcher/games.json')
+LIBRARY_DB = PathManager.user_data('faugus-launcher/library.db')
 PRESETS_FILE = PathManager.user_data('faugus-launcher/presets.json')
 LATEST_GAMES = PathManager.user_state('faugus-launcher/latest-games.json')
 RECENT_RUN_FILES = PathManager.user_state('faugus-launcher/recent-run-files.json')
@@ -186,8 +192,15 @@ FAUGUS_LAUNCHER_SHARE_DIR = PathManager.user_data('faugus-launcher')
 FAUGUS_LAUNCHER_STATE_DIR = PathManager.user_state('faugus-launcher')
 FAUGUS_TEMP = PathManager.user_state('faugus-launcher/faugus_temp')
 RUNNING_GAMES = PathManager.user_state('faugus-launcher/running-games.json')
+SESSIONS_JOURNAL = PathManager.user_state('faugus-launcher/sessions.jsonl')
+SESSIONS_ARCHIVE_DIR = PathManager.user_state('faugus-launcher/sessions')
 FILECHOOSER_FOLDERS_FILE = PathManager.user_state('faugus-launcher/filechooser_folders.json')
 ICONS_DIR = PathManager.user_data('faugus-launcher/icons')
+THUMBNAILS_DIR = PathManager.user_cache('faugus-launcher/thumbnails')
+COLOR_CACHE = PathManager.user_cache('faugus-launcher/colors.json')
+STEAMGRIDDB_CACHE = PathManager.user_cache('faugus-launcher/steamgriddb')
+AUTOCOMPLETE_CACHE = PathManager.user_cache('faugus-launcher/autocomplete.json')
+ICON_CACHE_DIR = PathManager.user_cache('faugus-launcher/exe-icons')
 PROTON_CACHYOS = PathManager.system_data('steam/compatibilitytools.d/proton-cachyos-slr/')
 UMU_RUN = PathManager.user_data('faugus-launcher/umu-run')
 COMPATIBILITY_DIR = Path(PathManager.get_compatibilitytools())
@@ -224,6 +237,8 @@ BACKUP_ITEMS = {
     "envar.json": ENVAR_DIR,
     "games.json": GAMES_JSON,
     "latest-games.json": LATEST_GAMES,
+    "sessions.jsonl": SESSIONS_JOURNAL,
+    "sessions": SESSIONS_ARCHIVE_DIR,
     "recent-run-files.json": RECENT_RUN_FILES,
     "categories.json": CATEGORIES_FILE,
     "custom-order.json": CUSTOM_ORDER,
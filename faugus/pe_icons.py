@@ -0,0 +1,227 @@
+import hashlib
+import io
+import mmap
+import os
+import shutil
+import struct
+import threading
+
+from faugus.path_manager import ICON_CACHE_DIR
+from faugus.json_io import load_json_file, save_json_file
+
+RT_ICON = 3
+RT_GROUP_ICON = 14
+RESOURCE_DIRECTORY = 2
+SUBDIRECTORY = 0x80000000
+
+DIRECTORY = struct.Struct("<IIHHHH")
+DIRECTORY_ENTRY = struct.Struct("<II")
+DATA_ENTRY = struct.Struct("<II")
+SECTION = struct.Struct("<8sIIII")
+GROUP_HEADER = struct.Struct("<HHH")
+GROUP_ENTRY = struct.Struct("<BBBBHHIH")
+ICO_ENTRY = struct.Struct("<BBBBHHII")
+
+
+class PEFormatError(ValueError):
+    pass
+
+
+class PEResources:
+    def __init__(self, data):
+        self.data = data
+        if data[:2] != b"MZ":
+            raise PEFormatError("Missing MZ header")
+        pe = self._unpack("<I", 0x3C)[0]
+        if data[pe:pe + 4] != b"PE\0\0":
+            raise PEFormatError("Missing PE signature")
+
+        sections, optional_size = self._unpack("<2xH12xH", pe + 4)
+        optional = pe + 24
+        magic = self._unpack("<H", optional)[0]
+        if magic == 0x10B:
+            count_offset = optional + 92
+        elif magic == 0x20B:
+            count_offset = optional + 108
+        else:
+            raise PEFormatError(f"Unknown optional header magic {magic:#x}")
+
+        if self._unpack("<I", count_offset)[0] <= RESOURCE_DIRECTORY:
+            self.base = None
+        else:
+            rva, size = self._unpack("<II", count_offset + 4 + RESOURCE_DIRECTORY * 8)
+            self.sections = [
+                SECTION.unpack_from(data, optional + optional_size + i * 40)[1:]
+                for i in range(sections)
+            ]
+            self.base = self.offset(rva) if rva and size else None
+
+    def _unpack(self, fmt, offset):
+        try:
+            return struct.unpack_from(fmt, self.data, offset)
+        except struct.error:
+            raise PEFormatError("Truncated PE header")
+
+    def offset(self, rva):
+        for virtual_size, address, raw_size, raw_offset in self.sections:
+            if address <= rva < address + max(virtual_size, raw_size):
+                return rva - address + raw_offset
+        raise PEFormatError(f"RVA {rva:#x} is outside every section")
+
+    def _entries(self, offset):
+        named, ids = DIRECTORY.unpack_from(self.data, offset)[4:]
+        for i in range(named + ids):
+            yield DIRECTORY_ENTRY.unpack_from(self.data, offset + DIRECTORY.size + i * DIRECTORY_ENTRY.size)
+
+    def _subdirectory(self, offset, wanted):
+        for name, target in self._entries(offset):
+            if name == wanted and target & SUBDIRECTORY:
+                return self.base + (target & ~SUBDIRECTORY)
+        return None
+
+    def _first_leaf(self, target):
+        while target & SUBDIRECTORY:
+            entries = list(self._entries(self.base + (target & ~SUBDIRECTORY)))
+            if not entries:
+                return None
+            target = entries[0][1]
+        rva, size = DATA_ENTRY.unpack_from(self.data, self.base + target)
+        start = self.offset(rva)
+        return self.data[start:start + size]
+
+    def resources(self, resource_type):
+        if self.base is None:
+            return
+        directory = self._subdirectory(self.base, resource_type)
+        if directory is None:
+            return
+        for name, target in self._entries(directory):
+            data = self._first_leaf(target)
+            if data is not None:
+                yield name, data
+
+    def group_icon(self):
+        group = next(self.resources(RT_GROUP_ICON), None)
+        if group is None:
+            return None
+        group = group[1]
+
+        icons = dict(self.resources(RT_ICON))
+        count = GROUP_HEADER.unpack_from(group)[2]
+        entries = []
+        for i in range(count):
+            entry = GROUP_ENTRY.unpack_from(group, GROUP_HEADER.size + i * GROUP_ENTRY.size)
+            image = icons.get(entry[7])
+            if image:
+                entries.append((entry[:6], image))
+        if not entries:
+            return None
+
+        header = GROUP_HEADER.pack(0, 1, len(entries))
+        offset = GROUP_HEADER.size + ICO_ENTRY.size * len(entries)
+        directory = []
+        for fields, image in entries:
+            directory.append(ICO_ENTRY.pack(*fields, len(image), offset))
+            offset += len(image)
+        return header + b"".join(directory) + b"".join(image for _, image in entries)
+
+
+def read_group_icon(exe_path):
+    with open(exe_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise PEFormatError("Empty file")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            try:
+                return PEResources(data).group_icon()
+            except (struct.error, IndexError) as e:
+                raise PEFormatError(f"Corrupt resource directory ({e})")
+
+
+def icon_to_png(ico_data, output_path, size=256):
+    from PIL import Image, ImageFile
+
+    ImageFile.LOAD_TRUNCATED_IMAGES = True
+
+    with Image.open(io.BytesIO(ico_data)) as icon:
+        sizes = sorted(set(icon.info.get("sizes", [icon.size])), reverse=True)
+
+        frame = None
+        for candidate in sizes:
+            try:
+                icon.size = candidate
+                frame = icon.convert("RGBA").resize((size, size), Image.LANCZOS)
+                break
+            except Exception:
+                continue
+
+        if frame is None:
+            raise ValueError("no usable icon frame found")
+
+        frame.save(output_path, "PNG")
+
+
+class IconCache:
+    def __init__(self, root=ICON_CACHE_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, "index.json")
+        self._lock = threading.Lock()
+        self._index = None
+
+    def _load(self):
+        if self._index is None:
+            data = load_json_file(self.index_path, {})
+            self._index = data if isinstance(data, dict) else {}
+        return self._index
+
+    def _remember(self, key, stamp, digest):
+        self._load()[key] = {"stamp": stamp, "digest": digest}
+        try:
+            save_json_file(self._index, self.index_path)
+        except OSError as e:
+            print(f"Faugus Launcher: failed to write {self.index_path} ({e})")
+
+    def png_path(self, digest):
+        return os.path.join(self.root, f"{digest}.png")
+
+    def extract(self, exe_path):
+        key = os.path.abspath(exe_path)
+        st = os.stat(exe_path)
+        stamp = [st.st_size, st.st_mtime_ns]
+
+        with self._lock:
+            entry = self._load().get(key)
+        if isinstance(entry, dict) and entry.get("stamp") == stamp:
+            digest = entry.get("digest")
+            if digest is None or os.path.isfile(self.png_path(digest)):
+                return self.png_path(digest) if digest else None
+
+        ico_data = read_group_icon(exe_path)
+        digest = hashlib.sha1(ico_data).hexdigest() if ico_data else None
+        if digest is not None and not os.path.isfile(self.png_path(digest)):
+            os.makedirs(self.root, exist_ok=True)
+            tmp_path = f"{self.png_path(digest)}.tmp-{threading.get_ident()}"
+            try:
+                icon_to_png(ico_data, tmp_path)
+                os.replace(tmp_path, self.png_path(digest))
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        with self._lock:
+            self._remember(key, stamp, digest)
+        return self.png_path(digest) if digest else None
+
+    def clear(self):
+        with self._lock:
+            shutil.rmtree(self.root, ignore_errors=True)
+            self._index = None
+
+
+_icon_cache = None
+
+
+def get_icon_cache():
+    global _icon_cache
+    if _icon_cache is None:
+        _icon_cache = IconCache()
+    return _icon_cache
@@ -21,6 +21,8 @@ from faugus.utils import *
 from faugus.ea_fix import *
 from faugus.steam_setup import IS_STEAM_FLATPAK
 from faugus.migration import fix_legacy_shortcut_icons
+from faugus.game_repository import get_game_repository
+from faugus.session_journal import get_session_journal
 
 if IS_FLATPAK:
     GLib.set_prgname("io.github.Faugus.faugus-launcher")
@@ -86,12 +88,13 @@ def warm_up_gpu():
 
 
 class FaugusRun(HiDpiMixin):
-    def __init__(self, message, command=None, pre_launch="", post_launch="", gameid=""):
+    def __init__(self, message, command=None, pre_launch="", post_launch="", gameid="", runner=""):
         self.message = message
         self.command = command
         self.pre_launch = pre_launch
         self.post_launch = post_launch
         self.gameid = gameid
+        self.runner = runner
         self.process = None
         self.splash_window = None
         self.log_window = None
@@ -499,7 +502,7 @@ class FaugusRun(HiDpiMixin):
         self.wayland_driver = self.cfg.config.get('wayland-driver', 'False') == 'True'
         self.wow64_enabled = self.cfg.config.get('wow64-enabled', 'False') == 'True'
         self.show_donate = self.cfg.config.get('show-donate', 'False') == 'True'
-        self.playtime = int(self.cfg.config.get("playtime", 0))
+        self.playtime = int(self.cfg.config.get("playtime", 0)) + get_session_journal().total_playtime()
         self.automatic_updates = self.cfg.config.get('automatic-updates', 'True') == 'True'
 
         theme_engine = self.cfg.config.get('theme-engine', 'adwaita').strip('"')
@@ -715,7 +718,6 @@ class FaugusRun(HiDpiMixin):
                     pass
 
         end_time = time.time()
-        runtime = int(end_time - getattr(self, "start_time", end_time))
 
         if self.post_launch:
             try:
@@ -723,23 +725,18 @@ class FaugusRun(HiDpiMixin):
             except Exception as e:
                 print(f"Error running post-launch command: {e}")
 
-        self.cfg.load_config()
-        self.playtime = int(self.cfg.config.get("playtime", 0))
-        self.cfg.set_value("playtime", self.playtime + runtime)
-        self.cfg.save_config()
-
         game_id = os.environ.get("FAUGUSID")
 
-        if game_id:
-            games = load_json_file(GAMES_JSON, [])
-            if games:
-                for game in games:
-                    if game.get("gameid") == game_id:
-                        old_time = game.get("playtime", 0)
-                        game["playtime"] = old_time + runtime
-                        break
-
-                save_json_file(games, GAMES_JSON)
+        if hasattr(self, "start_time"):
+            status = None
+            if condition is not None:
+                try:
+                    status = os.waitstatus_to_exitcode(condition)
+                except ValueError:
+                    status = condition
+            get_session_journal().record_session(
+                game_id or "", self.start_time, end_time, status, self.runner or os.environ.get("PROTONPATH", "")
+            )
 
         if self.logging_enabled:
             target_dir = f"{LOGS_DIR}/{self.log_dir}"
@@ -853,15 +850,7 @@ def build_launch_command(game):
 
 
 def load_game_from_json(gameid):
-    games = load_json_file(GAMES_JSON, None)
-    if games is None:
-        return None
-
-    for game in games:
-        if game.get("gameid") == gameid:
-            return game
-
-    return None
+    return get_game_repository().get(gameid)
 
 
 def is_apple_silicon():
@@ -908,7 +897,7 @@ def main():
             return
 
         launch_options = build_launch_command(game)
-        FaugusRun(launch_options, None, game.get("pre_launch", ""), game.get("post_launch", ""), args.game).run()
+        FaugusRun(launch_options, None, game.get("pre_launch", ""), game.get("post_launch", ""), args.game, game.get("runner", "")).run()
     else:
         FaugusRun(args.message, args.command, args.pre_launch, args.post_launch).run()
 
@@ -0,0 +1,178 @@
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+SEPARATORS = re.compile(r"[\W_]+")
+FUZZY_THRESHOLD = 0.45
+RECENT_BOOST = 0.15
+
+
+def normalize(text):
+    text = unicodedata.normalize("NFKD", str(text).casefold())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(SEPARATORS.sub(" ", text).split())
+
+
+def trigrams(text):
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return grams
+
+
+def within_one_edit(a, b):
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la == lb:
+        diff = [i for i in range(la) if a[i] != b[i]]
+        if len(diff) == 1:
+            return True
+        return len(diff) == 2 and diff[1] == diff[0] + 1 and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]]
+    if la > lb:
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    return a[i:] == b[i + 1:]
+
+
+def title_aliases(title, gameid="", extra=()):
+    keys = [normalize(title)]
+    words = keys[0].split()
+    if len(words) > 1:
+        keys.append("".join(w[0] for w in words))
+    if gameid:
+        keys.append(normalize(gameid))
+    keys.extend(normalize(alias) for alias in extra if alias)
+    return tuple(dict.fromkeys(k for k in keys if k))
+
+
+def _word_score(query_words, key_words):
+    matched = 0
+    for qw in query_words:
+        for kw in key_words:
+            if kw.startswith(qw):
+                matched += 1
+                break
+            if len(qw) >= 4 and (within_one_edit(qw, kw) or within_one_edit(qw, kw[:len(qw)])):
+                matched += 1
+                break
+    return matched / len(query_words)
+
+
+def _exact_score(query, keys):
+    best = 0.0
+    for key in keys:
+        if key.startswith(query):
+            return 1.0
+        if f" {query}" in f" {key}":
+            best = 0.9
+        elif best < 0.8 and query in key:
+            best = 0.8
+    return best
+
+
+class TitleSearchIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._signatures = {}
+        self._keys = {}
+        self._grams = {}
+        self._postings = {}
+        self.version = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, gameid, title, aliases=()):
+        with self._lock:
+            self.remove(gameid)
+            keys = title_aliases(title, gameid, aliases)
+            if not keys:
+                return
+            grams = set()
+            for key in keys:
+                grams |= trigrams(key)
+            self.version += 1
+            self._signatures[gameid] = (title, tuple(aliases))
+            self._keys[gameid] = keys
+            self._grams[gameid] = grams
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(gameid)
+
+    def remove(self, gameid):
+        with self._lock:
+            self._signatures.pop(gameid, None)
+            if self._keys.pop(gameid, None) is not None:
+                self.version += 1
+            for gram in self._grams.pop(gameid, ()):
+                ids = self._postings.get(gram)
+                if ids is not None:
+                    ids.discard(gameid)
+                    if not ids:
+                        del self._postings[gram]
+
+    def sync(self, entries):
+        with self._lock:
+            seen = set()
+            for entry in entries:
+                gameid = entry.get("gameid")
+                if not gameid:
+                    continue
+                seen.add(gameid)
+                title = entry.get("title", "") or ""
+                aliases = tuple(a for a in entry.get("aliases", ()) or () if isinstance(a, str))
+                if self._signatures.get(gameid) != (title, aliases):
+                    self.add(gameid, title, aliases)
+            for gameid in [g for g in self._keys if g not in seen]:
+                self.remove(gameid)
+
+    def _fuzzy_score(self, gameid, query_words, query_grams):
+        similarity = len(query_grams & self._grams[gameid]) / len(query_grams)
+        key_words = [word for key in self._keys[gameid] for word in key.split()]
+        return 0.7 * max(similarity, _word_score(query_words, key_words))
+
+    def _candidates(self, query_grams):
+        counts = Counter()
+        for gram in query_grams:
+            counts.update(self._postings.get(gram, ()))
+        minimum = max(1, int(len(query_grams) * 0.3))
+        return [gameid for gameid, count in counts.items() if count >= minimum]
+
+    def search(self, query, limit=None, recent=None, threshold=FUZZY_THRESHOLD):
+        query = normalize(query)
+        if not query:
+            return []
+        query_words = query.split()
+        query_grams = trigrams(query)
+
+        with self._lock:
+            scores = {}
+            for gameid, keys in self._keys.items():
+                score = _exact_score(query, keys)
+                if score:
+                    scores[gameid] = score
+            if len(query_grams) >= 3:
+                for gameid in self._candidates(query_grams):
+                    if gameid not in scores:
+                        scores[gameid] = self._fuzzy_score(gameid, query_words, query_grams)
+
+            results = []
+            for gameid, score in scores.items():
+                if score < threshold:
+                    continue
+                if recent and gameid in recent:
+                    score += RECENT_BOOST / (1 + recent[gameid])
+                results.append((gameid, score))
+            results.sort(key=lambda r: (-r[1], self._keys[r[0]][0]))
+
+        return results[:limit] if limit else results
+
+    def matches(self, query):
+        return {gameid for gameid, _ in self.search(query)}
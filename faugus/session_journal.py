@@ -0,0 +1,219 @@
+import fcntl
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from faugus.path_manager import SESSIONS_JOURNAL, SESSIONS_ARCHIVE_DIR
+
+COMPACT_BYTES = 64 * 1024
+
+
+def _encode(record):
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class SessionJournal:
+    def __init__(self, path=SESSIONS_JOURNAL, archive_dir=SESSIONS_ARCHIVE_DIR):
+        self.path = path
+        self.archive_dir = archive_dir
+        self.lock_path = path + ".lock"
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self._inode = None
+        self._offset = 0
+        self._base = 0
+        self._total = 0
+        self._games = {}
+
+    @contextmanager
+    def _file_lock(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _append(self, *records):
+        lines = b"".join(_encode(record) for record in records)
+        with self._file_lock():
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, lines)
+            finally:
+                os.close(fd)
+
+    def record_launch(self, gameid, runner=""):
+        self._append({"event": "launch", "gameid": gameid, "time": time.time(), "runner": runner})
+
+    def record_session(self, gameid, start, end, status=None, runner=""):
+        self._append({
+            "event": "session",
+            "gameid": gameid,
+            "start": start,
+            "end": end,
+            "duration": max(0, int(end - start)),
+            "status": status,
+            "runner": runner,
+        })
+
+    def forget(self, gameid):
+        self._append({"event": "forget", "gameid": gameid, "time": time.time()})
+
+    def fold(self, playtimes):
+        now = time.time()
+        self._append(*(
+            {"event": "fold", "gameid": gameid, "playtime": seconds, "time": now}
+            for gameid, seconds in playtimes.items()
+        ))
+
+    def _apply(self, record):
+        gameid = record.get("gameid")
+        event = record.get("event")
+        if event == "checkpoint":
+            self._total = int(record.get("total", 0))
+            self._games = {
+                gameid: dict(state) for gameid, state in record.get("games", {}).items()
+                if isinstance(state, dict)
+            }
+            return
+        if event == "session":
+            self._total += int(record.get("duration", 0))
+        if not gameid:
+            return
+        if event == "forget":
+            self._games.pop(gameid, None)
+            return
+        if event == "fold":
+            state = self._games.get(gameid)
+            if state is not None:
+                state["playtime"] = max(0, state["playtime"] - int(record.get("playtime", 0)))
+            return
+        state = self._games.setdefault(gameid, {"playtime": 0, "last_played": 0, "sessions": 0})
+        if event == "launch":
+            state["last_played"] = max(state["last_played"], record.get("time", 0))
+        elif event == "session":
+            state["playtime"] += int(record.get("duration", 0))
+            state["sessions"] += 1
+            state["last_played"] = max(state["last_played"], record.get("start", 0))
+
+    def _sync(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self._reset()
+            return False
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            self._reset()
+            self._inode = st.st_ino
+        if st.st_size == self._offset:
+            return True
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read(st.st_size - self._offset)
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines(keepends=True):
+            self._offset += len(line)
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if isinstance(record, dict):
+                self._apply(record)
+                if record.get("event") == "checkpoint":
+                    self._base = self._offset
+        return True
+
+    def _rotate(self):
+        with self._file_lock():
+            if not self._sync() or self._offset - self._base < COMPACT_BYTES:
+                return
+
+            os.makedirs(self.archive_dir, exist_ok=True)
+            archive_path = os.path.join(self.archive_dir, f"{time.time_ns()}.jsonl")
+            checkpoint = _encode({
+                "event": "checkpoint",
+                "time": time.time(),
+                "archive": os.path.basename(archive_path),
+                "total": self._total,
+                "games": self._games,
+            })
+
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(checkpoint)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    inode = os.fstat(f.fileno()).st_ino
+                os.chmod(tmp_path, 0o644)
+                try:
+                    os.link(self.path, archive_path)
+                except OSError:
+                    shutil.copyfile(self.path, archive_path)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self._inode = inode
+            self._offset = self._base = len(checkpoint)
+
+    def refresh(self):
+        with self._lock:
+            if not self._sync():
+                return
+            if self._offset - self._base >= COMPACT_BYTES:
+                try:
+                    self._rotate()
+                except OSError as e:
+                    print(f"Faugus Launcher: failed to compact {self.path} ({e})")
+
+    def playtimes(self):
+        with self._lock:
+            self.refresh()
+            return {gameid: state["playtime"] for gameid, state in self._games.items() if state["playtime"]}
+
+    def total_playtime(self):
+        with self._lock:
+            self.refresh()
+            return self._total
+
+    def last_played(self):
+        with self._lock:
+            self.refresh()
+            return {gameid: state["last_played"] for gameid, state in self._games.items() if state["last_played"]}
+
+    def recent_games(self):
+        last_played = self.last_played()
+        return sorted(last_played, key=last_played.get, reverse=True)
+
+    def merge_playtimes(self, base):
+        merged = dict(base)
+        for gameid, seconds in self.playtimes().items():
+            if gameid in merged:
+                merged[gameid] = merged[gameid] + seconds
+        return merged
+
+    def merge_recent(self, base):
+        recent = self.recent_games()
+        seen = set(recent)
+        return recent + [gameid for gameid in base if gameid not in seen]
+
+
+_journal = None
+
+
+def get_session_journal():
+    global _journal
+    if _journal is None:
+        _journal = SessionJournal()
+    return _journal
@@ -0,0 +1,239 @@
+import os
+import struct
+import threading
+
+APPINFO_V27 = 0x07564427
+APPINFO_V28 = 0x07564428
+APPINFO_V29 = 0x07564429
+
+ENTRY = struct.Struct("<II")
+INT32 = struct.Struct("<i")
+UINT32 = struct.Struct("<I")
+FLOAT32 = struct.Struct("<f")
+UINT64 = struct.Struct("<Q")
+INT64 = struct.Struct("<q")
+
+TYPE_MAP = 0x00
+TYPE_STRING = 0x01
+TYPE_INT32 = 0x02
+TYPE_FLOAT32 = 0x03
+TYPE_POINTER = 0x04
+TYPE_COLOR = 0x06
+TYPE_UINT64 = 0x07
+TYPE_END = 0x08
+TYPE_INT64 = 0x0A
+TYPE_END_ALT = 0x0B
+
+ENTRY_HEADER_SIZE = {
+    APPINFO_V27: 40,
+    APPINFO_V28: 60,
+    APPINFO_V29: 60,
+}
+
+
+class AppInfoError(ValueError):
+    pass
+
+
+class AppInfo:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._file = None
+        self._version = None
+        self._offsets = {}
+        self._strings = None
+        self._common = {}
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._offsets = {}
+        self._strings = None
+        self._common = {}
+
+    def _open(self):
+        try:
+            st = os.stat(self.path)
+        except (OSError, TypeError):
+            self._close()
+            self._stamp = None
+            return False
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._stamp:
+            return self._file is not None
+
+        self._close()
+        self._stamp = stamp
+        if not st.st_size:
+            return False
+        try:
+            self._file = open(self.path, "rb")
+            self._index(st.st_size)
+        except (OSError, AppInfoError, struct.error) as e:
+            print(f"Faugus Launcher: failed to read {self.path} ({e})")
+            self._close()
+            return False
+        return True
+
+    def _index(self, end):
+        f = self._file
+        header = f.read(16)
+        version = UINT32.unpack_from(header, 0)[0]
+        if version not in ENTRY_HEADER_SIZE:
+            raise AppInfoError(f"Unsupported appinfo.vdf version {version:#x}")
+        self._version = version
+
+        pos = 16 if version >= APPINFO_V29 else 8
+        if version >= APPINFO_V29:
+            end = INT64.unpack_from(header, 8)[0]
+            self._strings = self._string_table(end)
+
+        offsets = {}
+        f.seek(pos)
+        while pos + ENTRY.size <= end:
+            entry = f.read(ENTRY.size)
+            if len(entry) < ENTRY.size:
+                break
+            appid, size = ENTRY.unpack(entry)
+            if appid == 0:
+                break
+            offsets[appid] = (pos + ENTRY.size, size)
+            pos += ENTRY.size + size
+            f.seek(pos)
+        self._offsets = offsets
+
+    def _string_table(self, offset):
+        self._file.seek(offset)
+        data = self._file.read()
+        count = UINT32.unpack_from(data, 0)[0]
+        return [s.decode("utf-8", "replace") for s in data[4:].split(b"\0", count)[:count]]
+
+    def _key(self, data, pos):
+        if self._strings is not None:
+            return self._strings[INT32.unpack_from(data, pos)[0]], pos + 4
+        end = data.find(b"\0", pos)
+        return data[pos:end].decode("utf-8", "replace"), end + 1
+
+    def _parse(self, data, pos, want=None):
+        result = {}
+        while True:
+            kind = data[pos]
+            pos += 1
+            if kind in (TYPE_END, TYPE_END_ALT):
+                return result, pos
+            key, pos = self._key(data, pos)
+            if kind == TYPE_MAP:
+                value, pos = self._parse(data, pos)
+            elif kind == TYPE_STRING:
+                end = data.find(b"\0", pos)
+                value = data[pos:end].decode("utf-8", "replace")
+                pos = end + 1
+            elif kind in (TYPE_INT32, TYPE_POINTER, TYPE_COLOR):
+                value = INT32.unpack_from(data, pos)[0]
+                pos += 4
+            elif kind == TYPE_FLOAT32:
+                value = FLOAT32.unpack_from(data, pos)[0]
+                pos += 4
+            elif kind == TYPE_UINT64:
+                value = UINT64.unpack_from(data, pos)[0]
+                pos += 8
+            elif kind == TYPE_INT64:
+                value = INT64.unpack_from(data, pos)[0]
+                pos += 8
+            else:
+                raise AppInfoError(f"Unknown binary VDF type {kind:#x}")
+            result[key] = value
+            if key == want:
+                return result, pos
+
+    def _read_common(self, appid):
+        entry = self._offsets.get(appid)
+        if entry is None:
+            return None
+        start, size = entry
+        data = os.pread(self._file.fileno(), size, start)
+        if len(data) < size:
+            raise AppInfoError(f"Truncated entry for app {appid}")
+        pos = ENTRY_HEADER_SIZE[self._version]
+        if data[pos] != TYPE_MAP:
+            raise AppInfoError(f"Malformed entry for app {appid}")
+        _, pos = self._key(data, pos + 1)
+        appinfo, _ = self._parse(data, pos, want="common")
+        return appinfo.get("common") or {}
+
+    def common(self, appid):
+        try:
+            appid = int(appid)
+        except (TypeError, ValueError):
+            return None
+        with self._lock:
+            if not self._open():
+                return None
+            if appid not in self._common:
+                try:
+                    self._common[appid] = self._read_common(appid)
+                except (AppInfoError, IndexError, struct.error) as e:
+                    print(f"Faugus Launcher: failed to read app {appid} from {self.path} ({e})")
+                    self._common[appid] = None
+            return self._common[appid]
+
+    def appids(self):
+        with self._lock:
+            if not self._open():
+                return []
+            return list(self._offsets)
+
+    def name(self, appid):
+        return (self.common(appid) or {}).get("name")
+
+    def icon_hash(self, appid):
+        return (self.common(appid) or {}).get("icon")
+
+    def library_asset(self, appid, asset, language="english"):
+        images = (self.common(appid) or {}).get("library_assets_full", {}).get(asset, {})
+        for variant in ("image2x", "image"):
+            localized = images.get(variant)
+            if isinstance(localized, dict) and localized:
+                return localized.get(language) or next(iter(localized.values()))
+        return None
+
+
+JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def probe_image_size(path):
+    try:
+        with open(path, "rb") as f:
+            head = f.read(26)
+            if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+                return struct.unpack(">II", head[16:24])
+            if head[:2] != b"\xff\xd8":
+                return None
+
+            f.seek(2)
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    return None
+                while marker[1] == 0xFF:
+                    marker = marker[1:] + f.read(1)
+                    if len(marker) < 2:
+                        return None
+                if marker[1] in (0x01, 0xD8) or 0xD0 <= marker[1] <= 0xD7:
+                    continue
+                length = f.read(2)
+                if len(length) < 2:
+                    return None
+                length = struct.unpack(">H", length)[0]
+                if marker[1] in JPEG_SOF:
+                    frame = f.read(5)
+                    if len(frame) < 5:
+                        return None
+                    height, width = struct.unpack(">HH", frame[1:5])
+                    return width, height
+                f.seek(length - 2, os.SEEK_CUR)
+    except OSError:
+        return None
@@ -1,13 +1,14 @@
 import os
 import subprocess
+import threading
+import time
 import zlib
 
-import vdf
 from pathlib import Path
-import gi
-gi.require_version('GdkPixbuf', '2.0')
 from faugus.path_manager import PathManager, IS_FLATPAK
-from gi.repository import GdkPixbuf
+from faugus.steam_appinfo import AppInfo, probe_image_size
+from faugus.vdf_reader import read_vdf, read_vdf_cached
+from gi.repository import Gio, GLib
 
 
 def _check_command(cmd):
@@ -50,6 +51,8 @@ steam_folder, IS_STEAM_FLATPAK = detect_steam_folder()
 USERDATA = steam_folder / "userdata" if steam_folder else None
 LIBRARY = steam_folder / "config/libraryfolders.vdf" if steam_folder else None
 LIBRARYCACHE = steam_folder / "appcache/librarycache" if steam_folder else None
+APPINFO = steam_folder / "appcache/appinfo.vdf" if steam_folder else None
+STEAM_ACCOUNT_OFFSET = 76561197960265728
 
 LOSSLESS_DLL = (
     (steam_folder / "steamapps/common/Lossless Scaling/Lossless.dll")
@@ -103,104 +106,391 @@ def read_steam_users():
 
     names = {}
     login_users_path = steam_folder / "config/loginusers.vdf" if steam_folder else None
-    if login_users_path and login_users_path.exists():
-        try:
-            with open(login_users_path, "r", errors="ignore") as f:
-                data = vdf.load(f)
-            for steamid64_str, info in data.get("users", {}).items():
-                try:
-                    account_id = str(int(steamid64_str) - 76561197960265728)
-                except ValueError:
-                    continue
-                names[account_id] = info.get("PersonaName") or account_id
-        except Exception:
-            pass
+    if login_users_path:
+        data = read_vdf_cached(login_users_path, [("users", "*", "PersonaName")])
+        for steamid64_str, info in data.get("users", {}).items():
+            try:
+                account_id = str(int(steamid64_str) - STEAM_ACCOUNT_OFFSET)
+            except ValueError:
+                continue
+            names[account_id] = info.get("PersonaName") or account_id
 
     users = [(aid, names.get(aid, aid)) for aid in account_ids]
     return sorted(users, key=lambda u: u[1].lower())
 
 
 def read_library_folders():
-    libraries = []
-
-    if not LIBRARY or not LIBRARY.exists():
-        return libraries
-
-    with open(LIBRARY, "r", errors="ignore") as f:
-        for line in f:
-            if '"path"' in line:
-                path = line.split('"')[-2]
-                libraries.append(Path(path))
+    if not LIBRARY:
+        return []
 
-    return libraries
+    data = read_vdf_cached(LIBRARY, [("libraryfolders", "*", "path")])
+    return [
+        Path(folder["path"])
+        for folder in data.get("libraryfolders", {}).values()
+        if isinstance(folder, dict) and folder.get("path")
+    ]
 
 
 def _read_family_group_members(account_id):
     if not steam_folder:
         return set()
     path = steam_folder / "userdata" / account_id / "config/localconfig.vdf"
-    if not path.exists():
-        return set()
+    data = read_vdf_cached(path, [("UserLocalConfigStore", "FamilyGroup", "members")])
+    members = data.get("UserLocalConfigStore", {}).get("FamilyGroup", {}).get("members", {})
+    return {m.get("accountid") for m in members.values() if isinstance(m, dict) and m.get("accountid")}
+
+
+def _stat_stamp(path):
     try:
-        with open(path, "r", errors="ignore") as f:
-            data = vdf.load(f)
-        family_group = data.get("UserLocalConfigStore", {}).get("FamilyGroup", {})
-        members = family_group.get("members", {})
-        return {m.get("accountid") for m in members.values() if m.get("accountid")}
-    except Exception:
-        return set()
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_manifest(path):
+    try:
+        state = read_vdf(path, [("AppState", "name"), ("AppState", "LastOwner")]).get("AppState", {})
+    except OSError:
+        state = {}
+    return state.get("name"), state.get("LastOwner")
+
+
+class InstalledView:
+    __slots__ = ("family_stamp", "games", "appids", "names")
+
+    def __init__(self, family_stamp, games):
+        self.family_stamp = family_stamp
+        self.games = sorted(games, key=lambda x: x[1].lower())
+        self.appids = {appid for appid, _ in games}
+        self.names = {name.lower() for _, name in games}
+
+
+class SteamLibraryIndex:
+    CHECK_INTERVAL = 1.0
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._checked = None
+        self._libraries_stamp = None
+        self._libraries = []
+        self._dirs = {}
+        self._family = {}
+        self._views = {}
+        self.version = 0
+        self.watched = False
+
+    def _refresh_dir(self, steamapps_dir):
+        stamp = _stat_stamp(steamapps_dir)
+        if stamp is None:
+            return self._dirs.pop(steamapps_dir, None) is not None
+
+        old_stamp, manifests = self._dirs.get(steamapps_dir, (None, {}))
+        paths = list(manifests) if stamp == old_stamp else steamapps_dir.glob("appmanifest_*.acf")
+
+        changed = stamp != old_stamp
+        updated = {}
+        for manifest in paths:
+            manifest_stamp = _stat_stamp(manifest)
+            if manifest_stamp is None:
+                changed = True
+                continue
+            entry = manifests.get(manifest)
+            if entry is None or entry[0] != manifest_stamp:
+                entry = (manifest_stamp, manifest.stem.split("_")[-1], *_read_manifest(manifest))
+                changed = True
+            updated[manifest] = entry
+
+        self._dirs[steamapps_dir] = (stamp, updated)
+        return changed
+
+    def refresh(self, force=False):
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._checked is not None and (self.watched or now - self._checked < self.CHECK_INTERVAL):
+                return
+            self._checked = now
+
+            libraries_stamp = _stat_stamp(LIBRARY) if LIBRARY else None
+            changed = libraries_stamp != self._libraries_stamp
+            if changed:
+                self._libraries_stamp = libraries_stamp
+                self._libraries = read_library_folders()
+
+            live = set()
+            for lib in self._libraries:
+                steamapps_dir = lib / "steamapps"
+                live.add(steamapps_dir)
+                changed |= self._refresh_dir(steamapps_dir)
+            for steamapps_dir in [d for d in self._dirs if d not in live]:
+                del self._dirs[steamapps_dir]
+                changed = True
+
+            if changed:
+                self.version += 1
+                self._views.clear()
+
+    def libraries(self):
+        with self._lock:
+            self.refresh()
+            return list(self._libraries)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                (appid, name)
+                for _, manifests in self._dirs.values()
+                for _, appid, name, _ in manifests.values()
+            }
+
+    def update_manifests(self, paths):
+        changed = set()
+        with self._lock:
+            live = {lib / "steamapps" for lib in self._libraries}
+            for manifest in paths:
+                steamapps_dir = manifest.parent
+                if steamapps_dir not in live:
+                    continue
+                _, manifests = self._dirs.get(steamapps_dir, (None, {}))
+                old = manifests.pop(manifest, None)
+                manifest_stamp = _stat_stamp(manifest)
+                new = None
+                if manifest_stamp is not None:
+                    if old is not None and old[0] == manifest_stamp:
+                        new = old
+                    else:
+                        new = (manifest_stamp, manifest.stem.split("_")[-1], *_read_manifest(manifest))
+                    manifests[manifest] = new
+                self._dirs[steamapps_dir] = (_stat_stamp(steamapps_dir), manifests)
+
+                if (old and old[1:]) != (new and new[1:]):
+                    for entry in (old, new):
+                        if entry is not None:
+                            changed.add((entry[1], entry[2]))
+
+            if changed:
+                self.version += 1
+                self._views.clear()
+        return changed
+
+    def _family_members(self, account_id):
+        path = steam_folder / "userdata" / account_id / "config/localconfig.vdf"
+        stamp = _stat_stamp(path)
+        cached = self._family.get(account_id)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, _read_family_group_members(account_id))
+            self._family[account_id] = cached
+        return cached
+
+    def _view(self, account_id):
+        key = account_id if account_id and account_id != "all" else None
+        family_stamp, family_members = self._family_members(key) if key else (None, None)
+
+        view = self._views.get(key)
+        if view is not None and view.family_stamp == family_stamp:
+            return view
+
+        games = []
+        for _, manifests in self._dirs.values():
+            for _, appid, name, last_owner in manifests.values():
+                if not name:
+                    continue
+                if family_members is not None:
+                    owner_account_id = None
+                    if last_owner:
+                        try:
+                            owner_account_id = str(int(last_owner) - STEAM_ACCOUNT_OFFSET)
+                        except ValueError:
+                            owner_account_id = None
+                    if owner_account_id != key and owner_account_id not in family_members:
+                        continue
+                games.append((appid, name))
+
+        view = InstalledView(family_stamp, games)
+        self._views[key] = view
+        return view
+
+    def installed(self, account_id=None):
+        if not steam_folder:
+            return []
+        with self._lock:
+            self.refresh()
+            return list(self._view(account_id).games)
+
+    def is_installed(self, appid=None, name=None, account_id=None):
+        if not steam_folder:
+            return False
+        with self._lock:
+            self.refresh()
+            view = self._view(account_id)
+            if appid is not None and str(appid) in view.appids:
+                return True
+            return name is not None and name.lower() in view.names
+
+
+_steam_library_index = None
+
+
+def get_steam_library_index():
+    global _steam_library_index
+    if _steam_library_index is None:
+        _steam_library_index = SteamLibraryIndex()
+    return _steam_library_index
+
+
+def _is_manifest(path):
+    return path is not None and path.name.startswith("appmanifest_") and path.suffix == ".acf"
+
+
+class SteamLibraryMonitor:
+    DEBOUNCE_MS = 300
+
+    def __init__(self, index, on_changed):
+        self.index = index
+        self.on_changed = on_changed
+        self._library_monitor = None
+        self._dir_monitors = {}
+        self._pending = set()
+        self._libraries_dirty = False
+        self._source = None
+
+    def start(self):
+        if not LIBRARY or self._library_monitor is not None:
+            return
+        self._library_monitor = Gio.File.new_for_path(str(LIBRARY)).monitor_file(Gio.FileMonitorFlags.WATCH_MOVES, None)
+        self._library_monitor.connect("changed", self._on_library_event)
+        self._sync_dirs(self.index.libraries())
+        self.index.watched = True
+
+    def stop(self):
+        self.index.watched = False
+        if self._source:
+            GLib.source_remove(self._source)
+            self._source = None
+        for monitor in [self._library_monitor, *self._dir_monitors.values()]:
+            if monitor is not None:
+                monitor.cancel()
+        self._library_monitor = None
+        self._dir_monitors.clear()
+
+    def _sync_dirs(self, libraries):
+        wanted = {lib / "steamapps" for lib in libraries}
+        for steamapps_dir in [d for d in self._dir_monitors if d not in wanted]:
+            self._dir_monitors.pop(steamapps_dir).cancel()
+        for steamapps_dir in wanted - set(self._dir_monitors):
+            try:
+                monitor = Gio.File.new_for_path(str(steamapps_dir)).monitor_directory(Gio.FileMonitorFlags.WATCH_MOVES, None)
+            except GLib.Error as e:
+                print(f"Faugus Launcher: cannot watch {steamapps_dir} ({e.message})")
+                continue
+            monitor.connect("changed", self._on_dir_event)
+            self._dir_monitors[steamapps_dir] = monitor
+
+    def _schedule(self):
+        if self._source is None:
+            self._source = GLib.timeout_add(self.DEBOUNCE_MS, self._flush)
+
+    def _on_library_event(self, monitor, file, other_file, event_type):
+        if event_type != Gio.FileMonitorEvent.ATTRIBUTE_CHANGED:
+            self._libraries_dirty = True
+            self._schedule()
+
+    def _on_dir_event(self, monitor, file, other_file, event_type):
+        if event_type == Gio.FileMonitorEvent.ATTRIBUTE_CHANGED:
+            return
+        for f in (file, other_file):
+            path = Path(f.get_path()) if f is not None and f.get_path() else None
+            if _is_manifest(path):
+                self._pending.add(path)
+                self._schedule()
+
+    def _flush(self):
+        self._source = None
+        pending, self._pending = self._pending, set()
+
+        if self._libraries_dirty:
+            self._libraries_dirty = False
+            before = self.index.snapshot()
+            self.index.refresh(force=True)
+            self._sync_dirs(self.index.libraries())
+            changed = before ^ self.index.snapshot()
+        else:
+            changed = self.index.update_manifests(pending)
+
+        if changed:
+            self.on_changed(changed)
+        return False
 
 
 def read_installed_games(account_id=None):
-    if not steam_folder:
-        return []
+    return get_steam_library_index().installed(account_id)
 
-    games = []
-    libraries = read_library_folders()
 
-    family_members = _read_family_group_members(account_id) if account_id and account_id != "all" else None
+_app_info = None
 
-    for lib in libraries:
-        steamapps_dir = lib / "steamapps"
 
-        if not steamapps_dir.exists():
-            continue
+def get_app_info():
+    global _app_info
+    if _app_info is None:
+        _app_info = AppInfo(APPINFO)
+    return _app_info
 
-        for manifest in steamapps_dir.glob("appmanifest_*.acf"):
-            appid = manifest.stem.split("_")[-1]
-
-            name = None
-            last_owner = None
-
-            with open(manifest, "r", errors="ignore") as f:
-                for line in f:
-                    if '"name"' in line and name is None:
-                        name = line.split('"')[-2]
-                    if '"LastOwner"' in line:
-                        last_owner = line.split('"')[-2]
-
-            if family_members is not None:
-                owner_account_id = None
-                if last_owner:
-                    try:
-                        owner_account_id = str(int(last_owner) - 76561197960265728)
-                    except ValueError:
-                        owner_account_id = None
-                if owner_account_id != account_id and owner_account_id not in family_members:
-                    continue
 
-            if name:
-                games.append((appid, name))
+LIBRARY_ASSET_FILES = {
+    "library_capsule": "library_600x900.jpg",
+    "library_hero": "library_hero.jpg",
+    "library_header": "header.jpg",
+}
+
+
+def get_steam_library_asset(appid, asset):
+    if not LIBRARYCACHE:
+        return None
+
+    cache = LIBRARYCACHE / str(appid)
+    relative = get_app_info().library_asset(appid, asset)
+    if relative and (cache / relative).is_file():
+        return str(cache / relative)
+
+    name = LIBRARY_ASSET_FILES.get(asset)
+    if not name:
+        return None
+    for candidate in (cache / name, LIBRARYCACHE / f"{appid}_{name}"):
+        if candidate.is_file():
+            return str(candidate)
+    if cache.is_dir():
+        for candidate in cache.glob(f"*/{name}"):
+            return str(candidate)
+    return None
 
-    return sorted(games, key=lambda x: x[1].lower())
+
+STEAM_ARTWORK_ASSETS = {
+    "cover": "library_capsule",
+    "banner": "library_hero",
+}
+
+
+def get_steam_library_artwork(appid, categories=tuple(STEAM_ARTWORK_ASSETS)):
+    artwork = {}
+    for category in categories:
+        path = get_steam_library_asset(appid, STEAM_ARTWORK_ASSETS[category])
+        if path:
+            artwork[category] = path
+    return artwork
 
 
 def get_steam_icon_path(appid):
-    if not LIBRARYCACHE or not LIBRARYCACHE.exists():
+    if not LIBRARYCACHE:
         return None
 
     cache = LIBRARYCACHE / str(appid)
-    if not cache.exists():
+    icon_hash = get_app_info().icon_hash(appid)
+    if icon_hash:
+        for candidate in (cache / f"{icon_hash}.jpg", LIBRARYCACHE / f"{appid}_icon.jpg"):
+            if candidate.is_file():
+                return str(candidate)
+
+    if not cache.is_dir():
         return None
 
     images = []
@@ -213,12 +503,9 @@ def get_steam_icon_path(appid):
         ):
             continue
 
-        try:
-            pix = GdkPixbuf.Pixbuf.new_from_file(str(img))
-            area = pix.get_width() * pix.get_height()
-            images.append((area, img))
-        except Exception:
-            pass
+        size = probe_image_size(img)
+        if size:
+            images.append((size[0] * size[1], img))
 
     if not images:
         return None
@@ -0,0 +1,416 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+from gi.repository import GLib
+
+from faugus.path_manager import STEAMGRIDDB_CACHE, AUTOCOMPLETE_CACHE
+from faugus.json_io import load_json_file, save_json_file
+from faugus.search_index import normalize
+from faugus.utils import verified_content, fetch_steamgriddb_autocomplete, run_in_background
+
+API_URL = "https://www.steamgriddb.com/api/v2"
+MAX_PARALLEL = 4
+MAX_RATE_LIMIT_RETRIES = 5
+DEFAULT_RETRY_AFTER = 5
+API_MAX_AGE = 24 * 60 * 60
+AUTOCOMPLETE_TTL = 7 * 24 * 60 * 60
+AUTOCOMPLETE_DELAY = 250
+AUTOCOMPLETE_FETCH_LIMIT = 25
+AUTOCOMPLETE_MIN_LENGTH = 3
+AUTOCOMPLETE_MEMORY_ENTRIES = 256
+AUTOCOMPLETE_DISK_ENTRIES = 2000
+ENDPOINTS = {
+    "cover": ("grids", {"dimensions": "600x900"}),
+    "banner": ("heroes", {}),
+    "icon": ("icons", {}),
+}
+
+
+def retry_after_seconds(value, default=DEFAULT_RETRY_AFTER):
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class HttpCache:
+    def __init__(self, root=STEAMGRIDDB_CACHE):
+        self.root = root
+
+    def _paths(self, url):
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.root, digest[:2], digest)
+        return f"{base}.json", f"{base}.body"
+
+    def lookup(self, url):
+        meta_path, body_path = self._paths(url)
+        meta = load_json_file(meta_path, {})
+        if not isinstance(meta, dict) or not os.path.isfile(body_path):
+            return None
+        return meta
+
+    def read(self, url):
+        with open(self._paths(url)[1], "rb") as f:
+            return f.read()
+
+    def store(self, url, headers, content):
+        meta_path, body_path = self._paths(url)
+        directory = os.path.dirname(body_path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, body_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        save_json_file({
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched": time.time(),
+        }, meta_path)
+
+    def touch(self, url, meta):
+        save_json_file({**meta, "fetched": time.time()}, self._paths(url)[0])
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+_bulk_session = None
+
+
+def get_bulk_session():
+    global _bulk_session
+    if _bulk_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=MAX_PARALLEL * 2)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _bulk_session = session
+    return _bulk_session
+
+
+class SteamGridDBClient:
+    def __init__(self, api_key, session=None, cache=None, max_parallel=MAX_PARALLEL, api_url=API_URL, timeout=15):
+        self.api_key = api_key
+        self.session = session or get_bulk_session()
+        self.cache = cache or HttpCache()
+        self.api_url = api_url.rstrip("/")
+        self.timeout = timeout
+        self.cancelled = threading.Event()
+        self._slots = threading.BoundedSemaphore(max_parallel)
+        self._pause_lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def _pause(self, seconds):
+        with self._pause_lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def _wait_for_rate_limit(self):
+        while not self.cancelled.is_set():
+            with self._pause_lock:
+                delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            self.cancelled.wait(delay)
+
+    def get(self, url, params=None, auth=True, max_age=None):
+        import requests
+
+        url = requests.Request("GET", url, params=params).prepare().url
+        meta = self.cache.lookup(url)
+        if meta is not None and max_age is not None and time.time() - meta.get("fetched", 0) < max_age:
+            return self.cache.read(url)
+
+        headers = {}
+        if auth:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        for _ in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self._wait_for_rate_limit()
+            if self.cancelled.is_set():
+                raise requests.RequestException("Cancelled")
+
+            with self._slots:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+            if response.status_code == 429:
+                self._pause(retry_after_seconds(response.headers.get("Retry-After")))
+                continue
+            if response.status_code == 304 and meta is not None:
+                self.cache.touch(url, meta)
+                return self.cache.read(url)
+
+            response.raise_for_status()
+            content = verified_content(response)
+            try:
+                self.cache.store(url, response.headers, content)
+            except OSError as e:
+                print(f"Faugus Launcher: failed to cache {url} ({e})")
+            return content
+
+        raise requests.HTTPError(f"Rate limited by {url}", response=response)
+
+    def api(self, path, params=None):
+        content = self.get(f"{self.api_url}/{path}", params, max_age=API_MAX_AGE)
+        return json.loads(content).get("data") or []
+
+    def resolve(self, title, game_id=None, steam_appid=None):
+        from urllib.parse import quote
+
+        if steam_appid:
+            return "steam", steam_appid
+        if game_id:
+            return "game", game_id
+        results = self.api(f"search/autocomplete/{quote(title)}")
+        return ("game", results[0]["id"]) if results else None
+
+    def artwork_url(self, id_type, lookup_id, category):
+        endpoint, params = ENDPOINTS[category]
+        for item in self.api(f"{endpoint}/{id_type}/{lookup_id}", params):
+            if item.get("url"):
+                return item["url"]
+        return None
+
+    def download(self, url):
+        return self.get(url, auth=False, max_age=float("inf"))
+
+
+class ArtworkJob:
+    def __init__(self, client, targets, store, on_progress=None, max_parallel=MAX_PARALLEL):
+        self.client = client
+        self.targets = list(targets)
+        self.store = store
+        self.on_progress = on_progress
+        self.max_parallel = max_parallel
+        self.total = len(self.targets)
+        self.done = 0
+        self.fetched = 0
+        self.missing = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self.client.cancelled.is_set()
+
+    def cancel(self):
+        self.client.cancelled.set()
+
+    def _process(self, target):
+        import requests
+
+        fetched = missing = failed = 0
+        try:
+            if self.cancelled:
+                return
+            resolved = self.client.resolve(target["title"], target.get("steamgriddb_id"), target.get("steam_appid"))
+            for category in target["categories"]:
+                if self.cancelled:
+                    return
+                url = self.client.artwork_url(*resolved, category) if resolved else None
+                if url is None:
+                    missing += 1
+                    continue
+                self.store(target, category, self.client.download(url))
+                fetched += 1
+        except (requests.RequestException, ValueError, KeyError) as e:
+            if not self.cancelled:
+                print(f"SteamGridDB: failed to fetch artwork for '{target['title']}' ({e})")
+            failed += 1
+        finally:
+            with self._lock:
+                self.done += 1
+                self.fetched += fetched
+                self.missing += missing
+                self.failed += failed
+                done = self.done
+            if self.on_progress is not None:
+                self.on_progress(self, done, self.total)
+
+    def run(self):
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as pool:
+            list(pool.map(self._process, self.targets))
+        return self
+
+
+def _suggestion_matches(item, words):
+    name = normalize(item["name"]).replace(" ", "")
+    return all(word in name for word in words)
+
+
+class AutocompleteCache:
+    def __init__(self, path=AUTOCOMPLETE_CACHE, ttl=AUTOCOMPLETE_TTL, fetch_limit=AUTOCOMPLETE_FETCH_LIMIT,
+                 memory_entries=AUTOCOMPLETE_MEMORY_ENTRIES, disk_entries=AUTOCOMPLETE_DISK_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.fetch_limit = fetch_limit
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._disk = None
+
+    def _load_disk(self):
+        if self._disk is None:
+            data = load_json_file(self.path, {})
+            self._disk = data if isinstance(data, dict) else {}
+        return self._disk
+
+    def _fresh(self, entry):
+        return (
+            isinstance(entry, dict)
+            and isinstance(entry.get("results"), list)
+            and time.time() - entry.get("time", 0) < self.ttl
+        )
+
+    def _get(self, key):
+        entry = self._memory.get(key)
+        if entry is None:
+            entry = self._load_disk().get(key)
+        if not self._fresh(entry):
+            self._memory.pop(key, None)
+            return None
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+        return entry["results"]
+
+    def _put(self, key, results):
+        entry = {"time": time.time(), "results": results}
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+        disk = self._load_disk()
+        disk[key] = entry
+        if len(disk) > self.disk_entries:
+            for stale in sorted(disk, key=lambda k: disk[k].get("time", 0))[:len(disk) - self.disk_entries]:
+                del disk[stale]
+        try:
+            save_json_file(disk, self.path)
+        except OSError as e:
+            print(f"Faugus Launcher: failed to write {self.path} ({e})")
+
+    def cached(self, term):
+        key = normalize(term)
+        if len(key) < AUTOCOMPLETE_MIN_LENGTH:
+            return []
+        with self._lock:
+            results = self._get(key)
+            if results is not None:
+                return results
+            words = key.split()
+            for end in range(len(key) - 1, AUTOCOMPLETE_MIN_LENGTH - 1, -1):
+                superset = self._get(key[:end])
+                if superset is None:
+                    continue
+                if len(superset) >= self.fetch_limit:
+                    return None
+                matches = [item for item in superset if _suggestion_matches(item, words)]
+                return matches or None
+        return None
+
+    def lookup(self, api_key, term, limit=10):
+        results = self.cached(term)
+        if results is None:
+            results = fetch_steamgriddb_autocomplete(api_key, term, self.fetch_limit, quiet=False)
+            with self._lock:
+                self._put(normalize(term), results)
+        return results[:limit]
+
+
+_autocomplete_cache = None
+
+
+def get_autocomplete_cache():
+    global _autocomplete_cache
+    if _autocomplete_cache is None:
+        _autocomplete_cache = AutocompleteCache()
+    return _autocomplete_cache
+
+
+class TitleAutocomplete:
+    def __init__(self, cache=None, delay=AUTOCOMPLETE_DELAY):
+        self.cache = cache or get_autocomplete_cache()
+        self.delay = delay
+        self._generation = 0
+        self._source = None
+
+    def cancel(self):
+        self._generation += 1
+        if self._source:
+            GLib.source_remove(self._source)
+            self._source = None
+
+    def request(self, api_key, term, callback, limit=10):
+        self.cancel()
+        generation = self._generation
+
+        results = self.cache.cached(term)
+        if results is not None:
+            callback(term, results[:limit])
+            return
+
+        def deliver(results):
+            if generation == self._generation:
+                callback(term, results)
+            return False
+
+        def worker():
+            import requests
+
+            if generation != self._generation:
+                return
+            try:
+                results = self.cache.lookup(api_key, term, limit)
+            except (requests.RequestException, ValueError) as e:
+                print(f"SteamGridDB: autocomplete failed for '{term}' ({e})")
+                results = []
+            GLib.idle_add(deliver, results)
+
+        def fire():
+            self._source = None
+            run_in_background(worker)
+            return False
+
+        self._source = GLib.timeout_add(self.delay, fire)
@@ -0,0 +1,172 @@
+import os
+import threading
+from collections import OrderedDict
+
+import gi
+gi.require_version('Gdk', '4.0')
+from gi.repository import Gdk
+
+from faugus.path_manager import CONFIG_FILE_DIR
+from faugus.json_io import load_json_file
+from faugus.color_cache import get_color_cache
+from faugus.thumbnail_cache import get_thumbnail_cache
+from faugus.utils import get_display_scale, safe_load_pixbuf
+
+DEFAULT_BUDGET_MB = 256
+
+
+def texture_bytes(texture):
+    return texture.get_width() * texture.get_height() * 4
+
+
+class TextureCache:
+    def __init__(self, budget=DEFAULT_BUDGET_MB * 1024 * 1024):
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._by_path = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _drop(self, key):
+        texture, size = self._entries.pop(key)
+        self._bytes -= size
+        keys = self._by_path.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_path[key[0]]
+
+    def _evict(self):
+        while self._bytes > self.budget and self._entries:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, texture):
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            for stale in [k for k in self._by_path.get(key[0], ()) if k[1] != key[1]]:
+                self._drop(stale)
+            self._entries[key] = (texture, texture_bytes(texture))
+            self._bytes += self._entries[key][1]
+            self._by_path.setdefault(key[0], set()).add(key)
+            self._evict()
+        return texture
+
+    def get_or_load(self, key, loader):
+        texture = self.get(key)
+        if texture is None:
+            texture = self.put(key, loader())
+        return texture
+
+    def discard_path(self, path):
+        with self._lock:
+            for key in list(self._by_path.get(path, ())):
+                self._drop(key)
+
+    def set_budget(self, budget):
+        with self._lock:
+            self.budget = budget
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_path.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "resident_bytes": self._bytes,
+                "budget": self.budget,
+            }
+
+
+def configured_budget():
+    config = load_json_file(CONFIG_FILE_DIR, {})
+    try:
+        megabytes = int(str(config.get("texture-cache-mb", DEFAULT_BUDGET_MB)).strip('"'))
+    except (AttributeError, ValueError):
+        megabytes = DEFAULT_BUDGET_MB
+    return max(megabytes, 16) * 1024 * 1024
+
+
+_texture_cache = None
+
+
+def get_texture_cache():
+    global _texture_cache
+    if _texture_cache is None:
+        _texture_cache = TextureCache(configured_budget())
+    return _texture_cache
+
+
+def texture_key(path, width=None, height=None, scale=None):
+    if width and height and scale is None:
+        scale = get_display_scale()
+    try:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    return (path, stamp, width, height, scale if width and height else None)
+
+
+def peek_texture(path, width=None, height=None, scale=None):
+    return get_texture_cache().peek(texture_key(path, width, height, scale))
+
+
+def peek_nearest(path, sizes, scale=None):
+    for width, height in sizes:
+        texture = peek_texture(path, width, height, scale)
+        if texture is not None:
+            return texture
+    return None
+
+
+def load_texture(path, width=None, height=None, scale=None):
+    if width and height and scale is None:
+        scale = get_display_scale()
+
+    def loader():
+        if width and height:
+            return get_thumbnail_cache().load(path, width, height, scale)
+        return Gdk.Texture.new_for_pixbuf(safe_load_pixbuf(path, None, None, False))
+
+    key = texture_key(path, width, height, scale)
+    return get_texture_cache().get_or_load(key, loader)
+
+
+def forget_artwork(path):
+    get_texture_cache().discard_path(path)
+    get_thumbnail_cache().invalidate(path)
+    get_color_cache().forget(path)
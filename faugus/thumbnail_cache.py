@@ -0,0 +1,115 @@
+import hashlib
+import os
+import shutil
+import struct
+import tempfile
+
+import gi
+gi.require_version('Gdk', '4.0')
+from gi.repository import Gdk, GLib
+
+from faugus.path_manager import THUMBNAILS_DIR
+from faugus.utils import safe_load_pixbuf, scaled_size
+
+MAGIC = b"FGTH"
+VERSION = 1
+HEADER = struct.Struct("<4sBBxxIII")
+MEMORY_FORMATS = {
+    3: Gdk.MemoryFormat.R8G8B8,
+    4: Gdk.MemoryFormat.R8G8B8A8,
+}
+
+
+class ThumbnailCache:
+    def __init__(self, root=THUMBNAILS_DIR):
+        self.root = root
+
+    def _source_dir(self, path):
+        digest = hashlib.sha1(os.path.abspath(path).encode("utf-8", "surrogateescape")).hexdigest()
+        return os.path.join(self.root, digest[:2], digest)
+
+    def _read(self, entry):
+        try:
+            with open(entry, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < HEADER.size:
+            return None
+        magic, version, channels, width, height, stride = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION or channels not in MEMORY_FORMATS:
+            return None
+        if not width or not height or len(data) - HEADER.size < stride * (height - 1) + width * channels:
+            return None
+        pixels = GLib.Bytes.new(data[HEADER.size:])
+        return Gdk.MemoryTexture.new(width, height, MEMORY_FORMATS[channels], pixels, stride)
+
+    def _write(self, entry, pixbuf):
+        channels = pixbuf.get_n_channels()
+        if pixbuf.get_bits_per_sample() != 8 or channels not in MEMORY_FORMATS:
+            return
+        directory = os.path.dirname(entry)
+        stamp = os.path.basename(entry).split("-", 2)[:2]
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if not name.startswith(".tmp-") and name.split("-", 2)[:2] != stamp:
+                try:
+                    os.remove(os.path.join(directory, name))
+                except OSError:
+                    pass
+
+        header = HEADER.pack(
+            MAGIC, VERSION, channels, pixbuf.get_width(), pixbuf.get_height(), pixbuf.get_rowstride()
+        )
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(pixbuf.read_pixel_bytes().get_data())
+            os.replace(tmp_path, entry)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def entry_path(self, path, width, height, scale):
+        st = os.stat(path)
+        name = f"{st.st_mtime_ns}-{st.st_size}-{width}x{height}@{scale:g}.raw"
+        return os.path.join(self._source_dir(path), name)
+
+    def load(self, path, width, height, scale):
+        try:
+            entry = self.entry_path(path, width, height, scale)
+        except OSError:
+            entry = None
+
+        if entry is not None:
+            texture = self._read(entry)
+            if texture is not None:
+                return texture
+
+        pixbuf = safe_load_pixbuf(path, *scaled_size(width, height, scale), False)
+
+        if entry is not None:
+            try:
+                self._write(entry, pixbuf)
+            except OSError as e:
+                print(f"Faugus Launcher: failed to cache thumbnail for {path} ({e})")
+
+        return Gdk.Texture.new_for_pixbuf(pixbuf)
+
+    def invalidate(self, path):
+        shutil.rmtree(self._source_dir(path), ignore_errors=True)
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+_thumbnail_cache = None
+
+
+def get_thumbnail_cache():
+    global _thumbnail_cache
+    if _thumbnail_cache is None:
+        _thumbnail_cache = ThumbnailCache()
+    return _thumbnail_cache
@@ -8,6 +8,7 @@ import gi
 from gi.repository import Gio, GLib
 
 from faugus.path_manager import APP_ID, CONFIG_FILE_DIR, RUNNING_GAMES, TRAY_BUS_NAME, TRAY_INTERFACE, TRAY_OBJECT_PATH, subprocess_env
+from faugus.session_journal import get_session_journal
 from faugus.tray_sni import TrayIcon
 
 TRAY_CONTROL_XML = f"""
@@ -106,7 +107,9 @@ def run_tray_entrypoint(launch_ui, console_mode=False):
     def on_launch(gameid):
         if gameid in load_running_ids():
             return
+        get_session_journal().record_launch(gameid)
         spawn(["faugus.runner", "--game", gameid])
+        tray.notify_menu_changed()
 
     tray = TrayIcon(mono_icon=mono_icon, on_present=on_present, on_quit=on_quit, on_launch=on_launch)
     tray.start()
@@ -1,7 +1,6 @@
-import json
-
 from gi.repository import Gio, GLib
-from faugus.path_manager import APP_ID, FAUGUS_MONO_ICON, FAUGUS_PNG, GAMES_JSON, LATEST_GAMES
+from faugus.path_manager import APP_ID, FAUGUS_MONO_ICON, FAUGUS_PNG
+from faugus.game_repository import get_game_repository
 from faugus.language_config import setup_gettext
 
 _ = setup_gettext('faugus-launcher')
@@ -99,14 +98,6 @@ MENU_XML = """
 """
 
 
-def load_json_file(filepath, default=None):
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return default if default is not None else []
-
-
 def load_icon_pixmap(svg_path, size=64):
     import gi
     gi.require_version('GdkPixbuf', '2.0')
@@ -245,15 +236,10 @@ class TrayIcon:
         invocation.return_value(None)
 
     def rebuild_menu(self):
-        games_by_id = {}
-        for entry in load_json_file(GAMES_JSON, []):
-            gameid = entry.get("gameid")
-            if gameid:
-                games_by_id[gameid] = entry.get("title", gameid)
+        games_by_id = get_game_repository().titles()
 
         recent = []
-        for gameid in load_json_file(LATEST_GAMES, default=[]):
-            gameid = gameid.strip()
+        for gameid in get_game_repository().recent_games():
             if len(recent) >= len(self.RECENT_SLOT_IDS):
                 break
             title = games_by_id.get(gameid)
@@ -1,15 +1,17 @@
 import os
-import json
+import math
 import re
 import shutil
 import subprocess
-import tempfile
 from concurrent.futures import ThreadPoolExecutor
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from faugus.path_manager import PathManager, GAMES_JSON, PRESETS_FILE, COMPATIBILITY_DIR, COMPATIBILITY_DIRS, find_compatibilitytool, PROTON_CACHYOS, MANGOHUD_DIR, GAMEMODERUN, ICONS_DIR, COVERS_DIR, FAUGUS_NOTIFICATION, FILECHOOSER_FOLDERS_FILE, IS_FLATPAK, CONFIG_FILE_DIR
-from gi.repository import Gtk, Gdk, Gio, GLib, GdkPixbuf, Pango, GObject, Adw
+gi.require_version('Graphene', '1.0')
+gi.require_version('Gsk', '4.0')
+from faugus.json_io import ensure_parent_dir, load_json_file, save_json_file
+from faugus.path_manager import PathManager, PRESETS_FILE, COMPATIBILITY_DIR, COMPATIBILITY_DIRS, find_compatibilitytool, PROTON_CACHYOS, MANGOHUD_DIR, GAMEMODERUN, ICONS_DIR, COVERS_DIR, FAUGUS_NOTIFICATION, FILECHOOSER_FOLDERS_FILE, IS_FLATPAK, CONFIG_FILE_DIR
+from gi.repository import Gtk, Gdk, Gio, GLib, GdkPixbuf, Pango, GObject, Adw, Graphene, Gsk
 
 os.environ.setdefault("VK_LOADER_LAYERS_DISABLE", "VK_LAYER_LSFGVK_frame_generation")
 
@@ -66,15 +68,95 @@ done
         pass
 
 
-HIDPI_SCALE = 2
+COVER_WIDTH = 230
+COVER_HEIGHT = 345
+BANNER_WIDTH = 960
+BANNER_HEIGHT = 310
+ZOOM_MIN = 50
+ZOOM_MAX = 100
+ZOOM_STEP = 10
+COVER_LEVELS = tuple(zoom / 100 for zoom in range(ZOOM_MIN, ZOOM_MAX + 1, ZOOM_STEP))
+
+
+def cover_level(width):
+    for level in COVER_LEVELS:
+        if COVER_WIDTH * level >= width:
+            return level
+    return COVER_LEVELS[-1]
+
+
+def cover_level_size(level):
+    return round(COVER_WIDTH * level), round(COVER_HEIGHT * level)
+
+
+_display_scale = None
+
+
+def quantize_scale(scale):
+    return max(1, round(scale * 4) / 4)
+
+
+def scaled_size(width, height, scale):
+    return math.ceil(width * scale), math.ceil(height * scale)
+
+
+def surface_scale(surface):
+    if hasattr(surface, "get_scale"):
+        return surface.get_scale()
+    return surface.get_scale_factor()
+
+
+def monitors_scale():
+    display = Gdk.Display.get_default()
+    if display is None:
+        return 1
+    monitors = display.get_monitors()
+    scales = []
+    for i in range(monitors.get_n_items()):
+        monitor = monitors.get_item(i)
+        scales.append(monitor.get_scale() if hasattr(monitor, "get_scale") else monitor.get_scale_factor())
+    return max(scales, default=1)
+
+
+def get_display_scale():
+    global _display_scale
+    if _display_scale is None:
+        _display_scale = quantize_scale(monitors_scale())
+    return _display_scale
+
+
+def set_display_scale(scale):
+    global _display_scale
+    scale = quantize_scale(scale)
+    changed = scale != _display_scale
+    _display_scale = scale
+    return changed
+
+
+def widget_scale(widget):
+    native = widget.get_native() if widget is not None else None
+    surface = native.get_surface() if native is not None else None
+    if surface is None:
+        return get_display_scale()
+    return quantize_scale(surface_scale(surface))
+
+
+GREYSCALE_MATRIX = Graphene.Matrix().init_from_float([
+    0.30, 0.30, 0.30, 0.0,
+    0.59, 0.59, 0.59, 0.0,
+    0.11, 0.11, 0.11, 0.0,
+    0.0, 0.0, 0.0, 1.0,
+])
+GREYSCALE_OFFSET = Graphene.Vec4().init(0.0, 0.0, 0.0, 0.0)
 
 
 class HiDpiPaintable(GObject.GObject, Gdk.Paintable):
-    def __init__(self, texture, width, height):
+    def __init__(self, texture, width, height, greyscale=False):
         super().__init__()
         self._texture = texture
         self._width = width
         self._height = height
+        self._greyscale = greyscale
 
     def do_get_intrinsic_width(self):
         return self._width
@@ -83,16 +165,93 @@ class HiDpiPaintable(GObject.GObject, Gdk.Paintable):
         return self._height
 
     def do_snapshot(self, snapshot, width, height):
-        self._texture.snapshot(snapshot, width, height)
+        if self._greyscale:
+            snapshot.push_color_matrix(GREYSCALE_MATRIX, GREYSCALE_OFFSET)
+            self._texture.snapshot(snapshot, width, height)
+            snapshot.pop()
+        else:
+            self._texture.snapshot(snapshot, width, height)
+
+    def set_size(self, width, height):
+        if (self._width, self._height) != (width, height):
+            self._width = width
+            self._height = height
+            self.invalidate_size()
+
+    def set_greyscale(self, greyscale):
+        if self._greyscale != greyscale:
+            self._greyscale = greyscale
+            self.invalidate_contents()
+
+
+BANNER_RATIO = BANNER_WIDTH / BANNER_HEIGHT
+
+
+def _color_stop(offset, rgba):
+    stop = Gsk.ColorStop()
+    stop.offset = offset
+    stop.color = rgba
+    return stop
+
+
+class BannerView(Gtk.Widget):
+    __gtype_name__ = "FaugusBannerView"
+
+    def __init__(self):
+        super().__init__()
+        self.set_hexpand(True)
+        self.set_vexpand(True)
+        self.set_can_target(False)
+        self._background = None
+        self._texture = None
+        self._fade = None
+
+    def set_background(self, rgba):
+        self._background = rgba
+        self.queue_draw()
+
+    def set_banner(self, texture, fade=None):
+        self._texture = texture
+        self._fade = fade
+        self.queue_draw()
+
+    def do_snapshot(self, snapshot):
+        width = self.get_width()
+        height = self.get_height()
+
+        if self._background is not None:
+            snapshot.append_color(self._background, Graphene.Rect().init(0, 0, width, height))
+
+        if self._texture is None:
+            return
+
+        snapshot.push_clip(Graphene.Rect().init(0, 0, width, height))
+        bounds = Graphene.Rect().init(0, 0, width, width / BANNER_RATIO)
+        snapshot.append_texture(self._texture, bounds)
+
+        if self._fade is not None:
+            r, g, b = self._fade
+            snapshot.append_linear_gradient(
+                bounds,
+                Graphene.Point().init(0, 0),
+                Graphene.Point().init(0, bounds.get_height()),
+                [
+                    _color_stop(0.0, Gdk.RGBA(red=r / 255, green=g / 255, blue=b / 255, alpha=0.0)),
+                    _color_stop(1.0, Gdk.RGBA(red=r / 255, green=g / 255, blue=b / 255, alpha=1.0)),
+                ],
+            )
+        snapshot.pop()
 
 
 class HiDpiMixin:
     def new_texture_from_image(self: Gtk.Widget, path, width=None, height=None, keep_aspect_ratio=False):
-        w = width * HIDPI_SCALE if width else None
-        h = height * HIDPI_SCALE if height else None
-
-        pixbuf = safe_load_pixbuf(path, w, h, keep_aspect_ratio)
-        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+        scale = widget_scale(self)
+        if keep_aspect_ratio:
+            w, h = scaled_size(width, height, scale) if width and height else (None, None)
+            texture = Gdk.Texture.new_for_pixbuf(safe_load_pixbuf(path, w, h, keep_aspect_ratio))
+        else:
+            from faugus.texture_cache import load_texture
+            texture = load_texture(path, width, height, scale)
 
         if width and height:
             return HiDpiPaintable(texture, width, height)
@@ -256,8 +415,7 @@ def wrap_with_spinner(widget, dim_shape="none"):
 def create_accent_placeholder_paintable(width, height, alpha=0.4):
     r, g, b = get_effective_accent_rgb()
 
-    w = width * HIDPI_SCALE
-    h = height * HIDPI_SCALE
+    w, h = scaled_size(width, height, get_display_scale())
     pixbuf = GdkPixbuf.Pixbuf.new(GdkPixbuf.Colorspace.RGB, True, 8, w, h)
     a = int(alpha * 255)
     pixbuf.fill((r << 24) | (g << 16) | (b << 8) | a)
@@ -537,49 +695,6 @@ def destroy_and_release(widget):
     widget.__dict__.clear()
 
 
-def ensure_parent_dir(path):
-    parent = os.path.dirname(path)
-    if parent:
-        os.makedirs(parent, exist_ok=True)
-
-
-def atomic_write(filepath, write_func):
-    ensure_parent_dir(filepath)
-    dir_name = os.path.dirname(filepath) or "."
-    fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix=".tmp-")
-    try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            write_func(f)
-        os.replace(tmp_path, filepath)
-    except BaseException:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
-        raise
-
-
-def load_json_file(filepath, default=None):
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return default if default is not None else []
-
-
-def load_json_file_or_none(filepath):
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return []
-    except (json.JSONDecodeError, OSError) as e:
-        print(f"Faugus Launcher: refusing to touch {filepath}, failed to read it ({e})")
-        return None
-
-
-def save_json_file(data, filepath, indent=4):
-    atomic_write(filepath, lambda f: json.dump(data, f, indent=indent, ensure_ascii=False))
-
-
 def format_title(title):
     title = title.strip().lower()
     title = re.sub(r"[^\w\s-]", "", title)
@@ -955,51 +1070,23 @@ def load_frame_css():
 
 
 def extract_ico(exe_path, output_path, best_frame=False):
-    tmp_dir = tempfile.mkdtemp()
+    from faugus.pe_icons import PEFormatError, get_icon_cache
+
     try:
         ensure_parent_dir(output_path)
-        temp_ico = os.path.join(tmp_dir, "icon.ico")
-
-        result = subprocess.run(
-            ['icoextract', exe_path, temp_ico],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            if "NoIconsAvailableError" in result.stderr or "PEFormatError" in result.stderr:
-                print("The file does not contain icons.")
-                return "no_icons"
-            print(f"Error extracting icon: {result.stderr}")
-            return "error"
-
-        from PIL import Image, ImageFile
-
-        ImageFile.LOAD_TRUNCATED_IMAGES = True
-
-        with Image.open(temp_ico) as icon:
-            sizes = sorted(set(icon.info.get("sizes", [icon.size])), reverse=True)
-
-            frame = None
-            for size in sizes:
-                try:
-                    icon.size = size
-                    frame = icon.convert("RGBA").resize((256, 256), Image.LANCZOS)
-                    break
-                except Exception:
-                    continue
-
-            if frame is None:
-                print("An error occurred: no usable icon frame found.")
-                return "error"
-
-            frame.save(output_path, "PNG")
-
+        png_path = get_icon_cache().extract(exe_path)
+        if png_path is None:
+            print("The file does not contain icons.")
+            return "no_icons"
+        shutil.copyfile(png_path, output_path)
         return "ok"
 
+    except PEFormatError:
+        print("The file does not contain icons.")
+        return "no_icons"
     except Exception as e:
         print(f"An error occurred: {e}")
         return "error"
-    finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
 
 
 def make_donate_buttons():
@@ -1036,9 +1123,12 @@ def expand_path(value):
 
 
 def update_games_json():
-    games = load_json_file(GAMES_JSON, None)
-    if games is None:
+    from faugus.game_repository import get_game_repository
+
+    repository = get_game_repository()
+    if not repository.is_readable():
         return
+    games = repository.games()
 
     changed = False
 
@@ -1078,7 +1168,7 @@ def update_games_json():
                     changed = True
 
     if changed:
-        save_json_file(games, GAMES_JSON)
+        repository.save(games)
 
 
 def resolve_protonpath(runner):
@@ -1152,7 +1242,8 @@ def game_to_save_dict(game, hidden=None):
          "gamemode": True if game.gamemode else "",
          "sdl_enabled": True if game.sdl_enabled else "",
          "addapp_enabled": "addapp_enabled" if game.addapp_enabled else "",
-         "disable_umu": True if game.disable_umu else ""}
+         "disable_umu": True if game.disable_umu else "",
+         "category": list(game.category_order) or False}
     if hidden is not None:
         d["hidden"] = hidden
     return d
@@ -1977,7 +2068,7 @@ def get_steamgriddb_session():
     return _steamgriddb_session
 
 
-def fetch_steamgriddb_autocomplete(api_key, term, limit=10):
+def fetch_steamgriddb_autocomplete(api_key, term, limit=10, quiet=True):
     import requests
     from urllib.parse import quote
 
@@ -1992,6 +2083,8 @@ def fetch_steamgriddb_autocomplete(api_key, term, limit=10):
         results = response.json().get("data") or []
         return [{"id": item["id"], "name": item["name"]} for item in results[:limit] if item.get("name")]
     except requests.RequestException:
+        if not quiet:
+            raise
         return []
 
 
@@ -2266,64 +2359,10 @@ def show_steamgriddb_picker(obj, category):
 
 
 def get_average_color(image_path):
-    pixbuf = GdkPixbuf.Pixbuf.new_from_file(image_path)
-    small = pixbuf.scale_simple(32, 32, GdkPixbuf.InterpType.BILINEAR)
-
-    width = small.get_width()
-    height = small.get_height()
-    rowstride = small.get_rowstride()
-    n_channels = small.get_n_channels()
-    pixels = small.get_pixels()
-
-    r_total = g_total = b_total = 0
-    count = width * height
-
-    for y in range(height):
-        row_offset = y * rowstride
-        for x in range(width):
-            offset = row_offset + x * n_channels
-            r_total += pixels[offset]
-            g_total += pixels[offset + 1]
-            b_total += pixels[offset + 2]
-
-    return r_total // count, g_total // count, b_total // count
+    from faugus.color_cache import get_color_cache
+    return get_color_cache().average(image_path)
 
 
 def get_dominant_color(image_path):
-    import colorsys
-
-    pixbuf = GdkPixbuf.Pixbuf.new_from_file(image_path)
-    small = pixbuf.scale_simple(64, 64, GdkPixbuf.InterpType.BILINEAR)
-
-    width = small.get_width()
-    height = small.get_height()
-    rowstride = small.get_rowstride()
-    n_channels = small.get_n_channels()
-    pixels = small.get_pixels()
-
-    num_bins = 24
-    hue_bins = {}
-
-    for y in range(height):
-        row_offset = y * rowstride
-        for x in range(width):
-            offset = row_offset + x * n_channels
-            r, g, b = pixels[offset], pixels[offset + 1], pixels[offset + 2]
-
-            h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
-
-            if v < 0.15 or v > 0.95 or s < 0.25:
-                continue
-
-            bin_idx = int(h * num_bins) % num_bins
-            bucket = hue_bins.setdefault(bin_idx, [0.0, 0.0, 0.0, 0.0])
-            bucket[0] += r * s
-            bucket[1] += g * s
-            bucket[2] += b * s
-            bucket[3] += s
-
-    if not hue_bins:
-        return get_average_color(image_path)
-
-    r_total, g_total, b_total, weight = max(hue_bins.values(), key=lambda bucket: bucket[3])
-    return int(r_total / weight), int(g_total / weight), int(b_total / weight)
+    from faugus.color_cache import get_color_cache
+    return get_color_cache().dominant(image_path)
@@ -0,0 +1,209 @@
+import os
+import re
+import threading
+
+TOKEN = re.compile(r'\s*(?:"((?:[^"\\]|\\.)*)"|([{}])|//[^\n]*|\[[^\]\n]*\]|([^\s{}"]+))', re.S)
+CHUNK_SIZE = 1 << 16
+WILDCARD = "*"
+
+
+def _unescape(value):
+    if "\\" not in value:
+        return value
+    return value.replace('\\"', '"').replace("\\\\", "\\")
+
+
+class VdfTokens:
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.brace_pos = -1
+
+    def _fill(self):
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        if self.brace_pos >= self.pos:
+            self.brace_pos -= self.pos
+        else:
+            self.brace_pos = -1
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def next(self):
+        while True:
+            m = TOKEN.match(self.buf, self.pos)
+            if (m is None or m.end() == len(self.buf)) and self._fill():
+                continue
+            if m is None:
+                return None
+            self.pos = m.end()
+            quoted, brace, bare = m.groups()
+            if quoted is not None:
+                return "s", _unescape(quoted)
+            if bare is not None:
+                return "s", bare
+            if brace:
+                self.brace_pos = self.pos - 1
+                return brace, None
+
+    def _indented(self, indent):
+        start = self.brace_pos - len(indent)
+        return start > 0 and self.buf[start - 1] == "\n" and self.buf.startswith(indent, start)
+
+    def skip_block(self, depth=0):
+        indent = "\t" * depth
+        if not depth or self.brace_pos < 0 or not self._indented(indent):
+            open_blocks = 1
+            while open_blocks:
+                token = self.next()
+                if token is None:
+                    return
+                if token[0] == "{":
+                    open_blocks += 1
+                elif token[0] == "}":
+                    open_blocks -= 1
+            return
+
+        closer = f"\n{indent}}}"
+        while True:
+            found = self.buf.find(closer, self.pos)
+            if found >= 0:
+                self.pos = found + len(closer)
+                self.brace_pos = -1
+                return
+            self.pos = max(self.pos, len(self.buf) - len(closer) + 1)
+            if not self._fill():
+                return
+
+    def read_block(self):
+        block = {}
+        while True:
+            key = self.next()
+            if key is None or key[0] != "s":
+                return block
+            value = self.next()
+            if value is None:
+                return block
+            if value[0] == "{":
+                block[key[1]] = self.read_block()
+            elif value[0] == "s":
+                block[key[1]] = value[1]
+            else:
+                return block
+
+
+def _matches(pattern, path):
+    return len(pattern) >= len(path) and all(p == WILDCARD or p == k for p, k in zip(pattern, path))
+
+
+def _store(result, keys, value):
+    node = result
+    for key in keys[:-1]:
+        node = node.setdefault(key, {})
+    node[keys[-1]] = value
+
+
+def select_vdf(f, patterns):
+    patterns = [tuple(key.lower() for key in pattern) for pattern in patterns]
+    fixed = {p: p[:p.index(WILDCARD)] if WILDCARD in p else p for p in patterns}
+    remaining = set(patterns)
+    tokens = VdfTokens(f)
+    result = {}
+    keys = []
+    lowered = []
+
+    while remaining:
+        token = tokens.next()
+        if token is None:
+            break
+        if token[0] == "}":
+            if not keys:
+                break
+            closed = tuple(lowered)
+            remaining = {p for p in remaining if fixed[p][:len(closed)] != closed}
+            keys.pop()
+            lowered.pop()
+            continue
+        if token[0] != "s":
+            break
+
+        key = token[1]
+        path = (*lowered, key.lower())
+        value = tokens.next()
+        if value is None or value[0] == "}":
+            break
+
+        captured = [p for p in remaining if len(p) == len(path) and _matches(p, path)]
+        if captured:
+            _store(result, keys + [key], value[1] if value[0] == "s" else tokens.read_block())
+            remaining.difference_update(p for p in captured if WILDCARD not in p)
+        elif value[0] == "{":
+            if any(_matches(p, path) for p in remaining):
+                keys.append(key)
+                lowered.append(path[-1])
+            else:
+                tokens.skip_block(len(path) - 1)
+
+    return result
+
+
+def read_vdf(path, patterns):
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return select_vdf(f, patterns)
+
+
+class VdfCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def read(self, path, patterns):
+        path = os.fspath(path)
+        patterns = tuple(tuple(pattern) for pattern in patterns)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return {}
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        key = (path, patterns)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+
+        try:
+            result = read_vdf(path, patterns)
+        except OSError:
+            return {}
+        with self._lock:
+            self._entries[key] = (stamp, result)
+        return result
+
+    def forget(self, path):
+        path = os.fspath(path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path]:
+                del self._entries[key]
+
+
+_vdf_cache = None
+
+
+def get_vdf_cache():
+    global _vdf_cache
+    if _vdf_cache is None:
+        _vdf_cache = VdfCache()
+    return _vdf_cache
+
+
+def read_vdf_cached(path, patterns):
+    return get_vdf_cache().read(path, patterns)
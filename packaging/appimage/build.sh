@@ -34,7 +34,7 @@ for cmd in meson ninja python3 curl tar msgfmt; do
 done
 
 if ! python3 -m pip --version >/dev/null 2>&1; then
-    echo "pip for python3 is required to bundle dependencies (requests, vdf, icoextract, pefile)." >&2
+    echo "pip for python3 is required to bundle dependencies (requests, vdf)." >&2
     echo "Install it first, e.g. on Arch: sudo pacman -S python-pip" >&2
     exit 1
 fi
@@ -73,7 +73,7 @@ PY_TAG=$(python3 -c 'import sys; print(f"python{sys.version_info.major}.{sys.ver
 VENDOR_DIR="$APPDIR/usr/lib/$PY_TAG/site-packages"
 mkdir -p "$VENDOR_DIR"
 python3 -m pip install --target="$VENDOR_DIR" --no-compile \
-    requests vdf icoextract pefile
+    requests vdf
 
 DESKTOP_SRC="$APPDIR/usr/share/applications/$APP_ID.desktop"
 ICON_SVG_SRC="$APPDIR/usr/share/icons/hicolor/scalable/apps/$APP_ID.svg"